@@ -1,11 +1,14 @@
 import threading
 from abc import ABC, abstractmethod
-from typing import BinaryIO
+from typing import BinaryIO, Callable
 
 
 class BaseCipherMode(ABC):
 
-    def __init__(self, primitive, primitive_class, key, block_size, padding, iv, executor):
+    def __init__(
+        self, primitive, primitive_class, key, block_size, padding, iv, executor,
+        mode_args=(),
+    ):
         self.primitive = primitive
         self.primitive_class = primitive_class
         self.key = key
@@ -13,7 +16,61 @@ class BaseCipherMode(ABC):
         self.padding = padding
         self.iv = iv
         self._executor = executor
+        self.mode_args = tuple(mode_args)
 
+    def _encrypt_blocks(self, data: bytes) -> bytes:
+        """E_K над подряд идущими блоками: крупными кусками через executor."""
+        if self._executor is None:
+            return self.primitive.encrypt_blocks(data)
+        return self._executor.encrypt_blocks(data)
+
+    def _decrypt_blocks(self, data: bytes) -> bytes:
+        if self._executor is None:
+            return self.primitive.decrypt_blocks(data)
+        return self._executor.decrypt_blocks(data)
+
+    def _encrypt_interleaved(
+        self,
+        block_counts: list[int],
+        make_input: Callable[[int, int], bytes],
+        take_output: Callable[[int, int, bytes], None],
+    ) -> None:
+        """
+        Цепочки нескольких сообщений одновременно: на шаге j блоки j всех
+        сообщений, где их больше j, шифруются одним пакетом.
+        make_input(i, j) - вход E_K для блока j сообщения i, take_output(i, j, E).
+        """
+        bs = self.block_size
+        # по убыванию длины: активные на шаге j - префикс order
+        order = sorted(range(len(block_counts)), key=lambda i: -block_counts[i])
+        active = len(order)
+        for j in range(block_counts[order[0]] if order else 0):
+            while block_counts[order[active - 1]] <= j:
+                active -= 1
+            batch = self._encrypt_blocks(
+                b"".join(make_input(i, j) for i in order[:active])
+            )
+            for n, i in enumerate(order[:active]):
+                take_output(i, j, batch[n * bs : (n + 1) * bs])
+
+    @staticmethod
+    def _split_lengths(data: bytes, lengths: list[int]) -> list[bytes]:
+        parts = []
+        offset = 0
+        for n in lengths:
+            parts.append(data[offset : offset + n])
+            offset += n
+        return parts
+
+    def encrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        """
+        Независимые сообщения под одним ключом, результат - по сообщению.
+        Режимы переопределяют это, собирая блоки всех сообщений в пакеты.
+        """
+        return [self.encrypt_bytes(m) for m in messages]
+
+    def decrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        return [self.decrypt_bytes(m) for m in messages]
 
     @abstractmethod
     def encrypt_bytes(self, data: bytes) -> bytes:
@@ -7,10 +7,6 @@ from Lab1_2.utility.utility import pad, unpad, split_blocks, xor_bytes
 class CBCMode(BaseCipherMode):
     """CBC: C_i = E_K(P_i XOR C_{i-1})"""
 
-    def _worker_decrypt(self, block: bytes):
-
-        return self.primitive.decrypt_block(block)
-
     def encrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
         padded = pad(data, bs, self.padding)
@@ -31,24 +27,46 @@ class CBCMode(BaseCipherMode):
         if len(data) < bs:
             raise ValueError("Ciphertext too short for CBC mode")
 
-        iv = data[:bs]
-        ciphertext_blocks = list(split_blocks(data[bs:], bs))
+        ciphertext = data[bs:]
 
-        if not ciphertext_blocks:
+        if not ciphertext:
             return b""
 
-        decrypted_blocks = list(
-            self._executor.map(self._worker_decrypt, ciphertext_blocks)
-        )
+        # P_i = D_K(C_i) XOR C_{i-1}: все D_K независимы, XOR - одним буфером
+        plaintext = xor_bytes(self._decrypt_blocks(ciphertext), data[:-bs])
 
-        prev_cipher = iv
-        plaintext = []
+        return unpad(plaintext, bs, self.padding)
 
-        for i, dec_block in enumerate(decrypted_blocks):
-            plaintext.append(xor_bytes(dec_block, prev_cipher))
-            prev_cipher = ciphertext_blocks[i]
+    def encrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        padded = [pad(m, bs, self.padding) for m in messages]
+        outputs = [[self.iv if self.iv else secrets.token_bytes(bs)] for _ in messages]
+
+        # C_ij = E_K(P_ij XOR C_i(j-1)): блоки j всех сообщений - один пакет
+        self._encrypt_interleaved(
+            [len(p) // bs for p in padded],
+            lambda i, j: xor_bytes(padded[i][j * bs : (j + 1) * bs], outputs[i][-1]),
+            lambda i, j, c: outputs[i].append(c),
+        )
+        return [b"".join(out) for out in outputs]
 
-        return unpad(b"".join(plaintext), bs, self.padding)
+    def decrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        for m in messages:
+            if len(m) < bs:
+                raise ValueError("Ciphertext too short for CBC mode")
+            if len(m) % bs != 0:
+                raise ValueError("Ciphertext length invalid for CBC mode")
+
+        # D_K всех блоков всех сообщений - один пакет
+        bodies = [m[bs:] for m in messages]
+        decrypted = self._split_lengths(
+            self._decrypt_blocks(b"".join(bodies)), [len(b) for b in bodies]
+        )
+        return [
+            unpad(xor_bytes(d, m[:-bs]), bs, self.padding) if d else b""
+            for d, m in zip(decrypted, messages)
+        ]
 
     def encrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
@@ -96,17 +114,15 @@ class CBCMode(BaseCipherMode):
             full, carry = data[:full_len], data[full_len:]
 
             if full:
-                blocks = list(split_blocks(full, bs))
-
-                decrypted = list(self._executor.map(self._worker_decrypt, blocks))
-
-                for i, dec_block in enumerate(decrypted):
-                    plaintext_block = xor_bytes(dec_block, prev_c)
-
-                    if hold is not None:
-                        fout.write(hold)
-                    hold = plaintext_block
-                    prev_c = blocks[i]
+                plaintext = xor_bytes(
+                    self._decrypt_blocks(full), prev_c + full[:-bs]
+                )
+
+                if hold is not None:
+                    fout.write(hold)
+                fout.write(plaintext[:-bs])
+                hold = plaintext[-bs:]
+                prev_c = full[-bs:]
 
         if carry:
             raise ValueError("Ciphertext length invalid for CBC mode")
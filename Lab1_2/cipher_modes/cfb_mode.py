@@ -7,10 +7,6 @@ from Lab1_2.utility.utility import split_blocks, xor_bytes
 class CFBMode(BaseCipherMode):
     """CFB: C_i = P_i XOR E_K(C_{i-1})"""
 
-    def _worker_encrypt(self, block: bytes):
-
-        return self.primitive.encrypt_block(block)
-
     def encrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
         iv = self.iv if self.iv else secrets.token_bytes(bs)
@@ -54,13 +50,9 @@ class CFBMode(BaseCipherMode):
         output = []
 
         if full_blocks:
-            cipher_blocks = list(split_blocks(full_blocks, bs))
-            inputs = [iv] + cipher_blocks[:-1]
-
-            keystreams = list(self._executor.map(self._worker_encrypt, inputs))
-            plaintexts = [xor_bytes(c, ks) for c, ks in zip(cipher_blocks, keystreams)]
-            output.extend(plaintexts)
-            prev_cipher = cipher_blocks[-1]
+            keystream = self._encrypt_blocks(iv + full_blocks[:-bs])
+            output.append(xor_bytes(full_blocks, keystream))
+            prev_cipher = full_blocks[-bs:]
         else:
             prev_cipher = iv
 
@@ -71,6 +63,35 @@ class CFBMode(BaseCipherMode):
 
         return b"".join(output)
 
+    def encrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        outputs = [[self.iv if self.iv else secrets.token_bytes(bs)] for _ in messages]
+
+        # C_ij = P_ij XOR E_K(C_i(j-1)); неполный последний блок обрезает xor_bytes
+        self._encrypt_interleaved(
+            [-(-len(m) // bs) for m in messages],
+            lambda i, j: outputs[i][-1],
+            lambda i, j, s: outputs[i].append(
+                xor_bytes(messages[i][j * bs : (j + 1) * bs], s)
+            ),
+        )
+        return [b"".join(out) for out in outputs]
+
+    def decrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        if any(len(m) < bs for m in messages):
+            raise ValueError("Ciphertext too short for CFB mode")
+
+        # вход E_K для блока j - C_(j-1) (или IV): все входы известны заранее
+        counts = [-(-(len(m) - bs) // bs) for m in messages]
+        keystreams = self._split_lengths(
+            self._encrypt_blocks(
+                b"".join(m[: count * bs] for m, count in zip(messages, counts))
+            ),
+            [count * bs for count in counts],
+        )
+        return [xor_bytes(m[bs:], ks) for m, ks in zip(messages, keystreams)]
+
     def encrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
         iv = self.iv if self.iv else secrets.token_bytes(bs)
@@ -115,15 +136,9 @@ class CFBMode(BaseCipherMode):
             full, carry = data[:full_len], data[full_len:]
 
             if full:
-                cipher_blocks = list(split_blocks(full, bs))
-                inputs = [prev_cipher] + cipher_blocks[:-1]
-
-                keystreams = list(self._executor.map(self._worker_encrypt, inputs))
-                plaintexts = [
-                    xor_bytes(c, ks) for c, ks in zip(cipher_blocks, keystreams)
-                ]
-                fout.write(b"".join(plaintexts))
-                prev_cipher = cipher_blocks[-1]
+                keystream = self._encrypt_blocks(prev_cipher + full[:-bs])
+                fout.write(xor_bytes(full, keystream))
+                prev_cipher = full[-bs:]
 
         if carry:
             s = self.primitive.encrypt_block(prev_cipher)
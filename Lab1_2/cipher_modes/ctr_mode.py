@@ -1,39 +1,32 @@
+import io
 import secrets
-from typing import BinaryIO, Tuple
+from typing import BinaryIO
 from .base_mode import BaseCipherMode
-from Lab1_2.utility.utility  import split_blocks, xor_bytes
+from Lab1_2.utility.lru_cache import LRUCache
+from Lab1_2.utility.utility  import xor_bytes
+
+# сколько расшифрованных блоков держит CTRReader по умолчанию (64 КБ для AES)
+DEFAULT_READER_CACHE_BLOCKS = 4096
 
 
 class CTRMode(BaseCipherMode):
     """CTR: T_j = Nonce || Counter_j, O_j = E_K(T_j), C_j = P_j XOR O_j"""
 
-    def _worker_ctr(self, args: Tuple[bytes, int]):
-        nonce, counter = args
-        counter_bytes = counter.to_bytes(self.block_size // 2, "big")
-        return self.primitive.encrypt_block(nonce + counter_bytes)
+    def _keystream(self, nonce: bytes, counter: int, count: int) -> bytes:
+        """O_j для j = counter .. counter + count - 1 одним пакетом."""
+        half = self.block_size // 2
+        counters = b"".join(
+            nonce + j.to_bytes(half, "big") for j in range(counter, counter + count)
+        )
+        return self._encrypt_blocks(counters)
 
     def encrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
         nonce = self.iv if self.iv else secrets.token_bytes(bs // 2)
 
-        full_blocks_count = len(data) // bs
-        full_data = data[: full_blocks_count * bs]
-        tail = data[full_blocks_count * bs :]
-
-        blocks = list(split_blocks(full_data, bs))
-
-        counters = [(nonce, i) for i in range(len(blocks))]
-        keystreams = list(self._executor.map(self._worker_ctr, counters))
-        output = [nonce] + [
-            xor_bytes(block, ks) for block, ks in zip(blocks, keystreams)
-        ]
-
-        if tail:
-            counter_bytes = len(blocks).to_bytes(bs // 2, "big")
-            O_j = self.primitive.encrypt_block(nonce + counter_bytes)
-            output.append(xor_bytes(tail, O_j[: len(tail)]))
-
-        return b"".join(output)
+        # неполный последний блок берет начало своего O_j (xor_bytes обрезает)
+        keystream = self._keystream(nonce, 0, -(-len(data) // bs))
+        return nonce + xor_bytes(data, keystream)
 
     def decrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
@@ -44,22 +37,49 @@ class CTRMode(BaseCipherMode):
         nonce = data[: bs // 2]
         ciphertext = data[bs // 2 :]
 
-        full_blocks_count = len(ciphertext) // bs
-        full_data = ciphertext[: full_blocks_count * bs]
-        tail = ciphertext[full_blocks_count * bs :]
+        keystream = self._keystream(nonce, 0, -(-len(ciphertext) // bs))
+        return xor_bytes(ciphertext, keystream)
 
-        blocks = list(split_blocks(full_data, bs))
-
-        counters = [(nonce, i) for i in range(len(blocks))]
-        keystreams = list(self._executor.map(self._worker_ctr, counters))
-        output = [xor_bytes(block, ks) for block, ks in zip(blocks, keystreams)]
-
-        if tail:
-            counter_bytes = len(blocks).to_bytes(bs // 2, "big")
-            O_j = self.primitive.encrypt_block(nonce + counter_bytes)
-            output.append(xor_bytes(tail, O_j[: len(tail)]))
+    def _keystream_many(self, nonces: list[bytes], lengths: list[int]) -> list[bytes]:
+        """Ключевые потоки нескольких сообщений одним пакетом."""
+        bs = self.block_size
+        half = bs // 2
+        counts = [-(-n // bs) for n in lengths]
+        counters = b"".join(
+            nonce + j.to_bytes(half, "big")
+            for nonce, count in zip(nonces, counts)
+            for j in range(count)
+        )
+        return self._split_lengths(
+            self._encrypt_blocks(counters), [count * bs for count in counts]
+        )
+
+    def encrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        nonces = [self.iv if self.iv else secrets.token_bytes(bs // 2) for _ in messages]
+        keystreams = self._keystream_many(nonces, [len(m) for m in messages])
+        return [
+            nonce + xor_bytes(m, ks) for nonce, m, ks in zip(nonces, messages, keystreams)
+        ]
 
-        return b"".join(output)
+    def decrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        half = self.block_size // 2
+        if any(len(m) < half for m in messages):
+            raise ValueError("Ciphertext too short for CTR mode")
+        bodies = [m[half:] for m in messages]
+        keystreams = self._keystream_many(
+            [m[:half] for m in messages], [len(b) for b in bodies]
+        )
+        return [xor_bytes(b, ks) for b, ks in zip(bodies, keystreams)]
+
+    def open_reader(
+        self,
+        fin: BinaryIO,
+        cache_blocks: int = DEFAULT_READER_CACHE_BLOCKS,
+        closefd: bool = False,
+    ) -> "CTRReader":
+        """Чтение расшифрованного потока с произвольного места (см. CTRReader)."""
+        return CTRReader(self, fin, cache_blocks, closefd)
 
     def encrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
@@ -79,20 +99,12 @@ class CTRMode(BaseCipherMode):
             full, carry = data[:full_len], data[full_len:]
 
             if full:
-                blocks = list(split_blocks(full, bs))
-
-                counters = [(nonce, counter + i) for i in range(len(blocks))]
-                keystreams = list(self._executor.map(self._worker_ctr, counters))
-
-                for block, ks in zip(blocks, keystreams):
-                    fout.write(xor_bytes(block, ks))
-
-                counter += len(blocks)
+                count = len(full) // bs
+                fout.write(xor_bytes(full, self._keystream(nonce, counter, count)))
+                counter += count
 
         if carry:
-            cnt_bytes = counter.to_bytes(bs // 2, "big")
-            ks = self.primitive.encrypt_block(nonce + cnt_bytes)
-            fout.write(xor_bytes(carry, ks[: len(carry)]))
+            fout.write(xor_bytes(carry, self._keystream(nonce, counter, 1)))
 
     def decrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
@@ -113,17 +125,129 @@ class CTRMode(BaseCipherMode):
             full, carry = data[:full_len], data[full_len:]
 
             if full:
-                blocks = list(split_blocks(full, bs))
-
-                counters = [(nonce, counter + i) for i in range(len(blocks))]
-                keystreams = list(self._executor.map(self._worker_ctr, counters))
-
-                for block, ks in zip(blocks, keystreams):
-                    fout.write(xor_bytes(block, ks))
-
-                counter += len(blocks)
+                count = len(full) // bs
+                fout.write(xor_bytes(full, self._keystream(nonce, counter, count)))
+                counter += count
 
         if carry:
-            cnt_bytes = counter.to_bytes(bs // 2, "big")
-            ks = self.primitive.encrypt_block(nonce + cnt_bytes)
-            fout.write(xor_bytes(carry, ks[: len(carry)]))
+            fout.write(xor_bytes(carry, self._keystream(nonce, counter, 1)))
+
+
+class CTRReader(io.RawIOBase):
+    """
+    Файлоподобный объект над шифртекстом CTR (nonce || C), открытым на чтение
+    с поддержкой seek. Счетчик блока, в котором лежит смещение offset, -
+    offset // block_size, поэтому read вычисляет O_j только для затронутых
+    блоков. Недавно расшифрованные блоки хранятся в LRU-кэше.
+    """
+
+    def __init__(
+        self, mode: CTRMode, fin: BinaryIO, cache_blocks: int, closefd: bool = False
+    ):
+        super().__init__()
+        bs = mode.block_size
+        fin.seek(0)
+        nonce = fin.read(bs // 2)
+        if len(nonce) != bs // 2:
+            raise ValueError("Ciphertext too short for CTR")
+
+        self._mode = mode
+        self._fin = fin
+        self._nonce = nonce
+        self._header = bs // 2
+        self._size = fin.seek(0, io.SEEK_END) - self._header
+        self._pos = 0
+        self._cache = LRUCache(maxsize=cache_blocks)
+        self._closefd = closefd
+
+    @property
+    def size(self) -> int:
+        """Длина открытого текста."""
+        return self._size
+
+    @property
+    def cache(self) -> LRUCache:
+        return self._cache
+
+    def close(self) -> None:
+        if not self.closed and self._closefd:
+            self._fin.close()
+        super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._check_closed()
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError("Negative seek position")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        self._check_closed()
+        out = memoryview(buffer).cast("B")
+        n = min(len(out), self._size - self._pos)
+        if n <= 0:
+            return 0
+        out[:n] = self._read_range(self._pos, n)
+        self._pos += n
+        return n
+
+    def readall(self) -> bytes:
+        self._check_closed()
+        n = max(self._size - self._pos, 0)
+        data = self._read_range(self._pos, n) if n else b""
+        self._pos += n
+        return data
+
+    def _check_closed(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+
+    def _read_range(self, offset: int, length: int) -> bytes:
+        bs = self._mode.block_size
+        first = offset // bs
+        last = (offset + length - 1) // bs
+
+        blocks = [self._cache.get(j) for j in range(first, last + 1)]
+        # отсутствующие в кэше блоки расшифровываем непрерывными отрезками
+        j = 0
+        while j < len(blocks):
+            if blocks[j] is not None:
+                j += 1
+                continue
+            start = j
+            while j < len(blocks) and blocks[j] is None:
+                j += 1
+            for k, block in enumerate(self._decrypt_run(first + start, j - start)):
+                blocks[start + k] = block
+
+        data = b"".join(blocks)
+        skip = offset - first * bs
+        return data[skip : skip + length]
+
+    def _decrypt_run(self, counter: int, count: int) -> list[bytes]:
+        bs = self._mode.block_size
+        self._fin.seek(self._header + counter * bs)
+        ciphertext = self._fin.read(count * bs)
+        plain = xor_bytes(ciphertext, self._mode._keystream(self._nonce, counter, count))
+
+        blocks = [plain[i : i + bs] for i in range(0, len(plain), bs)]
+        for k, block in enumerate(blocks):
+            self._cache.put(counter + k, block)
+        return blocks
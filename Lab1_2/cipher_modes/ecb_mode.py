@@ -2,33 +2,40 @@
 import secrets
 from typing import BinaryIO
 from .base_mode import BaseCipherMode
-from Lab1_2.utility.utility  import pad, unpad, split_blocks
+from Lab1_2.utility.utility  import pad, unpad
 
 
 class ECBMode(BaseCipherMode):
     """ECB: C_i = E_K(P_i)"""
 
-    def _worker_encrypt(self, block: bytes):
-        return self.primitive.encrypt_block(block)
-
-    def _worker_decrypt(self, block: bytes):
-
-        return self.primitive.decrypt_block(block)
-
     def encrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
         padded = pad(data, bs, self.padding)
-        blocks = list(split_blocks(padded, bs))
-        results = list(self._executor.map(self._worker_encrypt, blocks))
-        return b"".join(results)
+        return self._encrypt_blocks(padded)
 
     def decrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
         if len(data) % bs != 0:
             raise ValueError("Ciphertext length must be multiple of block size for ECB")
-        blocks = list(split_blocks(data, bs))
-        results = list(self._executor.map(self._worker_decrypt, blocks))
-        return unpad(b"".join(results), bs, self.padding)
+        return unpad(self._decrypt_blocks(data), bs, self.padding)
+
+    def encrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        # все блоки всех сообщений - один пакет
+        bs = self.block_size
+        padded = [pad(m, bs, self.padding) for m in messages]
+        return self._split_lengths(
+            self._encrypt_blocks(b"".join(padded)), [len(p) for p in padded]
+        )
+
+    def decrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        if any(len(m) % bs != 0 for m in messages):
+            raise ValueError("Ciphertext length must be multiple of block size for ECB")
+        plain = self._decrypt_blocks(b"".join(messages))
+        return [
+            unpad(p, bs, self.padding)
+            for p in self._split_lengths(plain, [len(m) for m in messages])
+        ]
 
     def encrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
@@ -44,14 +51,10 @@ class ECBMode(BaseCipherMode):
             full, carry = data[:full_len], data[full_len:]
 
             if full:
-                blocks = list(split_blocks(full, bs))
-                results = list(self._executor.map(self._worker_encrypt, blocks))
-                fout.write(b"".join(results))
+                fout.write(self._encrypt_blocks(full))
 
         padded = pad(carry, bs, self.padding)
-        blocks = list(split_blocks(padded, bs))
-        results = list(self._executor.map(self._worker_encrypt, blocks))
-        fout.write(b"".join(results))
+        fout.write(self._encrypt_blocks(padded))
 
     def decrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
@@ -68,13 +71,12 @@ class ECBMode(BaseCipherMode):
             full, carry = data[:full_len], data[full_len:]
 
             if full:
-                blocks = list(split_blocks(full, bs))
-                results = list(self._executor.map(self._worker_decrypt, blocks))
-
-                for block in results:
-                    if hold is not None:
-                        fout.write(hold)
-                    hold = block
+                decrypted = self._decrypt_blocks(full)
+                # последний блок придерживаем: в нем может быть паддинг
+                if hold is not None:
+                    fout.write(hold)
+                fout.write(decrypted[:-bs])
+                hold = decrypted[-bs:]
 
         if carry:
             raise ValueError("Ciphertext length must be multiple of block size for ECB")
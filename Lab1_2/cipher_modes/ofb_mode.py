@@ -1,32 +1,125 @@
+import io
+import queue
 import secrets
-from typing import BinaryIO
+import threading
+from typing import BinaryIO, Callable, Optional
 from .base_mode import BaseCipherMode
-from Lab1_2.utility.utility  import split_blocks, xor_bytes
+from Lab1_2.utility.utility  import xor_bytes
+
+# сколько кусков ключевого потока генератор держит готовыми впереди потребителя
+DEFAULT_PREFETCH_CHUNKS = 4
+# наибольший кусок ключевого потока в блоках (64 КБ для AES)
+MAX_PREFETCH_BLOCKS = 4096
+
+_EXHAUSTED = object()
+
+
+class KeystreamPrefetcher:
+    """
+    Фоновый поток, который заранее вычисляет ключевой поток OFB кусками
+    по chunk_blocks блоков в ограниченную очередь. Потребитель забирает байты
+    через take(n), так что работа шифра идет параллельно с чтением/записью.
+    total_blocks (если известно) ограничивает поток длиной данных.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[bytes, int], tuple[bytes, bytes]],
+        iv: bytes,
+        chunk_blocks: int,
+        depth: int = DEFAULT_PREFETCH_CHUNKS,
+        total_blocks: Optional[int] = None,
+    ):
+        if chunk_blocks < 1 or depth < 1:
+            raise ValueError("chunk_blocks and depth must be positive")
+        self._generate = generate
+        self._state = iv
+        self._chunk_blocks = chunk_blocks
+        self._remaining = total_blocks
+        self._queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._buffer = b""
+        self._offset = 0
+        self._exhausted = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                count = self._chunk_blocks
+                if self._remaining is not None:
+                    if self._remaining <= 0:
+                        # дальше (если файл вырос) поток считает сам потребитель
+                        self._put(_EXHAUSTED)
+                        return
+                    count = min(count, self._remaining)
+                    self._remaining -= count
+                chunk, self._state = self._generate(self._state, count)
+                self._put(chunk)
+        except BaseException as e:
+            # ошибку шифра пробрасываем потребителю
+            self._put(e)
+
+    def _put(self, item) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def take(self, n: int) -> bytes:
+        """Следующие n байт ключевого потока."""
+        parts = []
+        while n > 0:
+            if self._offset == len(self._buffer):
+                if self._exhausted:
+                    item, self._state = self._generate(self._state, self._chunk_blocks)
+                else:
+                    item = self._queue.get()
+                if item is _EXHAUSTED:
+                    self._exhausted = True
+                    continue
+                if isinstance(item, BaseException):
+                    raise item
+                self._buffer, self._offset = item, 0
+            piece = self._buffer[self._offset : self._offset + n]
+            self._offset += len(piece)
+            n -= len(piece)
+            parts.append(piece)
+        return b"".join(parts)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self) -> "KeystreamPrefetcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 class OFBMode(BaseCipherMode):
     """OFB: S_i = E_K(S_{i-1}), C_i = P_i XOR S_i"""
 
+    def _keystream(self, state: bytes, count: int) -> tuple[bytes, bytes]:
+        """S_1 .. S_count от состояния state; возвращает поток и S_count."""
+        encrypt_block = self.primitive.encrypt_block
+        parts = []
+        for _ in range(count):
+            state = encrypt_block(state)
+            parts.append(state)
+        return b"".join(parts), state
+
     def encrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
         iv = self.iv if self.iv else secrets.token_bytes(bs)
 
-        full_blocks_count = len(data) // bs
-        full_data = data[: full_blocks_count * bs]
-        tail = data[full_blocks_count * bs :]
-
-        prev_cipher = iv
-        output = [iv]
-
-        for block in split_blocks(full_data, bs):
-            prev_cipher = self.primitive.encrypt_block(prev_cipher)
-            output.append(xor_bytes(block, prev_cipher))
-
-        if tail:
-            prev_cipher = self.primitive.encrypt_block(prev_cipher)
-            output.append(xor_bytes(tail, prev_cipher[: len(tail)]))
-
-        return b"".join(output)
+        # неполный последний блок берет начало своего S_i (xor_bytes обрезает)
+        keystream, _ = self._keystream(iv, -(-len(data) // bs))
+        return iv + xor_bytes(data, keystream)
 
     def decrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
@@ -37,69 +130,72 @@ class OFBMode(BaseCipherMode):
         iv = data[:bs]
         ciphertext = data[bs:]
 
-        full_blocks_count = len(ciphertext) // bs
-        full_data = ciphertext[: full_blocks_count * bs]
-        tail = ciphertext[full_blocks_count * bs :]
+        keystream, _ = self._keystream(iv, -(-len(ciphertext) // bs))
+        return xor_bytes(ciphertext, keystream)
 
-        prev_cipher = iv
-        output = []
+    def _xor_many(self, ivs: list[bytes], messages: list[bytes]) -> list[bytes]:
+        # S_ij = E_K(S_i(j-1)): шаг j всех потоков - один пакет
+        bs = self.block_size
+        states = list(ivs)
+        outputs = [[] for _ in messages]
 
-        for block in split_blocks(full_data, bs):
-            prev_cipher = self.primitive.encrypt_block(prev_cipher)
-            output.append(xor_bytes(block, prev_cipher))
+        def take_output(i: int, j: int, s: bytes) -> None:
+            states[i] = s
+            outputs[i].append(xor_bytes(messages[i][j * bs : (j + 1) * bs], s))
 
-        if tail:
-            prev_cipher = self.primitive.encrypt_block(prev_cipher)
-            output.append(xor_bytes(tail, prev_cipher[: len(tail)]))
+        self._encrypt_interleaved(
+            [-(-len(m) // bs) for m in messages], lambda i, j: states[i], take_output
+        )
+        return [b"".join(out) for out in outputs]
 
-        return b"".join(output)
+    def encrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        ivs = [self.iv if self.iv else secrets.token_bytes(bs) for _ in messages]
+        return [iv + c for iv, c in zip(ivs, self._xor_many(ivs, messages))]
+
+    def decrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        if any(len(m) < bs for m in messages):
+            raise ValueError("Ciphertext too short for OFB mode")
+        return self._xor_many([m[:bs] for m in messages], [m[bs:] for m in messages])
+
+    def _xor_file(self, iv: bytes, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
+        # поток S_i зависит только от IV: генератор стартует до чтения файла
+        bs = self.block_size
+        chunk_blocks = min(max(-(-chunk_size // bs), 1), MAX_PREFETCH_BLOCKS)
+        remaining = self._remaining_size(fin)
+        total_blocks = None if remaining is None else -(-remaining // bs)
+        with KeystreamPrefetcher(
+            self._keystream, iv, chunk_blocks, total_blocks=total_blocks
+        ) as keystream:
+            while True:
+                chunk = fin.read(chunk_size)
+                if not chunk:
+                    break
+                fout.write(xor_bytes(chunk, keystream.take(len(chunk))))
+
+    @staticmethod
+    def _remaining_size(fin: BinaryIO) -> Optional[int]:
+        """Сколько байт осталось в файле, если это можно узнать без чтения."""
+        try:
+            if not fin.seekable():
+                return None
+            pos = fin.tell()
+            end = fin.seek(0, io.SEEK_END)
+            fin.seek(pos)
+        except (AttributeError, OSError, ValueError):
+            return None
+        return end - pos
 
     def encrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
         iv = self.iv if self.iv else secrets.token_bytes(bs)
         fout.write(iv)
-        prev_cipher = iv
-        carry = b""
-
-        while True:
-            chunk = fin.read(chunk_size)
-            if not chunk:
-                break
-
-            data = carry + chunk
-            full_len = (len(data) // bs) * bs
-            full, carry = data[:full_len], data[full_len:]
-
-            for block in split_blocks(full, bs):
-                prev_cipher = self.primitive.encrypt_block(prev_cipher)
-                fout.write(xor_bytes(block, prev_cipher))
-
-        if carry:
-            prev_cipher = self.primitive.encrypt_block(prev_cipher)
-            fout.write(xor_bytes(carry, prev_cipher[: len(carry)]))
+        self._xor_file(iv, fin, fout, chunk_size)
 
     def decrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
         iv = fin.read(bs)
         if len(iv) != bs:
             raise ValueError("Ciphertext too short for OFB mode")
-
-        prev_cipher = iv
-        carry = b""
-
-        while True:
-            chunk = fin.read(chunk_size)
-            if not chunk:
-                break
-
-            data = carry + chunk
-            full_len = (len(data) // bs) * bs
-            full, carry = data[:full_len], data[full_len:]
-
-            for block in split_blocks(full, bs):
-                prev_cipher = self.primitive.encrypt_block(prev_cipher)
-                fout.write(xor_bytes(block, prev_cipher))
-
-        if carry:
-            prev_cipher = self.primitive.encrypt_block(prev_cipher)
-            fout.write(xor_bytes(carry, prev_cipher[: len(carry)]))
+        self._xor_file(iv, fin, fout, chunk_size)
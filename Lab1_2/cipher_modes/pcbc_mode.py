@@ -8,10 +8,6 @@ from Lab1_2.utility.utility  import pad, unpad, split_blocks, xor_bytes
 class PCBCMode(BaseCipherMode):
     """PCBC: C_i = E_K(P_i XOR P_{i-1} XOR C_{i-1})"""
 
-    def _worker_decrypt(self, block: bytes):
-
-        return self.primitive.decrypt_block(block)
-
     def encrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
         padded = pad(data, bs, self.padding)
@@ -41,9 +37,7 @@ class PCBCMode(BaseCipherMode):
         if not ciphertext_blocks:
             return b""
 
-        decrypted_blocks = list(
-            self._executor.map(self._worker_decrypt, ciphertext_blocks)
-        )
+        decrypted_blocks = split_blocks(self._decrypt_blocks(data[bs:]), bs)
 
         prev_cipher = iv
         prev_plain = b"\x00" * bs
@@ -57,6 +51,46 @@ class PCBCMode(BaseCipherMode):
 
         return unpad(b"".join(plaintext), bs, self.padding)
 
+    def encrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        padded = [pad(m, bs, self.padding) for m in messages]
+        outputs = [[self.iv if self.iv else secrets.token_bytes(bs)] for _ in messages]
+
+        def make_input(i: int, j: int) -> bytes:
+            prev_plain = padded[i][(j - 1) * bs : j * bs] if j else b"\x00" * bs
+            block = padded[i][j * bs : (j + 1) * bs]
+            return xor_bytes(block, xor_bytes(prev_plain, outputs[i][-1]))
+
+        self._encrypt_interleaved(
+            [len(p) // bs for p in padded],
+            make_input,
+            lambda i, j, c: outputs[i].append(c),
+        )
+        return [b"".join(out) for out in outputs]
+
+    def decrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        if any(len(m) < bs or len(m) % bs != 0 for m in messages):
+            raise ValueError("Invalid ciphertext for PCBC")
+
+        # D_K всех блоков - один пакет, цепочка XOR - по сообщению
+        bodies = [m[bs:] for m in messages]
+        decrypted = self._split_lengths(
+            self._decrypt_blocks(b"".join(bodies)), [len(b) for b in bodies]
+        )
+        result = []
+        for d, m in zip(decrypted, messages):
+            if not d:
+                result.append(b"")
+                continue
+            prev_plain = b"\x00" * bs
+            plaintext = []
+            for j in range(0, len(d), bs):
+                prev_plain = xor_bytes(d[j : j + bs], xor_bytes(prev_plain, m[j : j + bs]))
+                plaintext.append(prev_plain)
+            result.append(unpad(b"".join(plaintext), bs, self.padding))
+        return result
+
     def encrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
         iv = self.iv if self.iv else secrets.token_bytes(bs)
@@ -106,7 +140,7 @@ class PCBCMode(BaseCipherMode):
 
             if full:
                 blocks = list(split_blocks(full, bs))
-                decrypted = list(self._executor.map(self._worker_decrypt, blocks))
+                decrypted = split_blocks(self._decrypt_blocks(full), bs)
 
                 for i, dec_block in enumerate(decrypted):
                     plaintext_block = xor_bytes(dec_block, xor_bytes(prev_p, prev_c))
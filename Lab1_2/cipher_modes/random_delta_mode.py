@@ -3,15 +3,12 @@
 import secrets
 from typing import BinaryIO
 from .base_mode import BaseCipherMode
-from Lab1_2.utility.utility import pad, unpad, split_blocks, xor_bytes
+from Lab1_2.utility.utility import pad, unpad, xor_bytes
 
 
 class RandomDeltaMode(BaseCipherMode):
     """RANDOM_DELTA: C_i = E_K(P_i XOR IV_i) where IV_i = IV_{i-1} + Delta"""
 
-    def _worker_decrypt(self, block: bytes):
-        return self.primitive.decrypt_block(block)
-
     def _split_iv_delta(self, combined: bytes) -> tuple[bytes, int]:
         """Split combined data into IV and delta"""
         bs = self.block_size
@@ -20,11 +17,27 @@ class RandomDeltaMode(BaseCipherMode):
         delta = int.from_bytes(delta_bytes, byteorder='big')
         return iv, delta
 
-    def _increment_iv(self, iv: bytes, delta: int) -> bytes:
-        """Increment IV by delta"""
-        iv_int = int.from_bytes(iv, byteorder='big')
-        new_iv_int = (iv_int + delta) & ((1 << (len(iv) * 8)) - 1)  # Wrap around
-        return new_iv_int.to_bytes(len(iv), byteorder='big')
+    def _iv_stream(self, iv: int, delta: int, count: int) -> tuple[bytes, int]:
+        """
+        IV_i .. IV_{i+count-1} одним буфером, начиная с iv = IV_i (как целое).
+        IV не зависят от шифртекста, поэтому блоки шифруются пакетом, как в ECB.
+        Возвращает буфер и IV_{i+count}.
+        """
+        bs = self.block_size
+        mask = (1 << (bs * 8)) - 1
+        parts = []
+        for _ in range(count):
+            parts.append(iv.to_bytes(bs, 'big'))
+            iv = (iv + delta) & mask  # Wrap around
+        return b"".join(parts), iv
+
+    def _encrypt_run(self, blocks: bytes, iv: int, delta: int) -> tuple[bytes, int]:
+        ivs, next_iv = self._iv_stream(iv, delta, len(blocks) // self.block_size)
+        return self._encrypt_blocks(xor_bytes(blocks, ivs)), next_iv
+
+    def _decrypt_run(self, blocks: bytes, iv: int, delta: int) -> tuple[bytes, int]:
+        ivs, next_iv = self._iv_stream(iv, delta, len(blocks) // self.block_size)
+        return xor_bytes(self._decrypt_blocks(blocks), ivs), next_iv
 
     def encrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
@@ -35,22 +48,9 @@ class RandomDeltaMode(BaseCipherMode):
         initial_delta_bytes = secrets.token_bytes(bs)
         combined = iv + initial_delta_bytes  # 2 blocks total
 
-        # Convert delta to integer
         delta = int.from_bytes(initial_delta_bytes, byteorder='big')
-
-        current_iv = iv
-        output_parts = [combined]
-
-        for p_block in split_blocks(padded, bs):
-            # XOR plaintext with current IV
-            xored = xor_bytes(p_block, current_iv)
-            # Encrypt
-            c_block = self.primitive.encrypt_block(xored)
-            output_parts.append(c_block)
-            # Update IV: add delta
-            current_iv = self._increment_iv(current_iv, delta)
-
-        return b"".join(output_parts)
+        ciphertext, _ = self._encrypt_run(padded, int.from_bytes(iv, 'big'), delta)
+        return combined + ciphertext
 
     def decrypt_bytes(self, data: bytes) -> bytes:
         bs = self.block_size
@@ -68,23 +68,42 @@ class RandomDeltaMode(BaseCipherMode):
         # Split into IV and delta
         iv, delta = self._split_iv_delta(combined)
 
-        # Prepare blocks for parallel decryption
-        cipher_blocks = list(split_blocks(ciphertext, bs))
+        plaintext, _ = self._decrypt_run(ciphertext, int.from_bytes(iv, 'big'), delta)
+        return unpad(plaintext, bs, self.padding)
 
-        # Decrypt all blocks in parallel
-        decrypted_blocks = list(self._executor.map(self._worker_decrypt, cipher_blocks))
-
-        # Reconstruct plaintext with IV progression
-        current_iv = iv
-        plaintext_parts = []
-
-        for dec_block in decrypted_blocks:
-            # XOR decrypted block with current IV to get plaintext
-            plaintext_parts.append(xor_bytes(dec_block, current_iv))
-            # Update IV for next block
-            current_iv = self._increment_iv(current_iv, delta)
-
-        return unpad(b"".join(plaintext_parts), bs, self.padding)
+    def encrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        # IV_i не зависят от шифртекста: блоки всех сообщений - один пакет
+        bs = self.block_size
+        headers = [secrets.token_bytes(2 * bs) for _ in messages]
+        padded = []
+        for header, m in zip(headers, messages):
+            iv, delta = self._split_iv_delta(header)
+            p = pad(m, bs, self.padding)
+            ivs, _ = self._iv_stream(int.from_bytes(iv, 'big'), delta, len(p) // bs)
+            padded.append(xor_bytes(p, ivs))
+        ciphertexts = self._split_lengths(
+            self._encrypt_blocks(b"".join(padded)), [len(p) for p in padded]
+        )
+        return [h + c for h, c in zip(headers, ciphertexts)]
+
+    def decrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        bs = self.block_size
+        for m in messages:
+            if len(m) < bs * 2:
+                raise ValueError("Ciphertext too short for RANDOM_DELTA mode")
+            if len(m) % bs != 0:
+                raise ValueError("Invalid ciphertext length for RANDOM_DELTA mode")
+
+        bodies = [m[bs * 2:] for m in messages]
+        decrypted = self._split_lengths(
+            self._decrypt_blocks(b"".join(bodies)), [len(b) for b in bodies]
+        )
+        result = []
+        for m, d in zip(messages, decrypted):
+            iv, delta = self._split_iv_delta(m[:bs * 2])
+            ivs, _ = self._iv_stream(int.from_bytes(iv, 'big'), delta, len(d) // bs)
+            result.append(unpad(xor_bytes(d, ivs), bs, self.padding))
+        return result
 
     def encrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
@@ -96,7 +115,7 @@ class RandomDeltaMode(BaseCipherMode):
         delta = int.from_bytes(initial_delta_bytes, byteorder='big')
 
         fout.write(combined)
-        current_iv = iv
+        current_iv = int.from_bytes(iv, 'big')
         carry = b""
 
         while True:
@@ -108,18 +127,13 @@ class RandomDeltaMode(BaseCipherMode):
             full_len = (len(data) // bs) * bs
             full, carry = data[:full_len], data[full_len:]
 
-            for p_block in split_blocks(full, bs):
-                xored = xor_bytes(p_block, current_iv)
-                c_block = self.primitive.encrypt_block(xored)
-                fout.write(c_block)
-                current_iv = self._increment_iv(current_iv, delta)
+            if full:
+                ciphertext, current_iv = self._encrypt_run(full, current_iv, delta)
+                fout.write(ciphertext)
 
         # Handle remaining data with padding
-        for p_block in split_blocks(pad(carry, bs, self.padding), bs):
-            xored = xor_bytes(p_block, current_iv)
-            c_block = self.primitive.encrypt_block(xored)
-            fout.write(c_block)
-            current_iv = self._increment_iv(current_iv, delta)
+        ciphertext, _ = self._encrypt_run(pad(carry, bs, self.padding), current_iv, delta)
+        fout.write(ciphertext)
 
     def decrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
         bs = self.block_size
@@ -130,7 +144,7 @@ class RandomDeltaMode(BaseCipherMode):
 
         iv, delta = self._split_iv_delta(combined)
 
-        current_iv = iv
+        current_iv = int.from_bytes(iv, 'big')
         carry = b""
         hold = None
 
@@ -144,19 +158,16 @@ class RandomDeltaMode(BaseCipherMode):
             full, carry = data[:full_len], data[full_len:]
 
             if full:
-                cipher_blocks = list(split_blocks(full, bs))
-                decrypted = list(self._executor.map(self._worker_decrypt, cipher_blocks))
-
-                for i, dec_block in enumerate(decrypted):
-                    plaintext_block = xor_bytes(dec_block, current_iv)
+                plaintext, current_iv = self._decrypt_run(full, current_iv, delta)
 
-                    if hold is not None:
-                        fout.write(hold)
-                    hold = plaintext_block
-                    current_iv = self._increment_iv(current_iv, delta)
+                # последний блок придерживаем до конца файла ради unpad
+                if hold is not None:
+                    fout.write(hold)
+                fout.write(plaintext[:-bs])
+                hold = plaintext[-bs:]
 
         if carry:
             raise ValueError("Invalid ciphertext length for RANDOM_DELTA mode")
 
         if hold is not None:
-            fout.write(unpad(hold, bs, self.padding))
\ No newline at end of file
+            fout.write(unpad(hold, bs, self.padding))
@@ -0,0 +1,187 @@
+"""
+Многополосный CBC: блок i открытого текста идет в полосу i % L, каждая полоса -
+независимая цепочка CBC со своим IV. Шифртекст хранит блоки в исходном
+порядке, поэтому C_i = E_K(P_i XOR C_{i-L}), а первые L блоков сцеплены
+с IV полос.
+
+Формат: L (1 байт) || master IV || C. IV полосы l - E_K(master IV XOR l).
+Полосы шифруются группами в executor контекста, расшифрование - как у CBC.
+"""
+
+import secrets
+from typing import BinaryIO
+from .base_mode import BaseCipherMode
+from Lab1_2.utility.utility import pad, unpad, xor_bytes
+
+DEFAULT_LANES = 8
+MAX_LANES = 255
+
+
+def _encrypt_lane_group(primitive, task) -> bytes:
+    """
+    Цепочки CBC группы соседних полос. data - строки по width байт (блоки
+    группы подряд, последняя строка может быть короче), prev - предыдущие
+    блоки шифртекста этих полос.
+    """
+    prev, data, width = task
+    out = []
+    for start in range(0, len(data), width):
+        prev = primitive.encrypt_blocks(xor_bytes(data[start : start + width], prev))
+        out.append(prev)
+    return b"".join(out)
+
+
+class StripedCBCMode(BaseCipherMode):
+    """STRIPED_CBC: C_i = E_K(P_i XOR C_{i-L}), C_{-L..-1} = IV полос"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # число полос - первый из mode_args контекста
+        self.lanes = self.mode_args[0] if self.mode_args else DEFAULT_LANES
+        if not 1 <= self.lanes <= MAX_LANES:
+            raise ValueError(f"Lane count must be in [1, {MAX_LANES}]")
+
+    def _lane_ivs(self, master_iv: bytes, lanes: int) -> bytes:
+        bs = self.block_size
+        master = int.from_bytes(master_iv, "big")
+        return self._encrypt_blocks(
+            b"".join((master ^ l).to_bytes(bs, "big") for l in range(lanes))
+        )
+
+    def _read_header(self, header: bytes) -> tuple[int, bytes]:
+        bs = self.block_size
+        if len(header) != 1 + bs:
+            raise ValueError("Ciphertext too short for STRIPED_CBC mode")
+        lanes = header[0]
+        if lanes == 0:
+            raise ValueError("Invalid lane count in STRIPED_CBC header")
+        return lanes, self._lane_ivs(header[1:], lanes)
+
+    def _encrypt_rows(self, data: bytes, prev: bytes, lanes: int) -> bytes:
+        """
+        Шифрует блоки data (строки по lanes блоков, prev - последняя строка
+        шифртекста). Полосы делятся на группы, группа - одна задача executor.
+        """
+        bs = self.block_size
+        row = lanes * bs
+        groups = 1
+        if self._executor is not None:
+            groups = min(
+                lanes,
+                self._executor.max_workers,
+                len(data) // self._executor.min_span_bytes,
+            )
+        if groups <= 1:
+            return _encrypt_lane_group(self.primitive, (prev, data, row))
+
+        bounds = [lanes * g // groups * bs for g in range(groups + 1)]
+        tasks = [
+            (
+                prev[a:b],
+                b"".join(data[s + a : s + b] for s in range(0, len(data), row)),
+                b - a,
+            )
+            for a, b in zip(bounds, bounds[1:])
+        ]
+        results = self._executor.map_tasks(_encrypt_lane_group, tasks)
+
+        # обратно в исходный порядок: строка s = куски s всех групп
+        out = []
+        offsets = [0] * groups
+        for s in range(0, len(data), row):
+            for g, (a, b) in enumerate(zip(bounds, bounds[1:])):
+                n = len(data[s + a : s + b])
+                out.append(results[g][offsets[g] : offsets[g] + n])
+                offsets[g] += n
+        return b"".join(out)
+
+    def _decrypt_rows(self, data: bytes, prev: bytes, lanes: int) -> bytes:
+        # P_i = D_K(C_i) XOR C_{i-L}: все D_K независимы
+        return xor_bytes(self._decrypt_blocks(data), prev + data[: -lanes * self.block_size])
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        bs = self.block_size
+        lanes = self.lanes
+        padded = pad(data, bs, self.padding)
+        master_iv = self.iv if self.iv else secrets.token_bytes(bs)
+
+        ivs = self._lane_ivs(master_iv, lanes)
+        return bytes([lanes]) + master_iv + self._encrypt_rows(padded, ivs, lanes)
+
+    def decrypt_bytes(self, data: bytes) -> bytes:
+        bs = self.block_size
+        lanes, ivs = self._read_header(data[: 1 + bs])
+        ciphertext = data[1 + bs :]
+
+        if len(ciphertext) % bs != 0:
+            raise ValueError("Ciphertext length invalid for STRIPED_CBC mode")
+        if not ciphertext:
+            return b""
+
+        return unpad(self._decrypt_rows(ciphertext, ivs, lanes), bs, self.padding)
+
+    def encrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
+        bs = self.block_size
+        lanes = self.lanes
+        row = lanes * bs
+        master_iv = self.iv if self.iv else secrets.token_bytes(bs)
+        fout.write(bytes([lanes]) + master_iv)
+
+        prev = self._lane_ivs(master_iv, lanes)
+        carry = b""
+
+        while True:
+            chunk = fin.read(chunk_size)
+            if not chunk:
+                break
+
+            # целые строки, чтобы prev всегда был строкой всех полос
+            data = carry + chunk
+            full_len = (len(data) // row) * row
+            full, carry = data[:full_len], data[full_len:]
+
+            if full:
+                ciphertext = self._encrypt_rows(full, prev, lanes)
+                fout.write(ciphertext)
+                prev = ciphertext[-row:]
+
+        fout.write(self._encrypt_rows(pad(carry, bs, self.padding), prev, lanes))
+
+    def decrypt_file(self, fin: BinaryIO, fout: BinaryIO, chunk_size: int):
+        bs = self.block_size
+        lanes, prev = self._read_header(fin.read(1 + bs))
+        row = lanes * bs
+
+        carry = b""
+        hold = None
+
+        while True:
+            chunk = fin.read(chunk_size)
+            if not chunk:
+                break
+
+            data = carry + chunk
+            full_len = (len(data) // row) * row
+            full, carry = data[:full_len], data[full_len:]
+
+            if full:
+                plaintext = self._decrypt_rows(full, prev, lanes)
+
+                if hold is not None:
+                    fout.write(hold)
+                fout.write(plaintext[:-bs])
+                hold = plaintext[-bs:]
+                prev = full[-row:]
+
+        # неполная последняя строка
+        if len(carry) % bs != 0:
+            raise ValueError("Ciphertext length invalid for STRIPED_CBC mode")
+        if carry:
+            plaintext = self._decrypt_rows(carry, prev, lanes)
+            if hold is not None:
+                fout.write(hold)
+            fout.write(plaintext[:-bs])
+            hold = plaintext[-bs:]
+
+        if hold is not None:
+            fout.write(unpad(hold, bs, self.padding))
@@ -3,6 +3,10 @@ from Lab1_2.cipher_primitives.DES.des_cipher import DES
 
 
 class DESAdapter(IRoundFunction):
+    int_native = True
+    batch_native = True
+    half_size = 8
+
     def apply(self, half_block: bytes, round_key: bytes) -> bytes:
         if len(half_block) != 8:
             raise ValueError("Half block must be 8 bytes for DEAL")
@@ -10,4 +14,23 @@ class DESAdapter(IRoundFunction):
             raise ValueError("Round key must be 8 bytes for DES")
         des = DES()
         des.setup_keys(round_key)
-        return des.encrypt_block(half_block)
\ No newline at end of file
+        return des.encrypt_block(half_block)
+
+    def prepare_key(self, round_key: bytes) -> DES:
+        """
+        Раундовый ключ DEAL -> готовый DES с развернутыми подключами.
+        Строится один раз в DEAL.setup_keys; дальше только читается,
+        поэтому один экземпляр безопасно делить между потоками.
+        """
+        if len(round_key) != 8:
+            raise ValueError("Round key must be 8 bytes for DES")
+        des = DES()
+        des.setup_keys(round_key)
+        return des
+
+    def apply_int(self, half_block: int, round_key: DES) -> int:
+        return round_key.encrypt_int(half_block)
+
+    def apply_many(self, half_blocks: bytes, round_key: DES) -> bytes:
+        # половины всех блоков - независимые блоки DES, шифруем пакетом
+        return round_key.encrypt_blocks(half_blocks)
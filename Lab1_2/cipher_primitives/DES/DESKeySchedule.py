@@ -1,7 +1,13 @@
 from Lab1_2.utility.interfaces import IKeySchedule
-from Lab1_2.utility.bitperm import bitperm
+from Lab1_2.utility.bitperm import compile_bitperm
+from Lab1_2.utility.lru_cache import LRUCache
+
 MASK_28_BITS = (1 << 28) - 1
 
+# Общий для всего процесса кэш раундовых ключей: мастер-ключ -> 16 ключей.
+# Через DESKeySchedule им пользуются DES, TripleDES, DEALKeySchedule и DESAdapter.
+DES_KEY_CACHE = LRUCache(maxsize=4096)
+
 
 class DESKeySchedule(IKeySchedule):
     # fmt: off
@@ -28,17 +34,23 @@ class DESKeySchedule(IKeySchedule):
     ]
     # fmt: on
     SHIFTS = [1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 1]
+    _PC1_PERM = compile_bitperm(PC1, 8)
+    _PC2_PERM = compile_bitperm(PC2, 7)
 
     def expand_key(self, master_key: bytes) -> list[bytes]:
+        master_key = bytes(master_key)
+        round_keys = DES_KEY_CACHE.get_or_compute(
+            master_key, lambda: tuple(self._expand_key(master_key))
+        )
+        return list(round_keys)
+
+    def _expand_key(self, master_key: bytes) -> list[bytes]:
         if len(master_key) == 7:
             master_key = self._add_parity_bits(master_key)
         elif len(master_key) != 8:
             raise ValueError("DES key must be 7 bytes (56 bits) or 8 bytes (64 bits)")
 
-        permuted_key = bitperm(
-            master_key, self.PC1, msb_first=True, one_based_indexing=True
-        )
-        key_int = int.from_bytes(permuted_key, "big")
+        key_int = self._PC1_PERM.apply_int(int.from_bytes(master_key, "big"))
         C = (key_int >> 28) & MASK_28_BITS
         D = key_int & MASK_28_BITS
         round_keys = []
@@ -46,8 +58,7 @@ class DESKeySchedule(IKeySchedule):
         for i in range(16):
             C = self._rotate_left_28(C, self.SHIFTS[i])
             D = self._rotate_left_28(D, self.SHIFTS[i])
-            CD = ((C << 28) | D).to_bytes(7, "big")
-            round_key = bitperm(CD, self.PC2, msb_first=True, one_based_indexing=True)
+            round_key = self._PC2_PERM.apply_int((C << 28) | D).to_bytes(6, "big")
             round_keys.append(round_key)
         return round_keys
 
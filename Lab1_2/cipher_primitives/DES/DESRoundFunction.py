@@ -1,9 +1,11 @@
-from Lab1_2.utility.bitperm import bitperm
+from Lab1_2.utility.bitperm import compile_bitperm
 from Lab1_2.utility.interfaces import IRoundFunction
 from Lab1_2.utility.utility import xor_bytes
 
 
 class DESRoundFunction(IRoundFunction):
+    half_size = 4
+
     # fmt: off
     E = [
         32, 1, 2, 3, 4, 5,
@@ -85,16 +87,19 @@ class DESRoundFunction(IRoundFunction):
         22, 11, 4, 25
     ]
     # fmt: on
+    _E_PERM = compile_bitperm(E, 4)
+    _P_PERM = compile_bitperm(P, 4)
+
     def apply(self, half_block: bytes, round_key: bytes) -> bytes:
         """f(R, K) = P(S(E(R) XOR K))."""
         if len(half_block) != 4:
             raise ValueError("Half block must be 4 bytes")
         if len(round_key) != 6:
             raise ValueError("Round key must be 6 bytes")
-        expanded = bitperm(half_block, self.E, msb_first=True, one_based_indexing=True)
+        expanded = self._E_PERM.apply(half_block)
         xored = xor_bytes(expanded, round_key)
         substituted = self._apply_sboxes(xored)
-        result = bitperm(substituted, self.P, msb_first=True, one_based_indexing=True)
+        result = self._P_PERM.apply(substituted)
         return result
 
     def _apply_sboxes(self, data: bytes) -> bytes:
@@ -113,4 +118,54 @@ class DESRoundFunction(IRoundFunction):
             sbox_value = self.SBOXES[i][row][col]
             result = (result << 4) | sbox_value
 
-        return result.to_bytes(4, "big")
\ No newline at end of file
+        return result.to_bytes(4, "big")
+
+def _build_sp_tables(sboxes: list, p_perm) -> tuple:
+    """SP[i][x] = P(S_i(x)) для 6-битного входа x i-го S-блока."""
+    tables = []
+    for i, sbox in enumerate(sboxes):
+        table = []
+        for x in range(64):
+            row = ((x & 0b100000) >> 4) | (x & 0b000001)
+            col = (x >> 1) & 0b001111
+            table.append(p_perm.apply_int(sbox[row][col] << (28 - 4 * i)))
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+class DESSPRoundFunction(DESRoundFunction):
+    """
+    f(R, K) через объединенные таблицы S-блоков и перестановки P:
+    E - сдвиги и маски над целым, раунд - 8 обращений к таблицам и XOR.
+    """
+
+    int_native = True
+    SP = _build_sp_tables(DESRoundFunction.SBOXES, DESRoundFunction._P_PERM)
+
+    def prepare_key(self, round_key: bytes) -> int:
+        return int.from_bytes(round_key, "big")
+
+    def apply(self, half_block: bytes, round_key: bytes) -> bytes:
+        if len(half_block) != 4:
+            raise ValueError("Half block must be 4 bytes")
+        if len(round_key) != 6:
+            raise ValueError("Round key must be 6 bytes")
+        result = self.apply_int(
+            int.from_bytes(half_block, "big"), int.from_bytes(round_key, "big")
+        )
+        return result.to_bytes(4, "big")
+
+    def apply_int(self, half_block: int, round_key: int) -> int:
+        sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = self.SP
+        # 34 бита: R32 | R1..R32 | R1, i-я шестерка E(R) = (x >> (28 - 4i)) & 0x3F
+        x = ((half_block & 1) << 33) | (half_block << 1) | (half_block >> 31)
+        return (
+            sp0[((x >> 28) ^ (round_key >> 42)) & 0x3F]
+            | sp1[((x >> 24) ^ (round_key >> 36)) & 0x3F]
+            | sp2[((x >> 20) ^ (round_key >> 30)) & 0x3F]
+            | sp3[((x >> 16) ^ (round_key >> 24)) & 0x3F]
+            | sp4[((x >> 12) ^ (round_key >> 18)) & 0x3F]
+            | sp5[((x >> 8) ^ (round_key >> 12)) & 0x3F]
+            | sp6[((x >> 4) ^ (round_key >> 6)) & 0x3F]
+            | sp7[(x ^ round_key) & 0x3F]
+        )
@@ -0,0 +1,252 @@
+"""
+Битслайс-реализация DES для пакетной обработки независимых блоков.
+
+Блоки транспонируются в 64 битовые плоскости: плоскость j - целое, у которого
+i-й (со старшего) бит равен j-му биту i-го блока. Перестановки IP, E, P, FP
+становятся перестановкой списка плоскостей, XOR с ключом - XOR с маской,
+а S-блоки вычисляются булевыми схемами, построенными по их таблицам.
+За один проход шифруются сразу `lanes` блоков.
+"""
+
+from functools import lru_cache
+
+from Lab1_2.cipher_primitives.DES.DESRoundFunction import DESRoundFunction
+from Lab1_2.cipher_primitives.DES.des_bitslice_sboxes import SBOX_FUNCS
+
+# Порядок переменных в разложении Шеннона для каждого S-блока
+# (подобран перебором - дает самые короткие схемы).
+_SBOX_VAR_ORDERS = (
+    (0, 3, 5, 1, 2, 4),
+    (0, 5, 4, 1, 2, 3),
+    (0, 3, 2, 1, 4, 5),
+    (5, 0, 3, 2, 1, 4),
+    (3, 5, 2, 1, 0, 4),
+    (2, 4, 3, 0, 1, 5),
+    (0, 5, 1, 3, 2, 4),
+    (5, 0, 4, 1, 2, 3),
+)
+
+# Шаги транспонирования матрицы 8x8 бит внутри 64-битного слова
+_TRANSPOSE_STEPS = (
+    (7, 0x00AA00AA00AA00AA),
+    (14, 0x0000CCCC0000CCCC),
+    (28, 0x00000000F0F0F0F0),
+)
+
+DEFAULT_LANES = 2048
+
+
+def _sbox_truth_table(sbox: list, out_bit: int, order: tuple) -> tuple:
+    """Таблица истинности out_bit-го выхода (0 - старший) в порядке переменных order."""
+    truth = []
+    for idx in range(64):
+        x = 0
+        for pos, var in enumerate(order):
+            if (idx >> (5 - pos)) & 1:
+                x |= 1 << (5 - var)
+        row = ((x & 0b100000) >> 4) | (x & 0b000001)
+        col = (x >> 1) & 0b001111
+        truth.append((sbox[row][col] >> (3 - out_bit)) & 1)
+    return tuple(truth)
+
+
+def _sbox_source(sbox: list, order: tuple, name: str) -> str:
+    """
+    Строит булеву схему S-блока разложением Шеннона (мультиплексоры
+    f = f0 ^ ((f0 ^ f1) & a)) с общими подсхемами и генерирует по ней функцию
+    name(a0, ..., a5, ones) -> (o0, o1, o2, o3), a0/o0 - старшие биты.
+    """
+    lines = []
+    memo = {}
+    negated = {}
+
+    def neg(var: str) -> str:
+        if var not in negated:
+            negated[var] = f"n{var}"
+            lines.append(f"n{var} = {var} ^ ones")
+        return negated[var]
+
+    def build(truth: tuple, depth: int) -> str:
+        if not any(truth):
+            return "0"
+        if all(truth):
+            return "ones"
+        if truth in memo:
+            return memo[truth]
+        complement = tuple(1 - t for t in truth)
+        if complement in memo:
+            name = f"t{len(lines)}"
+            lines.append(f"{name} = {memo[complement]} ^ ones")
+            memo[truth] = name
+            return name
+
+        var = f"a{order[depth]}"
+        half = len(truth) // 2
+        f0 = build(truth[:half], depth + 1)
+        f1 = build(truth[half:], depth + 1)
+        if f0 == f1:
+            memo[truth] = f0
+            return f0
+        if f0 == "0":
+            expr = f"{f1} & {var}"
+        elif f1 == "0":
+            expr = f"{f0} & {neg(var)}"
+        elif f0 == "ones":
+            expr = f"{f1} | {neg(var)}"
+        elif f1 == "ones":
+            expr = f"{f0} | {var}"
+        else:
+            expr = f"{f0} ^ (({f0} ^ {f1}) & {var})"
+        name = f"t{len(lines)}"
+        lines.append(f"{name} = {expr}")
+        memo[truth] = name
+        return name
+
+    outputs = [build(_sbox_truth_table(sbox, b, order), 0) for b in range(4)]
+    source = f"def {name}(a0, a1, a2, a3, a4, a5, ones):\n"
+    source += "".join(f"    {line}\n" for line in lines)
+    source += f"    return {', '.join(outputs)}\n"
+    return source
+
+
+def generate_sbox_module() -> str:
+    """Текст модуля des_bitslice_sboxes (схемы всех восьми S-блоков)."""
+    names = [f"sbox{i}" for i in range(8)]
+    parts = [
+        '"""\n'
+        "Булевы схемы S-блоков DES для битслайс-движка.\n\n"
+        "Сгенерировано des_bitslice.generate_sbox_module(), не править вручную:\n"
+        "python -m Lab1_2.cipher_primitives.DES.des_bitslice\n"
+        '"""\n'
+    ]
+    for name, sbox, order in zip(names, DESRoundFunction.SBOXES, _SBOX_VAR_ORDERS):
+        parts.append("\n\n" + _sbox_source(sbox, order, name))
+    parts.append(f"\n\nSBOX_FUNCS = ({', '.join(names)})\n")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _transpose_masks(num_words: int) -> tuple:
+    return tuple(
+        (shift, int.from_bytes(mask.to_bytes(8, "big") * num_words, "big"))
+        for shift, mask in _TRANSPOSE_STEPS
+    )
+
+
+def _transpose8(x: int, num_words: int) -> int:
+    """Транспонирует матрицу 8x8 бит в каждом 64-битном слове x (инволюция)."""
+    for shift, mask in _transpose_masks(num_words):
+        t = (x ^ (x >> shift)) & mask
+        x ^= t ^ (t << shift)
+    return x
+
+
+def _to_planes(data: bytes, n: int) -> list[int]:
+    """n блоков (n кратно 8) -> 64 плоскости, блок i - бит (n - 1 - i)."""
+    planes = []
+    num_words = n // 8
+    for k in range(8):
+        column = int.from_bytes(data[k::8], "big")
+        column = _transpose8(column, num_words).to_bytes(n, "big")
+        for b in range(8):
+            planes.append(int.from_bytes(column[b::8], "big"))
+    return planes
+
+
+def _from_planes(planes: list[int], n: int) -> bytes:
+    num_words = n // 8
+    out = bytearray(n * 8)
+    column = bytearray(n)
+    for k in range(8):
+        for b in range(8):
+            column[b::8] = planes[k * 8 + b].to_bytes(num_words, "big")
+        out[k::8] = _transpose8(int.from_bytes(column, "big"), num_words).to_bytes(
+            n, "big"
+        )
+    return bytes(out)
+
+
+class BitslicedDESEngine:
+    """
+    Пакетное шифрование DES битслайсом.
+
+    key_passes - последовательность наборов по 16 раундовых ключей (48-битные
+    целые) в порядке применения: один набор - DES, обратный порядок ключей -
+    расшифрование, несколько наборов - каскад DES без лишних FP/IP между ними.
+    """
+
+    def __init__(
+        self,
+        key_passes: list[list[int]],
+        ip: list[int],
+        fp: list[int],
+        lanes: int = DEFAULT_LANES,
+    ):
+        if lanes < 8 or lanes % 8 != 0:
+            raise ValueError("lanes must be a positive multiple of 8")
+        self.lanes = lanes
+        self._ip = tuple(i - 1 for i in ip)
+        self._fp = tuple(i - 1 for i in fp)
+        self._p = tuple(i - 1 for i in DESRoundFunction.P)
+        e = [i - 1 for i in DESRoundFunction.E]
+        # для каждого раунда: (индекс бита R, инвертировать ли его ключом)
+        self._passes = tuple(
+            tuple(
+                tuple((e[j], (k >> (47 - j)) & 1) for j in range(48))
+                for k in round_keys
+            )
+            for round_keys in key_passes
+        )
+
+    def crypt_blocks(self, data: bytes) -> bytes:
+        if len(data) % 8 != 0:
+            raise ValueError("Data length must be a multiple of 8 bytes")
+        step = self.lanes * 8
+        out = []
+        for offset in range(0, len(data), step):
+            batch = data[offset : offset + step]
+            n = len(batch) // 8
+            padded_n = (n + 7) // 8 * 8
+            if padded_n != n:
+                batch += bytes((padded_n - n) * 8)
+            planes = self._crypt_planes(
+                _to_planes(batch, padded_n), (1 << padded_n) - 1
+            )
+            out.append(_from_planes(planes, padded_n)[: n * 8])
+        return b"".join(out)
+
+    def _crypt_planes(self, bits: list[int], ones: int) -> list[int]:
+        sb0, sb1, sb2, sb3, sb4, sb5, sb6, sb7 = SBOX_FUNCS
+        p = self._p
+        L = [bits[j] for j in self._ip[:32]]
+        R = [bits[j] for j in self._ip[32:]]
+
+        for rounds in self._passes:
+            for spec in rounds:
+                x = [R[j] ^ ones if flip else R[j] for j, flip in spec]
+                s = (
+                    sb0(*x[0:6], ones)
+                    + sb1(*x[6:12], ones)
+                    + sb2(*x[12:18], ones)
+                    + sb3(*x[18:24], ones)
+                    + sb4(*x[24:30], ones)
+                    + sb5(*x[30:36], ones)
+                    + sb6(*x[36:42], ones)
+                    + sb7(*x[42:48], ones)
+                )
+                L, R = R, [l ^ s[j] for l, j in zip(L, p)]
+            # завершающий обмен половин DES (R16 L16)
+            L, R = R, L
+
+        preoutput = L + R
+        return [preoutput[j] for j in self._fp]
+
+
+if __name__ == "__main__":
+    import os
+
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "des_bitslice_sboxes.py"
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate_sbox_module())
@@ -0,0 +1,549 @@
+"""
+Булевы схемы S-блоков DES для битслайс-движка.
+
+Сгенерировано des_bitslice.generate_sbox_module(), не править вручную:
+python -m Lab1_2.cipher_primitives.DES.des_bitslice
+"""
+
+
+def sbox0(a0, a1, a2, a3, a4, a5, ones):
+    na4 = a4 ^ ones
+    t1 = ones & na4
+    t2 = t1 ^ ones
+    t3 = t1 ^ ((t1 ^ t2) & a2)
+    t4 = t3 ^ ((t3 ^ t2) & a1)
+    t5 = t4 ^ ones
+    t6 = t4 ^ ((t4 ^ t5) & a5)
+    t7 = t1 | a2
+    t8 = t7 ^ ones
+    t9 = t7 ^ ((t7 ^ t8) & a1)
+    t10 = t1 & a2
+    t11 = t10 ^ ones
+    t12 = t10 ^ ((t10 ^ t11) & a1)
+    t13 = t9 ^ ((t9 ^ t12) & a5)
+    t14 = t6 ^ ((t6 ^ t13) & a3)
+    t15 = t3 ^ ones
+    t16 = t11 ^ ((t11 ^ t15) & a1)
+    t17 = t12 ^ ((t12 ^ t16) & a5)
+    na2 = a2 ^ ones
+    t19 = t1 & na2
+    t20 = t11 ^ ((t11 ^ t19) & a1)
+    t21 = t19 ^ ((t19 ^ t2) & a1)
+    t22 = t20 ^ ((t20 ^ t21) & a5)
+    t23 = t17 ^ ((t17 ^ t22) & a3)
+    t24 = t14 ^ ((t14 ^ t23) & a0)
+    t25 = t12 ^ ones
+    t26 = t15 ^ ((t15 ^ t2) & a1)
+    t27 = t25 ^ ((t25 ^ t26) & a5)
+    t28 = t19 ^ ((t19 ^ t11) & a1)
+    t29 = t1 | na2
+    t30 = t29 ^ ((t29 ^ t19) & a1)
+    t31 = t28 ^ ((t28 ^ t30) & a5)
+    t32 = t27 ^ ((t27 ^ t31) & a3)
+    t33 = ones & na2
+    t34 = t7 ^ ((t7 ^ t33) & a1)
+    t35 = t34 ^ ((t34 ^ t30) & a5)
+    t36 = t19 ^ ((t19 ^ t15) & a1)
+    t37 = t30 ^ ones
+    t38 = t36 ^ ((t36 ^ t37) & a5)
+    t39 = t35 ^ ((t35 ^ t38) & a3)
+    t40 = t32 ^ ((t32 ^ t39) & a0)
+    t41 = t19 ^ ones
+    t42 = t41 ^ ((t41 ^ t33) & a1)
+    t43 = t34 ^ ((t34 ^ t42) & a5)
+    t44 = t16 ^ ones
+    t45 = t44 ^ ((t44 ^ t36) & a5)
+    t46 = t43 ^ ((t43 ^ t45) & a3)
+    t47 = t29 ^ ones
+    t48 = t47 ^ ((t47 ^ t7) & a1)
+    t49 = t48 ^ ((t48 ^ t36) & a5)
+    t50 = t2 ^ ((t2 ^ t29) & a1)
+    t51 = t9 ^ ((t9 ^ t50) & a5)
+    t52 = t49 ^ ((t49 ^ t51) & a3)
+    t53 = t46 ^ ((t46 ^ t52) & a0)
+    t54 = t34 ^ ones
+    t55 = t48 ^ ((t48 ^ t54) & a5)
+    t56 = t29 ^ ((t29 ^ t47) & a1)
+    t57 = t7 ^ ((t7 ^ t15) & a1)
+    t58 = t56 ^ ((t56 ^ t57) & a5)
+    t59 = t55 ^ ((t55 ^ t58) & a3)
+    t60 = t3 ^ ((t3 ^ t33) & a1)
+    t61 = t5 ^ ((t5 ^ t60) & a5)
+    t62 = t56 ^ ones
+    t63 = t33 ^ ones
+    t64 = t63 ^ ((t63 ^ t3) & a1)
+    t65 = t62 ^ ((t62 ^ t64) & a5)
+    t66 = t61 ^ ((t61 ^ t65) & a3)
+    t67 = t59 ^ ((t59 ^ t66) & a0)
+    return t24, t40, t53, t67
+
+
+def sbox1(a0, a1, a2, a3, a4, a5, ones):
+    na2 = a2 ^ ones
+    t1 = ones & na2
+    na3 = a3 ^ ones
+    t3 = ones & na3
+    t4 = t1 ^ ((t1 ^ t3) & a1)
+    t5 = t3 ^ ones
+    t6 = t5 ^ ((t5 ^ t3) & a2)
+    t7 = t3 ^ ones
+    t8 = t6 ^ ((t6 ^ t7) & a1)
+    t9 = t4 ^ ((t4 ^ t8) & a4)
+    t10 = t1 ^ ones
+    t11 = t6 ^ ones
+    t12 = t10 ^ ((t10 ^ t11) & a1)
+    t13 = t11 ^ ((t11 ^ t6) & a1)
+    t14 = t12 ^ ((t12 ^ t13) & a4)
+    t15 = t9 ^ ((t9 ^ t14) & a5)
+    t16 = t10 ^ ((t10 ^ t6) & a1)
+    t17 = t16 ^ ones
+    t18 = t16 ^ ((t16 ^ t17) & a4)
+    t19 = t3 ^ ((t3 ^ t7) & a1)
+    t20 = t17 ^ ((t17 ^ t19) & a4)
+    t21 = t18 ^ ((t18 ^ t20) & a5)
+    t22 = t15 ^ ((t15 ^ t21) & a0)
+    t23 = t3 ^ ((t3 ^ t10) & a1)
+    t24 = t23 ^ ones
+    t25 = t23 ^ ((t23 ^ t24) & a4)
+    t26 = t6 ^ ((t6 ^ t3) & a1)
+    t27 = t5 | na2
+    t28 = t5 & a2
+    t29 = t27 ^ ((t27 ^ t28) & a1)
+    t30 = t26 ^ ((t26 ^ t29) & a4)
+    t31 = t25 ^ ((t25 ^ t30) & a5)
+    t32 = t24 ^ ((t24 ^ t19) & a4)
+    t33 = t30 ^ ones
+    t34 = t32 ^ ((t32 ^ t33) & a5)
+    t35 = t31 ^ ((t31 ^ t34) & a0)
+    t36 = t3 | a2
+    t37 = t36 ^ ones
+    t38 = t36 ^ ((t36 ^ t37) & a1)
+    t39 = t13 ^ ones
+    t40 = t38 ^ ((t38 ^ t39) & a4)
+    t41 = t5 | a2
+    t42 = t41 ^ ((t41 ^ t37) & a1)
+    t43 = t23 ^ ((t23 ^ t42) & a4)
+    t44 = t40 ^ ((t40 ^ t43) & a5)
+    t45 = t6 ^ ((t6 ^ t28) & a1)
+    t46 = t1 ^ ((t1 ^ t41) & a1)
+    t47 = t45 ^ ((t45 ^ t46) & a4)
+    t48 = t6 ^ ((t6 ^ t27) & a1)
+    t49 = t46 ^ ones
+    t50 = t48 ^ ((t48 ^ t49) & a4)
+    t51 = t47 ^ ((t47 ^ t50) & a5)
+    t52 = t44 ^ ((t44 ^ t51) & a0)
+    t53 = t3 ^ ((t3 ^ t1) & a1)
+    t54 = t11 ^ ((t11 ^ t53) & a4)
+    t55 = t1 ^ ((t1 ^ t10) & a1)
+    t56 = t19 ^ ((t19 ^ t55) & a4)
+    t57 = t54 ^ ((t54 ^ t56) & a5)
+    t58 = t19 ^ ones
+    t59 = t53 ^ ones
+    t60 = t58 ^ ((t58 ^ t59) & a4)
+    t61 = t6 ^ ((t6 ^ t10) & a1)
+    t62 = t53 ^ ((t53 ^ t61) & a4)
+    t63 = t60 ^ ((t60 ^ t62) & a5)
+    t64 = t57 ^ ((t57 ^ t63) & a0)
+    return t22, t35, t52, t64
+
+
+def sbox2(a0, a1, a2, a3, a4, a5, ones):
+    na4 = a4 ^ ones
+    t1 = ones & na4
+    t2 = t1 ^ ones
+    t3 = t1 ^ ((t1 ^ t2) & a1)
+    t4 = ones & a5
+    t5 = t4 | na4
+    t6 = t5 & a1
+    t7 = t3 ^ ((t3 ^ t6) & a2)
+    t8 = t4 ^ ones
+    t9 = t8 | a4
+    t10 = t8 ^ ((t8 ^ t4) & a4)
+    t11 = t9 ^ ((t9 ^ t10) & a1)
+    t12 = t10 ^ ones
+    t13 = t10 ^ ((t10 ^ t12) & a1)
+    t14 = t11 ^ ((t11 ^ t13) & a2)
+    t15 = t7 ^ ((t7 ^ t14) & a3)
+    t16 = t9 ^ ((t9 ^ t12) & a1)
+    t17 = t10 ^ ((t10 ^ t16) & a2)
+    t18 = t17 ^ ones
+    t19 = t17 ^ ((t17 ^ t18) & a3)
+    t20 = t15 ^ ((t15 ^ t19) & a0)
+    t21 = t5 ^ ones
+    t22 = t4 ^ ((t4 ^ t21) & a1)
+    t23 = t22 ^ ((t22 ^ t13) & a2)
+    t24 = t21 | a1
+    t25 = t8 | na4
+    t26 = t9 ^ ones
+    t27 = t25 ^ ((t25 ^ t26) & a1)
+    t28 = t24 ^ ((t24 ^ t27) & a2)
+    t29 = t23 ^ ((t23 ^ t28) & a3)
+    t30 = t4 ^ ones
+    t31 = t30 ^ ((t30 ^ t4) & a1)
+    t32 = t13 ^ ones
+    t33 = t31 ^ ((t31 ^ t32) & a2)
+    t34 = t1 ^ ((t1 ^ t12) & a1)
+    t35 = t27 ^ ones
+    t36 = t34 ^ ((t34 ^ t35) & a2)
+    t37 = t33 ^ ((t33 ^ t36) & a3)
+    t38 = t29 ^ ((t29 ^ t37) & a0)
+    t39 = t10 ^ ((t10 ^ t26) & a1)
+    t40 = t25 ^ ((t25 ^ t10) & a1)
+    t41 = t39 ^ ((t39 ^ t40) & a2)
+    t42 = t21 ^ ((t21 ^ t2) & a1)
+    t43 = t42 ^ ones
+    t44 = t42 ^ ((t42 ^ t43) & a2)
+    t45 = t41 ^ ((t41 ^ t44) & a3)
+    t46 = t34 ^ ones
+    t47 = t10 ^ ones
+    t48 = t46 ^ ((t46 ^ t47) & a2)
+    t49 = t10 ^ ((t10 ^ t25) & a1)
+    t50 = t6 ^ ((t6 ^ t49) & a2)
+    t51 = t48 ^ ((t48 ^ t50) & a3)
+    t52 = t45 ^ ((t45 ^ t51) & a0)
+    t53 = t31 ^ ones
+    t54 = t53 ^ ((t53 ^ t32) & a2)
+    t55 = t13 ^ ((t13 ^ t31) & a2)
+    t56 = t54 ^ ((t54 ^ t55) & a3)
+    t57 = t1 ^ ((t1 ^ t9) & a1)
+    t58 = t2 ^ ((t2 ^ t5) & a1)
+    t59 = t57 ^ ((t57 ^ t58) & a2)
+    t60 = t49 ^ ones
+    t61 = t10 ^ ((t10 ^ t21) & a1)
+    t62 = t60 ^ ((t60 ^ t61) & a2)
+    t63 = t59 ^ ((t59 ^ t62) & a3)
+    t64 = t56 ^ ((t56 ^ t63) & a0)
+    return t20, t38, t52, t64
+
+
+def sbox3(a0, a1, a2, a3, a4, a5, ones):
+    t0 = ones & a4
+    na1 = a1 ^ ones
+    t2 = t0 & na1
+    t3 = ones & a1
+    t4 = t2 ^ ((t2 ^ t3) & a2)
+    t5 = t0 ^ ones
+    t6 = t0 | na1
+    t7 = t5 ^ ((t5 ^ t6) & a2)
+    t8 = t4 ^ ((t4 ^ t7) & a3)
+    t9 = t3 ^ ones
+    t10 = t5 ^ ((t5 ^ t9) & a2)
+    t11 = t5 ^ ((t5 ^ t0) & a1)
+    t12 = t11 ^ ones
+    t13 = t11 ^ ((t11 ^ t12) & a2)
+    t14 = t10 ^ ((t10 ^ t13) & a3)
+    t15 = t8 ^ ((t8 ^ t14) & a0)
+    t16 = t5 ^ ones
+    t17 = t9 ^ ((t9 ^ t16) & a2)
+    t18 = t11 ^ ((t11 ^ t3) & a2)
+    t19 = t17 ^ ((t17 ^ t18) & a3)
+    t20 = t12 ^ ((t12 ^ t5) & a2)
+    t21 = t0 & a1
+    t22 = t21 ^ ((t21 ^ t6) & a2)
+    t23 = t20 ^ ((t20 ^ t22) & a3)
+    t24 = t19 ^ ((t19 ^ t23) & a0)
+    t25 = t15 ^ ((t15 ^ t24) & a5)
+    t26 = t15 ^ ones
+    t27 = t24 ^ ((t24 ^ t26) & a5)
+    t28 = t13 ^ ((t13 ^ t17) & a3)
+    t29 = t21 ^ ones
+    t30 = t29 ^ ((t29 ^ t16) & a2)
+    t31 = t5 & na1
+    t32 = t3 ^ ((t3 ^ t31) & a2)
+    t33 = t30 ^ ((t30 ^ t32) & a3)
+    t34 = t28 ^ ((t28 ^ t33) & a0)
+    t35 = t5 ^ ((t5 ^ t12) & a2)
+    t36 = t22 ^ ((t22 ^ t35) & a3)
+    t37 = t9 ^ ((t9 ^ t11) & a2)
+    t38 = t10 ^ ones
+    t39 = t37 ^ ((t37 ^ t38) & a3)
+    t40 = t36 ^ ((t36 ^ t39) & a0)
+    t41 = t34 ^ ((t34 ^ t40) & a5)
+    t42 = t40 ^ ones
+    t43 = t42 ^ ((t42 ^ t34) & a5)
+    return t25, t27, t41, t43
+
+
+def sbox4(a0, a1, a2, a3, a4, a5, ones):
+    t0 = ones & a4
+    na0 = a0 ^ ones
+    t2 = t0 & na0
+    t3 = t2 ^ ones
+    t4 = t2 ^ ((t2 ^ t3) & a1)
+    t5 = t0 | a0
+    t6 = t5 ^ ones
+    t7 = t5 ^ ((t5 ^ t6) & a1)
+    t8 = t4 ^ ((t4 ^ t7) & a2)
+    t9 = t0 & a0
+    na1 = a1 ^ ones
+    t11 = t9 | na1
+    t12 = t0 ^ ones
+    t13 = t0 ^ ((t0 ^ t12) & a0)
+    t14 = t9 ^ ((t9 ^ t13) & a1)
+    t15 = t11 ^ ((t11 ^ t14) & a2)
+    t16 = t8 ^ ((t8 ^ t15) & a5)
+    t17 = t13 ^ ones
+    t18 = t0 | na0
+    t19 = t17 ^ ((t17 ^ t18) & a1)
+    t20 = t14 ^ ((t14 ^ t19) & a2)
+    t21 = t13 ^ ((t13 ^ t18) & a1)
+    t22 = t17 ^ ((t17 ^ t6) & a1)
+    t23 = t21 ^ ((t21 ^ t22) & a2)
+    t24 = t20 ^ ((t20 ^ t23) & a5)
+    t25 = t16 ^ ((t16 ^ t24) & a3)
+    t26 = t17 ^ ((t17 ^ t12) & a1)
+    t27 = t13 ^ ((t13 ^ t26) & a2)
+    t28 = t6 ^ ((t6 ^ t3) & a1)
+    t29 = t18 ^ ((t18 ^ t9) & a1)
+    t30 = t28 ^ ((t28 ^ t29) & a2)
+    t31 = t27 ^ ((t27 ^ t30) & a5)
+    t32 = t7 ^ ones
+    t33 = t13 ^ ((t13 ^ t17) & a1)
+    t34 = t32 ^ ((t32 ^ t33) & a2)
+    t35 = t34 ^ ones
+    t36 = t34 ^ ((t34 ^ t35) & a5)
+    t37 = t31 ^ ((t31 ^ t36) & a3)
+    t38 = t21 ^ ones
+    t39 = t9 ^ ones
+    t40 = ones & a0
+    t41 = t39 ^ ((t39 ^ t40) & a1)
+    t42 = t38 ^ ((t38 ^ t41) & a2)
+    t43 = t12 ^ ones
+    t44 = t43 ^ ((t43 ^ t12) & a1)
+    t45 = t41 ^ ((t41 ^ t44) & a2)
+    t46 = t42 ^ ((t42 ^ t45) & a5)
+    t47 = t41 ^ ones
+    t48 = t14 ^ ones
+    t49 = t47 ^ ((t47 ^ t48) & a2)
+    t50 = t40 ^ ones
+    t51 = t17 ^ ((t17 ^ t50) & a1)
+    t52 = t18 ^ ones
+    t53 = t52 ^ ((t52 ^ t43) & a1)
+    t54 = t51 ^ ((t51 ^ t53) & a2)
+    t55 = t49 ^ ((t49 ^ t54) & a5)
+    t56 = t46 ^ ((t46 ^ t55) & a3)
+    t57 = t5 & a1
+    t58 = t13 ^ ones
+    t59 = t57 ^ ((t57 ^ t58) & a2)
+    t60 = t13 ^ ((t13 ^ t50) & a1)
+    t61 = t33 ^ ((t33 ^ t60) & a2)
+    t62 = t59 ^ ((t59 ^ t61) & a5)
+    t63 = t5 ^ ((t5 ^ t18) & a1)
+    t64 = t12 ^ ((t12 ^ t2) & a1)
+    t65 = t63 ^ ((t63 ^ t64) & a2)
+    t66 = t9 ^ ((t9 ^ t17) & a1)
+    t67 = t18 ^ ((t18 ^ t40) & a1)
+    t68 = t66 ^ ((t66 ^ t67) & a2)
+    t69 = t65 ^ ((t65 ^ t68) & a5)
+    t70 = t62 ^ ((t62 ^ t69) & a3)
+    return t25, t37, t56, t70
+
+
+def sbox5(a0, a1, a2, a3, a4, a5, ones):
+    na1 = a1 ^ ones
+    t1 = ones & na1
+    na5 = a5 ^ ones
+    t3 = ones & na5
+    t4 = t3 ^ ones
+    t5 = t3 ^ ((t3 ^ t4) & a1)
+    t6 = t1 ^ ((t1 ^ t5) & a0)
+    t7 = t3 & na1
+    t8 = t5 ^ ((t5 ^ t7) & a0)
+    t9 = t6 ^ ((t6 ^ t8) & a3)
+    t10 = t5 ^ ones
+    t11 = t10 ^ ((t10 ^ t5) & a0)
+    t12 = t11 ^ ones
+    t13 = t11 ^ ((t11 ^ t12) & a3)
+    t14 = t9 ^ ((t9 ^ t13) & a4)
+    t15 = t4 & na1
+    t16 = t3 ^ ((t3 ^ t15) & a0)
+    t17 = t15 | a0
+    t18 = t16 ^ ((t16 ^ t17) & a3)
+    t19 = t3 ^ ones
+    t20 = t19 ^ ((t19 ^ t3) & a0)
+    t21 = t15 ^ ones
+    t22 = t21 ^ ((t21 ^ t19) & a0)
+    t23 = t20 ^ ((t20 ^ t22) & a3)
+    t24 = t18 ^ ((t18 ^ t23) & a4)
+    t25 = t14 ^ ((t14 ^ t24) & a2)
+    t26 = t12 ^ ((t12 ^ t20) & a3)
+    t27 = t4 | na1
+    t28 = t21 ^ ((t21 ^ t27) & a0)
+    t29 = t11 ^ ((t11 ^ t28) & a3)
+    t30 = t26 ^ ((t26 ^ t29) & a4)
+    t31 = t4 & a1
+    t32 = t10 ^ ((t10 ^ t31) & a0)
+    t33 = t3 ^ ((t3 ^ t1) & a0)
+    t34 = t32 ^ ((t32 ^ t33) & a3)
+    t35 = t1 ^ ones
+    t36 = t15 ^ ((t15 ^ t35) & a0)
+    t37 = t10 ^ ((t10 ^ t36) & a3)
+    t38 = t34 ^ ((t34 ^ t37) & a4)
+    t39 = t30 ^ ((t30 ^ t38) & a2)
+    t40 = t33 ^ ones
+    t41 = t40 ^ ((t40 ^ t33) & a3)
+    t42 = t15 ^ ((t15 ^ t27) & a0)
+    t43 = t27 ^ ((t27 ^ t35) & a0)
+    t44 = t42 ^ ((t42 ^ t43) & a3)
+    t45 = t41 ^ ((t41 ^ t44) & a4)
+    t46 = t17 ^ ones
+    t47 = t27 ^ ones
+    t48 = t31 ^ ones
+    t49 = t47 ^ ((t47 ^ t48) & a0)
+    t50 = t46 ^ ((t46 ^ t49) & a3)
+    t51 = t13 ^ ((t13 ^ t50) & a4)
+    t52 = t45 ^ ((t45 ^ t51) & a2)
+    t53 = t21 & a0
+    t54 = t35 ^ ((t35 ^ t5) & a0)
+    t55 = t53 ^ ((t53 ^ t54) & a3)
+    t56 = t53 ^ ones
+    t57 = t7 ^ ((t7 ^ t5) & a0)
+    t58 = t56 ^ ((t56 ^ t57) & a3)
+    t59 = t55 ^ ((t55 ^ t58) & a4)
+    t60 = t54 ^ ones
+    t61 = t57 ^ ones
+    t62 = t60 ^ ((t60 ^ t61) & a3)
+    t63 = t6 ^ ones
+    t64 = t63 ^ ((t63 ^ t11) & a3)
+    t65 = t62 ^ ((t62 ^ t64) & a4)
+    t66 = t59 ^ ((t59 ^ t65) & a2)
+    return t25, t39, t52, t66
+
+
+def sbox6(a0, a1, a2, a3, a4, a5, ones):
+    t0 = ones & a4
+    t1 = t0 ^ ones
+    t2 = t0 ^ ((t0 ^ t1) & a2)
+    t3 = t0 | a2
+    t4 = t2 ^ ((t2 ^ t3) & a3)
+    t5 = t3 ^ ones
+    t6 = t0 ^ ((t0 ^ t5) & a3)
+    t7 = t4 ^ ((t4 ^ t6) & a1)
+    t8 = t2 ^ ones
+    t9 = t8 ^ ((t8 ^ t2) & a3)
+    t10 = t8 ^ ((t8 ^ t9) & a1)
+    t11 = t7 ^ ((t7 ^ t10) & a5)
+    t12 = t1 & a2
+    t13 = t12 ^ ones
+    t14 = t12 ^ ((t12 ^ t13) & a3)
+    na2 = a2 ^ ones
+    t16 = ones & na2
+    t17 = t16 ^ ((t16 ^ t2) & a3)
+    t18 = t14 ^ ((t14 ^ t17) & a1)
+    t19 = t0 & na2
+    t20 = t1 | na2
+    t21 = t19 ^ ((t19 ^ t20) & a3)
+    t22 = t0 ^ ones
+    t23 = t22 ^ ((t22 ^ t0) & a3)
+    t24 = t21 ^ ((t21 ^ t23) & a1)
+    t25 = t18 ^ ((t18 ^ t24) & a5)
+    t26 = t11 ^ ((t11 ^ t25) & a0)
+    t27 = t8 ^ ones
+    t28 = t23 ^ ((t23 ^ t27) & a1)
+    t29 = t22 ^ ((t22 ^ t19) & a3)
+    t30 = t8 ^ ((t8 ^ t13) & a3)
+    t31 = t29 ^ ((t29 ^ t30) & a1)
+    t32 = t28 ^ ((t28 ^ t31) & a5)
+    t33 = t2 ^ ((t2 ^ t0) & a3)
+    t34 = t8 ^ ((t8 ^ t33) & a1)
+    t35 = t7 ^ ((t7 ^ t34) & a5)
+    t36 = t32 ^ ((t32 ^ t35) & a0)
+    t37 = t2 ^ ((t2 ^ t16) & a3)
+    t38 = t37 ^ ((t37 ^ t9) & a1)
+    t39 = t13 & a3
+    t40 = t20 ^ ones
+    na3 = a3 ^ ones
+    t42 = t40 | na3
+    t43 = t39 ^ ((t39 ^ t42) & a1)
+    t44 = t38 ^ ((t38 ^ t43) & a5)
+    t45 = t19 ^ ones
+    t46 = t40 ^ ((t40 ^ t45) & a3)
+    t47 = t16 ^ ((t16 ^ t8) & a3)
+    t48 = t46 ^ ((t46 ^ t47) & a1)
+    t49 = t16 ^ ones
+    t50 = t16 ^ ((t16 ^ t49) & a3)
+    t51 = t47 ^ ones
+    t52 = t50 ^ ((t50 ^ t51) & a1)
+    t53 = t48 ^ ((t48 ^ t52) & a5)
+    t54 = t44 ^ ((t44 ^ t53) & a0)
+    t55 = t2 ^ ((t2 ^ t40) & a3)
+    t56 = t22 ^ ((t22 ^ t13) & a3)
+    t57 = t55 ^ ((t55 ^ t56) & a1)
+    t58 = t55 ^ ones
+    t59 = t58 ^ ((t58 ^ t6) & a1)
+    t60 = t57 ^ ((t57 ^ t59) & a5)
+    t61 = t57 ^ ones
+    t62 = t9 ^ ones
+    t63 = t62 ^ ((t62 ^ t17) & a1)
+    t64 = t61 ^ ((t61 ^ t63) & a5)
+    t65 = t60 ^ ((t60 ^ t64) & a0)
+    return t26, t36, t54, t65
+
+
+def sbox7(a0, a1, a2, a3, a4, a5, ones):
+    t0 = ones & a3
+    na2 = a2 ^ ones
+    t2 = t0 | na2
+    t3 = t0 ^ ones
+    t4 = t3 ^ ((t3 ^ t0) & a2)
+    t5 = t2 ^ ((t2 ^ t4) & a1)
+    t6 = t2 ^ ones
+    t7 = ones & na2
+    t8 = t6 ^ ((t6 ^ t7) & a1)
+    t9 = t5 ^ ((t5 ^ t8) & a4)
+    t10 = t7 ^ ones
+    t11 = t4 ^ ones
+    t12 = t10 ^ ((t10 ^ t11) & a1)
+    t13 = t3 ^ ones
+    t14 = t3 ^ ((t3 ^ t13) & a1)
+    t15 = t12 ^ ((t12 ^ t14) & a4)
+    t16 = t9 ^ ((t9 ^ t15) & a0)
+    t17 = t11 ^ ((t11 ^ t4) & a1)
+    t18 = t7 ^ ((t7 ^ t11) & a1)
+    t19 = t17 ^ ((t17 ^ t18) & a4)
+    t20 = t13 ^ ((t13 ^ t7) & a1)
+    t21 = t18 ^ ones
+    t22 = t20 ^ ((t20 ^ t21) & a4)
+    t23 = t19 ^ ((t19 ^ t22) & a0)
+    t24 = t16 ^ ((t16 ^ t23) & a5)
+    t25 = t20 ^ ones
+    t26 = t11 ^ ((t11 ^ t13) & a1)
+    t27 = t25 ^ ((t25 ^ t26) & a4)
+    t28 = t8 ^ ones
+    t29 = t28 ^ ((t28 ^ t8) & a4)
+    t30 = t27 ^ ((t27 ^ t29) & a0)
+    t31 = t27 ^ ones
+    t32 = t14 ^ ones
+    t33 = t17 ^ ((t17 ^ t32) & a4)
+    t34 = t31 ^ ((t31 ^ t33) & a0)
+    t35 = t30 ^ ((t30 ^ t34) & a5)
+    t36 = t10 ^ ((t10 ^ t7) & a1)
+    t37 = t36 ^ ((t36 ^ t14) & a4)
+    t38 = t17 ^ ones
+    t39 = t26 ^ ones
+    t40 = t38 ^ ((t38 ^ t39) & a4)
+    t41 = t37 ^ ((t37 ^ t40) & a0)
+    t42 = t0 & na2
+    t43 = t10 ^ ((t10 ^ t42) & a1)
+    t44 = t0 | a2
+    t45 = t3 ^ ((t3 ^ t44) & a1)
+    t46 = t43 ^ ((t43 ^ t45) & a4)
+    t47 = t43 ^ ones
+    t48 = t0 & a2
+    t49 = t11 ^ ((t11 ^ t48) & a1)
+    t50 = t47 ^ ((t47 ^ t49) & a4)
+    t51 = t46 ^ ((t46 ^ t50) & a0)
+    t52 = t41 ^ ((t41 ^ t51) & a5)
+    t53 = t23 ^ ones
+    t54 = t2 ^ ((t2 ^ t48) & a1)
+    t55 = t3 ^ ((t3 ^ t7) & a1)
+    t56 = t54 ^ ((t54 ^ t55) & a4)
+    t57 = t48 ^ ones
+    t58 = t57 & a1
+    t59 = t58 ^ ((t58 ^ t28) & a4)
+    t60 = t56 ^ ((t56 ^ t59) & a0)
+    t61 = t53 ^ ((t53 ^ t60) & a5)
+    return t24, t35, t52, t61
+
+
+SBOX_FUNCS = (sbox0, sbox1, sbox2, sbox3, sbox4, sbox5, sbox6, sbox7)
@@ -1,9 +1,15 @@
+from Lab1_2.cipher_primitives.DES.des_bitslice import BitslicedDESEngine
+from Lab1_2.cipher_primitives.DES.des_numpy import NUMPY_AVAILABLE, NumpyDESEngine
 from Lab1_2.cipher_primitives.DES.DESKeySchedule import DESKeySchedule
-from Lab1_2.cipher_primitives.DES.DESRoundFunction import DESRoundFunction
+from Lab1_2.cipher_primitives.DES.DESRoundFunction import DESSPRoundFunction
 from Lab1_2.feistel_cipher import FeistelCipher
-from Lab1_2.utility.bitperm import bitperm
+from Lab1_2.utility.bitperm import compile_bitperm
 
 MASK_28_BITS = (1 << 28) - 1
+MASK_32_BITS = (1 << 32) - 1
+# меньше блоков выгоднее шифровать по одному, чем пакетным движком
+BATCH_MIN_BLOCKS = 64
+BATCH_BACKENDS = ("auto", "numpy", "bitslice")
 
 
 class DES(FeistelCipher):
@@ -31,9 +37,14 @@ class DES(FeistelCipher):
         33, 1, 41, 9, 49, 17, 57, 25
     ]
     # fmt: on
-    def __init__(self):
+    _IP_PERM = compile_bitperm(IP, 8)
+    _FP_PERM = compile_bitperm(FP, 8)
+
+    def __init__(self, batch_backend: str = "auto"):
+        """batch_backend - движок encrypt_blocks: numpy, bitslice или auto."""
+        self.batch_backend = check_batch_backend(batch_backend)
         key_schedule = DESKeySchedule()
-        round_function = DESRoundFunction()
+        round_function = DESSPRoundFunction()
 
         super().__init__(
             key_schedule=key_schedule,
@@ -41,6 +52,11 @@ class DES(FeistelCipher):
             block_size=8,
             num_rounds=16,
         )
+        self._batch_engines = None
+
+    def setup_keys(self, key: bytes) -> None:
+        super().setup_keys(key)
+        self._batch_engines = None
 
     def encrypt_block(self, block: bytes) -> bytes:
         """
@@ -52,28 +68,59 @@ class DES(FeistelCipher):
         """
         if len(block) != 8:
             raise ValueError("Block must be 8 bytes (64 bits)")
-        permuted = bitperm(block, self.IP, msb_first=True, one_based_indexing=True)
-        feistel_output = super().encrypt_block(permuted)
-        L16 = feistel_output[:4]
-        R16 = feistel_output[4:]
-        preoutput = R16 + L16
-
-        ciphertext = bitperm(
-            preoutput, self.FP, msb_first=True, one_based_indexing=True
-        )
-
-        return ciphertext
+        return self.encrypt_int(int.from_bytes(block, "big")).to_bytes(8, "big")
 
     def decrypt_block(self, block: bytes) -> bytes:
         if len(block) != 8:
             raise ValueError("Block must be 8 bytes (64 bits)")
-        permuted = bitperm(
-            block, self.IP, msb_first=True, one_based_indexing=True
-        )
-        L, R = permuted[:4], permuted[4:]
-        core_input = R + L
-        core = super().decrypt_block(core_input)
-        plaintext = bitperm(
-            core, self.FP, msb_first=True, one_based_indexing=True
-        )
-        return plaintext
\ No newline at end of file
+        return self.decrypt_int(int.from_bytes(block, "big")).to_bytes(8, "big")
+
+    def encrypt_int(self, block: int) -> int:
+        """encrypt_block для 64-битного целого: bytes не создаются вовсе."""
+        permuted = self._IP_PERM.apply_int(block)
+        L16, R16 = self._encrypt_halves(permuted >> 32, permuted & MASK_32_BITS)
+        return self._FP_PERM.apply_int((R16 << 32) | L16)
+
+    def decrypt_int(self, block: int) -> int:
+        permuted = self._IP_PERM.apply_int(block)
+        L, R = self._decrypt_halves(permuted & MASK_32_BITS, permuted >> 32)
+        return self._FP_PERM.apply_int((L << 32) | R)
+
+    def encrypt_blocks(self, data: bytes) -> bytes:
+        """Шифрование подряд идущих независимых блоков (как ECB без паддинга)."""
+        return self._crypt_blocks(data, decrypt=False)
+
+    def decrypt_blocks(self, data: bytes) -> bytes:
+        return self._crypt_blocks(data, decrypt=True)
+
+    def _crypt_blocks(self, data: bytes, decrypt: bool) -> bytes:
+        if len(data) % 8 != 0:
+            raise ValueError("Data length must be a multiple of 8 bytes")
+        if len(data) < BATCH_MIN_BLOCKS * 8:
+            crypt = self.decrypt_int if decrypt else self.encrypt_int
+            return b"".join(
+                crypt(int.from_bytes(data[i : i + 8], "big")).to_bytes(8, "big")
+                for i in range(0, len(data), 8)
+            )
+        if self._batch_engines is None:
+            keys = list(self._int_round_keys)
+            self._batch_engines = (
+                create_batch_engine([keys], self.batch_backend),
+                create_batch_engine([keys[::-1]], self.batch_backend),
+            )
+        return self._batch_engines[decrypt].crypt_blocks(data)
+
+
+def check_batch_backend(backend: str) -> str:
+    if backend not in BATCH_BACKENDS:
+        raise ValueError(f"batch_backend must be one of {BATCH_BACKENDS}")
+    if backend == "numpy" and not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is not installed")
+    return backend
+
+
+def create_batch_engine(key_passes: list[list[int]], backend: str = "auto"):
+    """Пакетный движок DES: NumPy, если он есть (или запрошен), иначе битслайс."""
+    if backend == "numpy" or (backend == "auto" and NUMPY_AVAILABLE):
+        return NumpyDESEngine(key_passes, DES._IP_PERM, DES._FP_PERM)
+    return BitslicedDESEngine(key_passes, DES.IP, DES.FP)
@@ -0,0 +1,95 @@
+"""
+Векторизованный DES на NumPy: N блоков как массив uint64 формы (N,).
+
+IP/FP - сбор по байтовым таблицам CompiledBitPerm, раунд - E сдвигами и
+масками плюс 8 выборок из SP-таблиц DESSPRoundFunction над всем массивом.
+NumPy - необязательная зависимость: без него NUMPY_AVAILABLE == False.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None
+
+from Lab1_2.cipher_primitives.DES.DESRoundFunction import DESSPRoundFunction
+from Lab1_2.utility.bitperm import CompiledBitPerm
+
+NUMPY_AVAILABLE = np is not None
+
+# столько блоков обрабатывается за раз: массивы помещаются в кэш процессора
+DEFAULT_CHUNK_BLOCKS = 1 << 14
+
+
+class NumpyDESEngine:
+    """
+    key_passes - как у BitslicedDESEngine: наборы по 16 раундовых ключей
+    (48-битные целые) в порядке применения, между наборами - обмен половин.
+    """
+
+    def __init__(
+        self,
+        key_passes: list[list[int]],
+        ip_perm: CompiledBitPerm,
+        fp_perm: CompiledBitPerm,
+        chunk_blocks: int = DEFAULT_CHUNK_BLOCKS,
+    ):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for NumpyDESEngine")
+        self.chunk_blocks = chunk_blocks
+        self._ip = np.array(ip_perm.tables, dtype=np.uint64)
+        self._fp = np.array(fp_perm.tables, dtype=np.uint64)
+        self._sp = [np.array(t, dtype=np.uint32) for t in DESSPRoundFunction.SP]
+        # шестерки раундовых ключей: k_i = (K >> (42 - 6i)) & 0x3F
+        self._passes = [
+            [
+                [np.uint32((k >> (42 - 6 * i)) & 0x3F) for i in range(8)]
+                for k in round_keys
+            ]
+            for round_keys in key_passes
+        ]
+
+    def crypt_blocks(self, data: bytes) -> bytes:
+        if len(data) % 8 != 0:
+            raise ValueError("Data length must be a multiple of 8 bytes")
+        blocks = np.frombuffer(data, dtype=">u8").astype(np.uint64)
+        return self.crypt_array(blocks).astype(">u8").tobytes()
+
+    def crypt_array(self, blocks):
+        """Шифрует массив uint64 формы (N,) (блоки как big-endian целые)."""
+        out = np.empty_like(blocks)
+        for start in range(0, len(blocks), self.chunk_blocks):
+            stop = start + self.chunk_blocks
+            out[start:stop] = self._crypt_chunk(blocks[start:stop])
+        return out
+
+    @staticmethod
+    def _permute(tables, x):
+        # столбец i - i-й (со старшего) байт каждого блока
+        data = x.astype(">u8").view(np.uint8).reshape(-1, 8)
+        result = tables[0][data[:, 0]]
+        for i in range(1, 8):
+            result |= tables[i][data[:, i]]
+        return result
+
+    def _crypt_chunk(self, x):
+        u = np.uint32
+        mask6 = u(0x3F)
+        sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = self._sp
+
+        x = self._permute(self._ip, x)
+        L, R = (x >> np.uint64(32)).astype(u), x.astype(u)
+        for rounds in self._passes:
+            for k0, k1, k2, k3, k4, k5, k6, k7 in rounds:
+                # шестерки E(R): первая R32 R1..R5, последняя R28..R32 R1
+                f = np.take(sp0, (((R << u(5)) & u(0x20)) | (R >> u(27))) ^ k0)
+                f |= np.take(sp1, ((R >> u(23)) ^ k1) & mask6)
+                f |= np.take(sp2, ((R >> u(19)) ^ k2) & mask6)
+                f |= np.take(sp3, ((R >> u(15)) ^ k3) & mask6)
+                f |= np.take(sp4, ((R >> u(11)) ^ k4) & mask6)
+                f |= np.take(sp5, ((R >> u(7)) ^ k5) & mask6)
+                f |= np.take(sp6, ((R >> u(3)) ^ k6) & mask6)
+                f |= np.take(sp7, (((R << u(1)) | (R >> u(31))) ^ k7) & mask6)
+                L, R = R, L ^ f
+            L, R = R, L
+        preoutput = (L.astype(np.uint64) << np.uint64(32)) | R.astype(np.uint64)
+        return self._permute(self._fp, preoutput)
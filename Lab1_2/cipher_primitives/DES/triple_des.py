@@ -1,17 +1,34 @@
 from Lab1_2.utility.interfaces import ISymmetricCipher
-from Lab1_2.cipher_primitives.DES.des_cipher import DES
+from Lab1_2.cipher_primitives.DES.des_cipher import (
+    BATCH_MIN_BLOCKS,
+    DES,
+    MASK_32_BITS,
+    check_batch_backend,
+    create_batch_engine,
+)
+from Lab1_2.cipher_primitives.DES.DESKeySchedule import DESKeySchedule
+from Lab1_2.cipher_primitives.DES.DESRoundFunction import DESSPRoundFunction
 
 
 class TripleDES(ISymmetricCipher):
+    """
+    Слитое ядро 3DES: IP один раз, три прохода по 16 раундов Фейстеля
+    (FP∘IP между ступенями взаимно уничтожаются), затем FP один раз.
+    Порядок раундовых ключей для EDE/EEE выбирается в setup_keys.
+    """
+
     block_size = 8
 
-    def __init__(self, mode: str = "EDE") -> None:
+    def __init__(self, mode: str = "EDE", batch_backend: str = "auto") -> None:
         if mode not in ("EDE", "EEE"):
             raise ValueError("mode must be 'EDE' or 'EEE'")
         self.mode = mode
-        self._des1 = DES()
-        self._des2 = DES()
-        self._des3 = DES()
+        self.batch_backend = check_batch_backend(batch_backend)
+        self._key_schedule = DESKeySchedule()
+        self._round_function = DESSPRoundFunction()
+        self._encrypt_passes = ()
+        self._decrypt_passes = ()
+        self._batch_engines = None
         self._is_3key = False
 
     def setup_keys(self, key: bytes) -> None:
@@ -33,36 +50,69 @@ class TripleDES(ISymmetricCipher):
             k3 = k1
             self._is_3key = False
 
-        self._des1.setup_keys(k1)
-        self._des2.setup_keys(k2)
-        self._des3.setup_keys(k3)
-
-    def encrypt_block(self, block: bytes) -> bytes:
-        if len(block) != self.block_size:
-            raise ValueError("Block must be 8 bytes")
+        rk1, rk2, rk3 = (self._expand(k) for k in (k1, k2, k3))
+        # D_K(x) - те же раунды DES с ключами в обратном порядке
         if self.mode == "EDE":
             # EDE: E(K1) -> D(K2) -> E(K3)
-            b1 = self._des1.encrypt_block(block)
-            b2 = self._des2.decrypt_block(b1)
-            b3 = self._des3.encrypt_block(b2)
+            self._encrypt_passes = (rk1, rk2[::-1], rk3)
+            self._decrypt_passes = (rk3[::-1], rk2, rk1[::-1])
         else:
             # EEE: E(K1) -> E(K2) -> E(K3)
-            b1 = self._des1.encrypt_block(block)
-            b2 = self._des2.encrypt_block(b1)
-            b3 = self._des3.encrypt_block(b2)
-        return b3
+            self._encrypt_passes = (rk1, rk2, rk3)
+            self._decrypt_passes = (rk3[::-1], rk2[::-1], rk1[::-1])
+        self._batch_engines = None
+
+    def _expand(self, key: bytes) -> tuple:
+        prepare = self._round_function.prepare_key
+        return tuple(prepare(k) for k in self._key_schedule.expand_key(key))
+
+    def encrypt_block(self, block: bytes) -> bytes:
+        if len(block) != self.block_size:
+            raise ValueError("Block must be 8 bytes")
+        x = int.from_bytes(block, "big")
+        return self._crypt_int(x, self._encrypt_passes).to_bytes(8, "big")
 
     def decrypt_block(self, block: bytes) -> bytes:
         if len(block) != self.block_size:
             raise ValueError("Block must be 8 bytes")
-        if self.mode == "EDE":
-            # inverse EDE: D(K3) -> E(K2) -> D(K1)
-            b1 = self._des3.decrypt_block(block)
-            b2 = self._des2.encrypt_block(b1)
-            b3 = self._des1.decrypt_block(b2)
-        else:
-            # inverse EEE: D(K3) -> D(K2) -> D(K1)
-            b1 = self._des3.decrypt_block(block)
-            b2 = self._des2.decrypt_block(b1)
-            b3 = self._des1.decrypt_block(b2)
-        return b3
+        x = int.from_bytes(block, "big")
+        return self._crypt_int(x, self._decrypt_passes).to_bytes(8, "big")
+
+    def encrypt_int(self, block: int) -> int:
+        return self._crypt_int(block, self._encrypt_passes)
+
+    def decrypt_int(self, block: int) -> int:
+        return self._crypt_int(block, self._decrypt_passes)
+
+    def encrypt_blocks(self, data: bytes) -> bytes:
+        return self._crypt_blocks(data, decrypt=False)
+
+    def decrypt_blocks(self, data: bytes) -> bytes:
+        return self._crypt_blocks(data, decrypt=True)
+
+    def _crypt_int(self, block: int, passes: tuple) -> int:
+        apply = self._round_function.apply_int
+        permuted = DES._IP_PERM.apply_int(block)
+        L, R = permuted >> 32, permuted & MASK_32_BITS
+        for round_keys in passes:
+            for k in round_keys:
+                L, R = R, L ^ apply(R, k)
+            L, R = R, L
+        return DES._FP_PERM.apply_int((L << 32) | R)
+
+    def _crypt_blocks(self, data: bytes, decrypt: bool) -> bytes:
+        if len(data) % self.block_size != 0:
+            raise ValueError("Data length must be a multiple of 8 bytes")
+        passes = self._decrypt_passes if decrypt else self._encrypt_passes
+        if len(data) < BATCH_MIN_BLOCKS * 8:
+            return b"".join(
+                self._crypt_int(int.from_bytes(data[i : i + 8], "big"), passes)
+                .to_bytes(8, "big")
+                for i in range(0, len(data), 8)
+            )
+        if self._batch_engines is None:
+            self._batch_engines = (
+                create_batch_engine(self._encrypt_passes, self.batch_backend),
+                create_batch_engine(self._decrypt_passes, self.batch_backend),
+            )
+        return self._batch_engines[decrypt].crypt_blocks(data)
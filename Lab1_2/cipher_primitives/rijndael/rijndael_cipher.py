@@ -2,14 +2,17 @@ from Lab1_2.cipher_primitives.rijndael.sbox import SBox
 from Lab1_2.cipher_primitives.rijndael.rijndael_key_schedule import (
     RijndaelKeyScheduler,
 )
-from Lab1_2.cipher_primitives.rijndael.rijndael_round_func import (
-    sub_bytes,
-    shift_rows,
-    mix_columns,
-    add_round_key,
+from Lab1_2.cipher_primitives.rijndael.rijndael_numpy import (
+    NUMPY_AVAILABLE,
+    NumpyRijndaelEngine,
 )
+from Lab1_2.cipher_primitives.rijndael.rijndael_ttable import RijndaelTTableEngine
 from Lab1_2.utility.interfaces import ISymmetricCipher
 
+# с этого числа блоков encrypt_blocks уходит в NumPy (если он выбран)
+BATCH_MIN_BLOCKS = 16
+BATCH_BACKENDS = ("auto", "numpy", "table")
+
 
 class RijndaelCipher(ISymmetricCipher):
     @staticmethod
@@ -20,8 +23,18 @@ class RijndaelCipher(ISymmetricCipher):
         return max_nk_nb + 6
 
     def __init__(
-        self, block_size: int, key_size: int, mod_poly: int = 0x11B, mode=None
+        self,
+        block_size: int,
+        key_size: int,
+        mod_poly: int = 0x11B,
+        mode=None,
+        batch_backend: str = "auto",
     ):
+        """batch_backend - движок encrypt_blocks: numpy, table (T-таблицы) или auto."""
+        if batch_backend not in BATCH_BACKENDS:
+            raise ValueError(f"batch_backend must be one of {BATCH_BACKENDS}")
+        if batch_backend == "numpy" and not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is not installed")
         if block_size not in (16, 24, 32):
             raise ValueError(f"Invalid block size: {block_size}")
         if key_size not in (16, 24, 32):
@@ -30,13 +43,17 @@ class RijndaelCipher(ISymmetricCipher):
         self.block_size = block_size
         self.key_size = key_size
         self.mod_poly = mod_poly
+        self.batch_backend = batch_backend
 
         self.num_rounds = RijndaelCipher._calculate_num_rounds(
             self.block_size, self.key_size
         )
 
         self.round_keys = None
+        self.inverse_round_keys = None
         self.sbox = None
+        self._engine = None
+        self._batch_engine = None
 
     def setup_keys(self, key: bytes):
         if len(key) != self.key_size:
@@ -45,85 +62,52 @@ class RijndaelCipher(ISymmetricCipher):
             )
 
         if self.sbox is None:
-            self.sbox = SBox(self.mod_poly)
+            self.sbox = SBox.get(self.mod_poly)
 
         keygen = RijndaelKeyScheduler(
             self.block_size, self.key_size, self.sbox, self.mod_poly
         )
         self.round_keys = keygen.expand_key(key)
+        self.inverse_round_keys = keygen.expand_inverse_key(key)
+        self._engine = RijndaelTTableEngine(
+            self.sbox, self.block_size, self.round_keys, self.inverse_round_keys
+        )
+        self._batch_engine = None
+        if self.batch_backend != "table" and NUMPY_AVAILABLE:
+            self._batch_engine = NumpyRijndaelEngine(
+                self.sbox, self.block_size, self.round_keys
+            )
 
     def encrypt_block(self, plaintext: bytes) -> bytes:
         if len(plaintext) != self.block_size:
             raise ValueError(
                 f"Block size mismatch: expected {self.block_size}, got {len(plaintext)}"
             )
-        if self.round_keys is None or self.sbox is None:
+        if self._engine is None:
             raise ValueError("Key not set")
-
-        round_keys = self.round_keys
-        sbox = self.sbox
-
-        nb = self.block_size // 4
-
-        # bytes -> state
-        state = [bytearray(nb) for _ in range(4)]
-        for i in range(4):
-            for j in range(nb):
-                state[i][j] = plaintext[j * 4 + i]
-
-        state = add_round_key(state, round_keys[0])
-
-        for r in range(1, self.num_rounds):
-            state = sub_bytes(state, sbox, False)
-            state = shift_rows(state, False)
-            state = mix_columns(state, self.mod_poly, False)
-            state = add_round_key(state, round_keys[r])
-
-        state = sub_bytes(state, sbox, False)
-        state = shift_rows(state, False)
-        state = add_round_key(state, round_keys[self.num_rounds])
-
-        # state -> bytes
-        ciphertext = bytearray(self.block_size)
-        for i in range(4):
-            for j in range(nb):
-                ciphertext[j * 4 + i] = state[i][j]
-
-        return bytes(ciphertext)
+        return self._engine.encrypt_block(plaintext)
 
     def decrypt_block(self, ciphertext: bytes) -> bytes:
         if len(ciphertext) != self.block_size:
             raise ValueError(
                 f"Block size mismatch: expected {self.block_size}, got {len(ciphertext)}"
             )
-        if self.round_keys is None or self.sbox is None:
+        if self._engine is None:
             raise ValueError("Key not set")
+        return self._engine.decrypt_block(ciphertext)
 
-        round_keys = self.round_keys
-        sbox = self.sbox
-
-        nb = self.block_size // 4
-
-        state = [bytearray(nb) for _ in range(4)]
-        for i in range(4):
-            for j in range(nb):
-                state[i][j] = ciphertext[j * 4 + i]
+    def encrypt_blocks(self, data: bytes) -> bytes:
+        return self._select_batch_engine(data).encrypt_blocks(data)
 
-        state = add_round_key(state, round_keys[self.num_rounds])
+    def decrypt_blocks(self, data: bytes) -> bytes:
+        return self._select_batch_engine(data).decrypt_blocks(data)
 
-        for r in range(self.num_rounds - 1, 0, -1):
-            state = shift_rows(state, True)
-            state = sub_bytes(state, sbox, True)
-            state = add_round_key(state, round_keys[r])
-            state = mix_columns(state, self.mod_poly, True)
-
-        state = shift_rows(state, True)
-        state = sub_bytes(state, sbox, True)
-        state = add_round_key(state, round_keys[0])
-
-        plaintext = bytearray(self.block_size)
-        for i in range(4):
-            for j in range(nb):
-                plaintext[j * 4 + i] = state[i][j]
-
-        return bytes(plaintext)
+    def _select_batch_engine(self, data: bytes):
+        if self._engine is None:
+            raise ValueError("Key not set")
+        if self._batch_engine is not None and (
+            self.batch_backend == "numpy"
+            or len(data) >= BATCH_MIN_BLOCKS * self.block_size
+        ):
+            return self._batch_engine
+        return self._engine
@@ -1,6 +1,27 @@
+import struct
+from functools import lru_cache
+
+from Lab1_2.cipher_primitives.rijndael.rijndael_round_func import INV_MIX_MATRIX
 from Lab1_2.cipher_primitives.rijndael.sbox import SBox
 from Lab1_2.services.galois_service import GField
 from Lab1_2.utility.interfaces import IKeySchedule
+from Lab1_2.utility.lru_cache import LRUCache
+
+MASK_32_BITS = 0xFFFFFFFF
+
+# наибольший индекс Rcon: Nb = 8, Nk = 4 -> 120 слов / 4
+_MAX_RCON = 30
+
+# Общий кэш расписаний: (block_size, key_size, mod_poly, key) ->
+# (раундовые ключи, ключи эквивалентного обратного шифра)
+RIJNDAEL_KEY_CACHE = LRUCache(maxsize=1024)
+
+
+@lru_cache(maxsize=None)
+def rcon_table(mod_poly: int) -> tuple[int, ...]:
+    """Rcon[i] = x^(i-1) в поле по модулю mod_poly, Rcon[0] = 0."""
+    field = GField.field(mod_poly)
+    return (0,) + tuple(field.pow(0x02, i - 1) for i in range(1, _MAX_RCON + 1))
 
 
 class RijndaelKeyScheduler(IKeySchedule):
@@ -18,57 +39,59 @@ class RijndaelKeyScheduler(IKeySchedule):
         self.mod_poly = mod_poly
 
     def expand_key(self, key: bytes) -> list[bytes]:
+        return list(self._expand_cached(key)[0])
+
+    def expand_inverse_key(self, key: bytes) -> list[bytes]:
+        """
+        Ключи эквивалентного обратного шифра: к ключам раундов 1..Nr-1
+        применен InvMixColumns, порядок тот же, что у expand_key.
+        """
+        return list(self._expand_cached(key)[1])
+
+    def _expand_cached(self, key: bytes) -> tuple:
         if len(key) != self.key_size:
             raise ValueError("Key size mismatch")
+        cache_key = (self.block_size, self.key_size, self.mod_poly, bytes(key))
+        return RIJNDAEL_KEY_CACHE.get_or_compute(cache_key, lambda: self._expand(key))
 
+    def _expand(self, key: bytes) -> tuple[tuple[bytes, ...], tuple[bytes, ...]]:
         nk = self.key_size // 4
         nb = self.block_size // 4
         nr = RijndaelKeyScheduler._calculate_num_rounds(self.block_size, self.key_size)
+        rcon = rcon_table(self.mod_poly)
 
-        # w - массив слов (каждое слово - 4 байта)
+        # w - массив слов (слово - 32-битное целое, байт строки 0 - старший)
         total_words = nb * (nr + 1)
-        w = [bytearray(4) for _ in range(total_words)]
-
-        for i in range(nk):
-            w[i] = bytearray(key[4*i : 4*i+4])
+        w = list(struct.unpack(f">{nk}I", key))
 
         for i in range(nk, total_words):
-            temp = bytearray(w[i-1])
+            temp = w[i - 1]
 
             if i % nk == 0:
-                temp = self._sub_word(self._rot_word(temp))
-                rcon_val = self._rcon(i // nk)
-                temp[0] ^= rcon_val
+                temp = self._sub_word(self._rot_word(temp)) ^ (rcon[i // nk] << 24)
             elif nk > 6 and (i % nk == 4):
                 temp = self._sub_word(temp)
 
-            for j in range(4):
-                w[i][j] = w[i-nk][j] ^ temp[j]
-
-        round_keys = []
-        for r in range(nr + 1):
-            rk = bytearray(nb * 4)
-            for c in range(nb):
-                word = w[r * nb + c]
-                for row in range(4):
-                    rk[c*4 + row] = word[row]
-            round_keys.append(bytes(rk))
-
-        return round_keys
-
-    def _rot_word(self, word: bytearray) -> bytearray:
-        return bytearray([word[1], word[2], word[3], word[0]])
-
-    def _sub_word(self, word: bytearray) -> bytearray:
-        res = bytearray(4)
-        for i in range(4):
-            res[i] = self.sbox.sub(word[i])
-        return res
-
-    def _rcon(self, i: int) -> int:
-        if i == 0:
-            return 0
-        val = 1
-        for _ in range(1, i):
-            val = GField.multiply(val, 0x02, self.mod_poly)
-        return val
+            w.append(w[i - nk] ^ temp)
+
+        # раундовый ключ - nb слов подряд (столбец c -> байты rk[c*4 .. c*4+3])
+        pack = struct.Struct(f">{nb}I").pack
+        round_keys = tuple(pack(*w[r * nb : (r + 1) * nb]) for r in range(nr + 1))
+        inverse_keys = (
+            round_keys[:1]
+            + tuple(self._inv_mix_columns(rk) for rk in round_keys[1:nr])
+            + round_keys[nr:]
+        )
+        return round_keys, inverse_keys
+
+    def _rot_word(self, word: int) -> int:
+        return ((word << 8) | (word >> 24)) & MASK_32_BITS
+
+    def _sub_word(self, word: int) -> int:
+        return int.from_bytes(
+            word.to_bytes(4, "big").translate(self.sbox.forward), "big"
+        )
+
+    def _inv_mix_columns(self, round_key: bytes) -> bytes:
+        # столбцы ключа - подряд идущие 4-байтные векторы
+        return GField.matvec_bulk(INV_MIX_MATRIX, round_key, self.mod_poly)
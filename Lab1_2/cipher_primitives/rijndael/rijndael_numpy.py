@@ -0,0 +1,118 @@
+"""
+Векторизованный Rijndael на NumPy: N блоков как массив uint8 формы (N, 4, Nb),
+state[n, r, c] - строка r, столбец c n-го блока.
+
+SubBytes - выборка из таблицы S-блока, ShiftRows - заранее вычисленная
+перестановка, MixColumns - через таблицу xtime, AddRoundKey - XOR
+с ключом (4, Nb), растянутым на все блоки.
+NumPy - необязательная зависимость: без него NUMPY_AVAILABLE == False.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None
+
+from Lab1_2.cipher_primitives.rijndael.rijndael_round_func import (
+    ROW_SHIFTS,
+    mix_tables,
+)
+from Lab1_2.cipher_primitives.rijndael.sbox import SBox
+
+NUMPY_AVAILABLE = np is not None
+
+# столько блоков обрабатывается за раз
+DEFAULT_CHUNK_BLOCKS = 1 << 13
+
+
+class NumpyRijndaelEngine:
+    def __init__(
+        self,
+        sbox: SBox,
+        block_size: int,
+        round_keys: list[bytes],
+        chunk_blocks: int = DEFAULT_CHUNK_BLOCKS,
+    ):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for NumpyRijndaelEngine")
+        nb = block_size // 4
+        self.nb = nb
+        self.block_size = block_size
+        self.chunk_blocks = chunk_blocks
+        self._s = np.frombuffer(sbox.forward, dtype=np.uint8)
+        self._si = np.frombuffer(sbox.inverse, dtype=np.uint8)
+        self._xtime = np.frombuffer(mix_tables(sbox.mod_poly)[0], dtype=np.uint8)
+        # rk[c*4 + r] -> (4, Nb)
+        self._keys = [
+            np.frombuffer(rk, dtype=np.uint8).reshape(nb, 4).T.copy()
+            for rk in round_keys
+        ]
+
+        shifts = ROW_SHIFTS[nb]
+        # индексы в развернутом (4 * Nb) состоянии, откуда берется каждый байт
+        self._shift = np.array(
+            [r * nb + (c - shifts[r]) % nb for r in range(4) for c in range(nb)]
+        )
+        self._inv_shift = np.array(
+            [r * nb + (c + shifts[r]) % nb for r in range(4) for c in range(nb)]
+        )
+
+    def encrypt_blocks(self, data: bytes) -> bytes:
+        return self._crypt_bytes(data, self.encrypt_array)
+
+    def decrypt_blocks(self, data: bytes) -> bytes:
+        return self._crypt_bytes(data, self.decrypt_array)
+
+    def _crypt_bytes(self, data: bytes, crypt) -> bytes:
+        if len(data) % self.block_size != 0:
+            raise ValueError(
+                f"Data length must be a multiple of {self.block_size} bytes"
+            )
+        blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, self.nb, 4)
+        out = np.empty_like(blocks)
+        for start in range(0, len(blocks), self.chunk_blocks):
+            chunk = blocks[start : start + self.chunk_blocks].transpose(0, 2, 1)
+            out[start : start + self.chunk_blocks] = crypt(chunk).transpose(0, 2, 1)
+        return out.tobytes()
+
+    def encrypt_array(self, state):
+        """Шифрует массив uint8 формы (N, 4, Nb), возвращает новый массив."""
+        keys = self._keys
+        state = state ^ keys[0]
+        for rk in keys[1:-1]:
+            state = self._shift_rows(self._s[state], self._shift)
+            state = self._mix_columns(state)
+            state ^= rk
+        state = self._shift_rows(self._s[state], self._shift)
+        state ^= keys[-1]
+        return state
+
+    def decrypt_array(self, state):
+        keys = self._keys
+        state = state ^ keys[-1]
+        for rk in keys[-2:0:-1]:
+            state = self._si[self._shift_rows(state, self._inv_shift)]
+            state ^= rk
+            state = self._inv_mix_columns(state)
+        state = self._si[self._shift_rows(state, self._inv_shift)]
+        state ^= keys[0]
+        return state
+
+    def _shift_rows(self, state, gather):
+        n = state.shape[0]
+        return state.reshape(n, -1)[:, gather].reshape(n, 4, self.nb)
+
+    def _mix_columns(self, state):
+        # a_r' = 2a_r ^ 3a_{r+1} ^ a_{r+2} ^ a_{r+3} = a_r ^ t ^ xtime(a_r ^ a_{r+1}),
+        # t - XOR всех четырех байтов столбца
+        t = np.bitwise_xor.reduce(state, axis=1, keepdims=True)
+        pairs = state ^ np.roll(state, -1, axis=1)
+        return state ^ t ^ self._xtime[pairs]
+
+    def _inv_mix_columns(self, state):
+        # InvMixColumns = MixColumns(05 00 04 00 - предобработка):
+        # a_0 ^= u, a_2 ^= u, a_1 ^= v, a_3 ^= v, u = 4(a_0 ^ a_2), v = 4(a_1 ^ a_3)
+        xtime = self._xtime
+        uv = xtime[xtime[state[:, 0:2] ^ state[:, 2:4]]]
+        state = state ^ np.concatenate((uv, uv), axis=1)
+        return self._mix_columns(state)
@@ -1,84 +1,82 @@
+"""
+Шаги раунда Rijndael над плоским состоянием.
+
+Состояние - один bytearray по столбцам, как во входном блоке:
+state[c * 4 + r] - строка r, столбец c. Все функции меняют его на месте.
+"""
+
+from functools import lru_cache
+from operator import itemgetter
+
 from Lab1_2.cipher_primitives.rijndael.sbox import SBox
 from Lab1_2.services.galois_service import GField
 
-
-def sub_bytes(state: list[bytearray], sbox: SBox, inverse: bool) -> list[bytearray]:
-    nb = len(state[0])
-    result = [bytearray(nb) for _ in range(4)]
-
-    for i in range(4):
-        for j in range(nb):
-            val = state[i][j]
-            if inverse:
-                result[i][j] = sbox.inv_sub(val)
-            else:
-                result[i][j] = sbox.sub(val)
-    return result
-
-
-def shift_rows(state: list[bytearray], inverse: bool) -> list[bytearray]:
-    nb = len(state[0])
-    result = [bytearray(nb) for _ in range(4)]
-
-    if nb == 4:
-        shifts = [0, 1, 2, 3]
-    elif nb == 6:
-        shifts = [0, 1, 2, 3]
-    else:  # nb == 8
-        shifts = [0, 1, 3, 4]
-
-    for r in range(4):
-        shift = shifts[r]
-        for c in range(nb):
-            if inverse:
-                source_col = (c + shift) % nb
-
-            else:
-                source_col = (c - shift + nb) % nb
-
-            result[r][c] = state[r][source_col]
-
-    return result
-
-
-def mix_columns(
-    state: list[bytearray], mod_poly: int, inverse: bool
-) -> list[bytearray]:
-    nb = len(state[0])
-    result = [bytearray(nb) for _ in range(4)]
-
-    if inverse:
-        matrix = [
-            [0x0E, 0x0B, 0x0D, 0x09],
-            [0x09, 0x0E, 0x0B, 0x0D],
-            [0x0D, 0x09, 0x0E, 0x0B],
-            [0x0B, 0x0D, 0x09, 0x0E],
-        ]
-    else:
-        matrix = [
-            [0x02, 0x03, 0x01, 0x01],
-            [0x01, 0x02, 0x03, 0x01],
-            [0x01, 0x01, 0x02, 0x03],
-            [0x03, 0x01, 0x01, 0x02],
-        ]
-
-    for c in range(nb):
-        for r in range(4):
-            sum_val = 0
-            for k in range(4):
-                prod = GField.multiply(matrix[r][k], state[k][c], mod_poly)
-                sum_val ^= prod
-            result[r][c] = sum_val
-
-    return result
-
-
-def add_round_key(state: list[bytearray], round_key: bytes) -> list[bytearray]:
-    nb = len(state[0])
-    result = [bytearray(nb) for _ in range(4)]
-
-    for i in range(4):
-        for j in range(nb):
-            result[i][j] = state[i][j] ^ round_key[j * 4 + i]
-
-    return result
+# сдвиги строк ShiftRows для Nb = 4, 6, 8
+ROW_SHIFTS = {4: (0, 1, 2, 3), 6: (0, 1, 2, 3), 8: (0, 1, 3, 4)}
+
+# матрицы MixColumns / InvMixColumns по строкам
+MIX_MATRIX = (
+    (0x02, 0x03, 0x01, 0x01),
+    (0x01, 0x02, 0x03, 0x01),
+    (0x01, 0x01, 0x02, 0x03),
+    (0x03, 0x01, 0x01, 0x02),
+)
+INV_MIX_MATRIX = (
+    (0x0E, 0x0B, 0x0D, 0x09),
+    (0x09, 0x0E, 0x0B, 0x0D),
+    (0x0D, 0x09, 0x0E, 0x0B),
+    (0x0B, 0x0D, 0x09, 0x0E),
+)
+
+
+@lru_cache(maxsize=None)
+def mix_tables(mod_poly: int) -> tuple[bytes, ...]:
+    """Таблицы умножения на 2, 3, 9, 11, 13, 14 в поле по модулю mod_poly."""
+    field = GField.field(mod_poly)
+    return tuple(field.mul_row(m) for m in (0x02, 0x03, 0x09, 0x0B, 0x0D, 0x0E))
+
+
+@lru_cache(maxsize=None)
+def _shift_rows_gather(nb: int, inverse: bool) -> itemgetter:
+    """Откуда берется каждый байт плоского состояния после ShiftRows."""
+    shifts = ROW_SHIFTS[nb]
+    sign = 1 if inverse else -1
+    return itemgetter(
+        *(((c + sign * shifts[r]) % nb) * 4 + r for c in range(nb) for r in range(4))
+    )
+
+
+def sub_bytes(state: bytearray, sbox: SBox, inverse: bool) -> None:
+    state[:] = state.translate(sbox.inverse if inverse else sbox.forward)
+
+
+def shift_rows(state: bytearray, inverse: bool) -> None:
+    state[:] = bytes(_shift_rows_gather(len(state) // 4, inverse)(state))
+
+
+def mix_columns(state: bytearray, mod_poly: int, inverse: bool) -> None:
+    mul2 = mix_tables(mod_poly)[0]
+
+    for c in range(0, len(state), 4):
+        a0, a1, a2, a3 = state[c : c + 4]
+        if inverse:
+            # InvMixColumns = MixColumns после шага u = 4(a0 ^ a2), v = 4(a1 ^ a3)
+            u = mul2[mul2[a0 ^ a2]]
+            v = mul2[mul2[a1 ^ a3]]
+            a0 ^= u
+            a1 ^= v
+            a2 ^= u
+            a3 ^= v
+        # 2a ^ 3b ^ c ^ d = a ^ t ^ xtime(a ^ b), t - XOR всего столбца
+        t = a0 ^ a1 ^ a2 ^ a3
+        state[c] = a0 ^ t ^ mul2[a0 ^ a1]
+        state[c + 1] = a1 ^ t ^ mul2[a1 ^ a2]
+        state[c + 2] = a2 ^ t ^ mul2[a2 ^ a3]
+        state[c + 3] = a3 ^ t ^ mul2[a3 ^ a0]
+
+
+def add_round_key(state: bytearray, round_key: bytes) -> None:
+    n = len(state)
+    state[:] = (
+        int.from_bytes(state, "big") ^ int.from_bytes(round_key, "big")
+    ).to_bytes(n, "big")
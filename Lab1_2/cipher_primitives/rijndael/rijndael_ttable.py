@@ -0,0 +1,144 @@
+"""
+Табличная (T-table) реализация раундов Rijndael.
+
+Столбец состояния - 32-битное слово (байт строки 0 - старший). Раунд
+SubBytes + ShiftRows + MixColumns сводится к четырем выборкам из таблиц
+Te0..Te3 и XOR на столбец; расшифрование - эквивалентный обратный шифр
+с таблицами Td0..Td3 и ключами, к которым заранее применен InvMixColumns.
+Таблицы строятся по S-блоку и модулю, поэтому работают для любых
+неприводимых mod_poly и Nb = 4, 6, 8.
+"""
+
+import struct
+
+from Lab1_2.cipher_primitives.rijndael.rijndael_round_func import (
+    INV_MIX_MATRIX,
+    MIX_MATRIX,
+    ROW_SHIFTS,
+    mix_tables,
+)
+from Lab1_2.cipher_primitives.rijndael.sbox import SBox
+
+# столбцы матриц MixColumns / InvMixColumns (Te_i / Td_i - i-й столбец)
+_MIX_COLUMNS = tuple(zip(*MIX_MATRIX))
+_INV_MIX_COLUMNS = tuple(zip(*INV_MIX_MATRIX))
+
+_TABLES_CACHE: dict[int, tuple] = {}
+
+
+def _column_table(values: bytes, column: tuple, mod_poly: int) -> tuple:
+    mul2, mul3, mul9, mul11, mul13, mul14 = mix_tables(mod_poly)
+    # None в translate - тождественная таблица (умножение на 1)
+    rows = {0x01: None, 0x02: mul2, 0x03: mul3, 0x09: mul9, 0x0B: mul11,
+            0x0D: mul13, 0x0E: mul14}
+    m0, m1, m2, m3 = (values.translate(rows[m]) for m in column)
+    return tuple(
+        (m0[x] << 24) | (m1[x] << 16) | (m2[x] << 8) | m3[x] for x in range(256)
+    )
+
+
+def get_ttables(sbox: SBox) -> tuple:
+    """(Te, Td, S, InvS) для модуля S-блока; строятся один раз на модуль."""
+    tables = _TABLES_CACHE.get(sbox.mod_poly)
+    if tables is None:
+        forward, inverse = sbox.forward, sbox.inverse
+        te = tuple(_column_table(forward, c, sbox.mod_poly) for c in _MIX_COLUMNS)
+        td = tuple(
+            _column_table(inverse, c, sbox.mod_poly) for c in _INV_MIX_COLUMNS
+        )
+        tables = _TABLES_CACHE.setdefault(sbox.mod_poly, (te, td, forward, inverse))
+    return tables
+
+
+class RijndaelTTableEngine:
+    def __init__(
+        self,
+        sbox: SBox,
+        block_size: int,
+        round_keys: list[bytes],
+        inverse_round_keys: list[bytes],
+    ):
+        """inverse_round_keys - ключи эквивалентного обратного шифра (InvMixColumns)."""
+        nb = block_size // 4
+        self.block_size = block_size
+        self._args = (sbox, block_size, tuple(round_keys), tuple(inverse_round_keys))
+        self._te, self._td, self._s, self._si = get_ttables(sbox)
+        self._struct = struct.Struct(f">{nb}I")
+
+        shifts = ROW_SHIFTS[nb]
+        # для столбца c - номера столбцов, откуда ShiftRows берет строки 0..3
+        self._enc_src = tuple(
+            tuple((c - shifts[r]) % nb for r in range(4)) for c in range(nb)
+        )
+        self._dec_src = tuple(
+            tuple((c + shifts[r]) % nb for r in range(4)) for c in range(nb)
+        )
+
+        self._enc_keys = [self._struct.unpack(rk) for rk in round_keys]
+        self._dec_keys = [self._struct.unpack(rk) for rk in inverse_round_keys[::-1]]
+
+    def __reduce__(self):
+        # struct.Struct не сериализуется: в другом процессе (пул PROCESS)
+        # движок строится заново, таблицы берутся из кэша модуля
+        return RijndaelTTableEngine, self._args
+
+    def encrypt_block(self, block: bytes) -> bytes:
+        words = self._crypt_words(
+            self._struct.unpack(block), self._te, self._s, self._enc_src,
+            self._enc_keys,
+        )
+        return self._struct.pack(*words)
+
+    def decrypt_block(self, block: bytes) -> bytes:
+        words = self._crypt_words(
+            self._struct.unpack(block), self._td, self._si, self._dec_src,
+            self._dec_keys,
+        )
+        return self._struct.pack(*words)
+
+    def encrypt_blocks(self, data: bytes) -> bytes:
+        return self._crypt_blocks(
+            data, self._te, self._s, self._enc_src, self._enc_keys
+        )
+
+    def decrypt_blocks(self, data: bytes) -> bytes:
+        return self._crypt_blocks(
+            data, self._td, self._si, self._dec_src, self._dec_keys
+        )
+
+    def _crypt_blocks(self, data, tables, sbox, src, keys) -> bytes:
+        if len(data) % self.block_size != 0:
+            raise ValueError(
+                f"Data length must be a multiple of {self.block_size} bytes"
+            )
+        pack = self._struct.pack
+        crypt = self._crypt_words
+        return b"".join(
+            pack(*crypt(words, tables, sbox, src, keys))
+            for words in self._struct.iter_unpack(data)
+        )
+
+    @staticmethod
+    def _crypt_words(words, tables, sbox, src, keys) -> list[int]:
+        t0, t1, t2, t3 = tables
+        w = [x ^ k for x, k in zip(words, keys[0])]
+        for rk in keys[1:-1]:
+            w = [
+                t0[w[a] >> 24]
+                ^ t1[(w[b] >> 16) & 0xFF]
+                ^ t2[(w[c] >> 8) & 0xFF]
+                ^ t3[w[d] & 0xFF]
+                ^ k
+                for (a, b, c, d), k in zip(src, rk)
+            ]
+        # последний раунд без MixColumns
+        return [
+            (
+                (sbox[w[a] >> 24] << 24)
+                | (sbox[(w[b] >> 16) & 0xFF] << 16)
+                | (sbox[(w[c] >> 8) & 0xFF] << 8)
+                | sbox[w[d] & 0xFF]
+            )
+            ^ k
+            for (a, b, c, d), k in zip(src, keys[-1])
+        ]
@@ -1,22 +1,78 @@
+import os
+import threading
+from typing import Optional
+
 from Lab1_2.services.galois_service import GField
 
+# каталог дискового кэша таблиц (None - не использовать)
+_cache_dir: Optional[str] = None
+
+_registry: dict[int, "SBox"] = {}
+_registry_lock = threading.Lock()
+
+
+def set_cache_dir(path: Optional[str]) -> None:
+    """Каталог, где хранятся сгенерированные таблицы S-блоков между запусками."""
+    global _cache_dir
+    _cache_dir = path
+
 
 class SBox:
+    """
+    S-блок Rijndael для модуля mod_poly. Таблицы forward/inverse - bytes
+    по 256 байт (годятся для bytes.translate). Общий экземпляр на модуль -
+    SBox.get(mod_poly).
+    """
+
     def __init__(self, mod_poly: int):
         self.mod_poly = mod_poly
-        self._forward = None
-        self._inverse = None
+        tables = self._load_cached(mod_poly)
+        if tables is None:
+            tables = self._generate(mod_poly)
+            self._store_cached(mod_poly, tables)
+        self.forward, self.inverse = tables
 
-    def _initialize(self):
-        if self._forward is not None:
-            return
+    @classmethod
+    def get(cls, mod_poly: int) -> "SBox":
+        sbox = _registry.get(mod_poly)
+        if sbox is None:
+            with _registry_lock:
+                sbox = _registry.get(mod_poly)
+                if sbox is None:
+                    sbox = _registry[mod_poly] = cls(mod_poly)
+        return sbox
+
+    def __reduce__(self):
+        # в другом процессе берем экземпляр из его реестра
+        return SBox.get, (self.mod_poly,)
+
+    @staticmethod
+    def _generate(mod_poly: int) -> tuple[bytes, bytes]:
+        field = GField.field(mod_poly)
+        forward = SBox._forward_table(field)
+        inverse = bytearray(256)
+
+        for s in range(256):
+
+            val = s
+
+            b = ((val << 1) | (val >> 7)) & 0xFF
+            b ^= ((val << 3) | (val >> 5)) & 0xFF
+            b ^= ((val << 6) | (val >> 2)) & 0xFF
+            b ^= 0x05
 
-        self._forward = bytearray(256)
-        self._inverse = bytearray(256)
+            inverse[s] = field.inv[b]
+
+        return forward, bytes(inverse)
+
+    @staticmethod
+    def _forward_table(field) -> bytes:
+        """Прямая таблица: обратный элемент поля + аффинное преобразование."""
+        forward = bytearray(256)
 
         for i in range(256):
 
-            b = 0 if i == 0 else GField.inverse(i, self.mod_poly)
+            b = field.inv[i]
 
             s = b
             s ^= ((b << 1) | (b >> 7)) & 0xFF
@@ -25,25 +81,56 @@ class SBox:
             s ^= ((b << 4) | (b >> 4)) & 0xFF
             s ^= 0x63
 
-            self._forward[i] = s
-
-        for s in range(256):
+            forward[i] = s
 
-            val = s
+        return bytes(forward)
 
-            b = ((val << 1) | (val >> 7)) & 0xFF
-            b ^= ((val << 3) | (val >> 5)) & 0xFF
-            b ^= ((val << 6) | (val >> 2)) & 0xFF
-            b ^= 0x05
+    @staticmethod
+    def _cache_path(mod_poly: int) -> Optional[str]:
+        if _cache_dir is None:
+            return None
+        return os.path.join(_cache_dir, f"sbox_{mod_poly:03x}.bin")
 
-            inv_b = 0 if b == 0 else GField.inverse(b, self.mod_poly)
+    @staticmethod
+    def _load_cached(mod_poly: int) -> Optional[tuple[bytes, bytes]]:
+        path = SBox._cache_path(mod_poly)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        forward, inverse = data[:256], data[256:]
+        # файлу не доверяем: прямая таблица пересчитывается (256 выборок)
+        # и сверяется, так что битый, чужой или устаревший файл отбрасывается
+        expected = SBox._forward_table(GField.field(mod_poly))
+        if (
+            len(data) != 512
+            or forward != expected
+            or any(inverse[forward[x]] != x for x in range(256))
+        ):
+            return None
+        return forward, inverse
 
-            self._inverse[s] = inv_b
+    @staticmethod
+    def _store_cached(mod_poly: int, tables: tuple[bytes, bytes]) -> None:
+        path = SBox._cache_path(mod_poly)
+        if path is None:
+            return
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(_cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(tables[0] + tables[1])
+            os.replace(tmp_path, path)
+        except OSError:
+            # кэш необязателен
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def sub(self, val: int) -> int:
-        self._initialize()
-        return self._forward[val]
+        return self.forward[val]
 
     def inv_sub(self, val: int) -> int:
-        self._initialize()
-        return self._inverse[val]
+        return self.inverse[val]
@@ -1,6 +1,9 @@
 from Lab1_2.utility.interfaces import ISymmetricCipher, IKeySchedule, IRoundFunction
 from Lab1_2.utility.utility import xor_bytes
 
+# формат memoryview для пословного разбора половин блоков
+_HALF_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
 
 class FeistelCipher(ISymmetricCipher):
     def __init__(
@@ -12,11 +15,22 @@ class FeistelCipher(ISymmetricCipher):
     ):
         if block_size % 2 != 0:
             raise ValueError("Block size must be even")
+        half_size = block_size // 2
+        # раундовую функцию не меняем: ширину половины хранит сам шифр
+        if round_function.half_size not in (None, half_size):
+            raise ValueError(
+                f"Round function works on {round_function.half_size}-byte halves, "
+                f"block size is {block_size}"
+            )
         self.key_schedule = key_schedule
         self.round_function = round_function
         self.block_size = block_size
+        self.half_size = half_size
         self.num_rounds = num_rounds
         self.round_keys = []
+        self._int_round_keys = ()
+        self._half_bits = half_size * 8
+        self._half_mask = (1 << self._half_bits) - 1
 
     def setup_keys(self, key: bytes) -> None:
         self.round_keys = self.key_schedule.expand_key(key)
@@ -25,6 +39,11 @@ class FeistelCipher(ISymmetricCipher):
                 f"Key schedule must generate at least {self.num_rounds} round keys, "
                 f"but generated {len(self.round_keys)}"
             )
+        if self.round_function.int_native or self.round_function.batch_native:
+            self._int_round_keys = tuple(
+                self.round_function.prepare_key(k)
+                for k in self.round_keys[: self.num_rounds]
+            )
 
     def encrypt_block(self, block: bytes) -> bytes:
         """
@@ -32,9 +51,13 @@ class FeistelCipher(ISymmetricCipher):
         """
         if len(block) != self.block_size:
             raise ValueError(f"Block size must be {self.block_size} bytes")
-        half_size = self.block_size // 2
-        L = block[:half_size]
-        R = block[half_size:]
+        if self.round_function.int_native:
+            x = int.from_bytes(block, "big")
+            L, R = self._encrypt_halves(x >> self._half_bits, x & self._half_mask)
+            return ((L << self._half_bits) | R).to_bytes(self.block_size, "big")
+
+        L = block[: self.half_size]
+        R = block[self.half_size :]
 
         for i in range(self.num_rounds):
             L_old = L
@@ -45,12 +68,71 @@ class FeistelCipher(ISymmetricCipher):
     def decrypt_block(self, block: bytes) -> bytes:
         if len(block) != self.block_size:
             raise ValueError(f"Block size must be {self.block_size} bytes")
-        half = self.block_size // 2
-        L, R = block[:half], block[half:]
+        if self.round_function.int_native:
+            x = int.from_bytes(block, "big")
+            L, R = self._decrypt_halves(x >> self._half_bits, x & self._half_mask)
+            return ((L << self._half_bits) | R).to_bytes(self.block_size, "big")
+
+        L, R = block[: self.half_size], block[self.half_size :]
 
         for i in range(self.num_rounds - 1, -1, -1):
             temp = L
             L = xor_bytes(R, self.round_function.apply(L, self.round_keys[i]))
             R = temp
 
-        return L + R
\ No newline at end of file
+        return L + R
+
+    def _encrypt_halves(self, L: int, R: int) -> tuple[int, int]:
+        """Раунды Фейстеля над половинами-целыми (для int_native функций)."""
+        apply = self.round_function.apply_int
+        for k in self._int_round_keys:
+            L, R = R, L ^ apply(R, k)
+        return L, R
+
+    def _decrypt_halves(self, L: int, R: int) -> tuple[int, int]:
+        apply = self.round_function.apply_int
+        for k in reversed(self._int_round_keys):
+            L, R = R ^ apply(L, k), L
+        return L, R
+
+    def encrypt_blocks(self, data: bytes) -> bytes:
+        if not self._batch_rounds_supported():
+            return super().encrypt_blocks(data)
+        L, R = self._split_halves(data)
+        apply = self.round_function.apply_many
+        for k in self._int_round_keys:
+            L, R = R, xor_bytes(L, apply(R, k))
+        return self._join_halves(L, R)
+
+    def decrypt_blocks(self, data: bytes) -> bytes:
+        if not self._batch_rounds_supported():
+            return super().decrypt_blocks(data)
+        L, R = self._split_halves(data)
+        apply = self.round_function.apply_many
+        for k in reversed(self._int_round_keys):
+            L, R = xor_bytes(R, apply(L, k)), L
+        return self._join_halves(L, R)
+
+    def _batch_rounds_supported(self) -> bool:
+        """Раунд над всеми блоками сразу: F вызывается num_rounds раз на весь буфер."""
+        return (
+            self.round_function.batch_native
+            and self.half_size in _HALF_FORMATS
+        )
+
+    def _split_halves(self, data: bytes) -> tuple[bytes, bytes]:
+        """Блоки -> (все левые половины подряд, все правые половины подряд)."""
+        if len(data) % self.block_size != 0:
+            raise ValueError(
+                f"Data length must be a multiple of {self.block_size} bytes"
+            )
+        words = memoryview(data).cast(_HALF_FORMATS[self.half_size])
+        return words[0::2].tobytes(), words[1::2].tobytes()
+
+    def _join_halves(self, L: bytes, R: bytes) -> bytes:
+        fmt = _HALF_FORMATS[self.half_size]
+        out = bytearray(len(L) + len(R))
+        words = memoryview(out).cast(fmt)
+        words[0::2] = memoryview(L).cast(fmt)
+        words[1::2] = memoryview(R).cast(fmt)
+        return bytes(out)
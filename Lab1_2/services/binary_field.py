@@ -0,0 +1,180 @@
+"""
+Арифметика в двоичных полях GF(2^n) с произвольным неприводимым модулем
+(GF(2^32), GF(2^64), GF(2^128) для MAC и универсального хеширования).
+
+Элементы - целые 0 <= a < 2^n (бит i - коэффициент при x^i).
+Умножение - безпереносное оконное (по 4 бита) с последующей редукцией:
+для разреженных модулей (трех- и пятичленов) - сдвигами по ненулевым
+членам, для остальных - по 8 бит через таблицу. Умножение на
+фиксированный элемент (ключ) - таблицы Шоупа, см. BinaryField.multiplier.
+"""
+
+from Lab1_2.services.galois_service import GField, ReducibleModulusError
+
+# модуль считается разреженным, если у него не больше стольких членов
+SPARSE_MAX_TERMS = 5
+
+
+class BinaryField:
+    def __init__(self, modulus: int):
+        degree = modulus.bit_length() - 1
+        if degree < 1 or not GField.is_irreducible(modulus):
+            raise ReducibleModulusError(f"Модуль 0x{modulus:X} приводим!")
+
+        self.modulus = modulus
+        self.degree = degree
+        self.mask = (1 << degree) - 1
+        self.order = 1 << degree
+
+        tail = modulus & self.mask
+        self._tail_exponents = tuple(i for i in range(degree) if (tail >> i) & 1)
+        # свертка за пару проходов, только если младшие члены не выше x^(n/2)
+        self.sparse = (
+            len(self._tail_exponents) + 1 <= SPARSE_MAX_TERMS
+            and max(self._tail_exponents, default=0) <= degree // 2
+        )
+        if not self.sparse:
+            # (t * x^n) mod f для старших 8 бит t
+            self._reduce_table = tuple(
+                self._reduce_bitwise(t << degree) for t in range(256)
+            )
+
+    @classmethod
+    def of_degree(cls, degree: int) -> "BinaryField":
+        """Поле GF(2^degree) с самым разреженным из найденных модулей."""
+        return cls(GField.find_irreducible(degree))
+
+    def _check(self, a: int) -> int:
+        if a < 0 or a >> self.degree:
+            raise ValueError(f"Element must be in [0, 2^{self.degree})")
+        return a
+
+    def add(self, a: int, b: int) -> int:
+        return self._check(a) ^ self._check(b)
+
+    def multiply(self, a: int, b: int) -> int:
+        self._check(a)
+        self._check(b)
+        if a == 0 or b == 0:
+            return 0
+        # окно 4 бита: table[v] = a * v без редукции
+        table = [0, a]
+        for v in range(2, 16):
+            table.append(table[v >> 1] << 1 if v % 2 == 0 else table[v - 1] ^ a)
+        res = 0
+        for shift in range((b.bit_length() + 3) // 4 * 4 - 4, -1, -4):
+            res = (res << 4) ^ table[(b >> shift) & 0xF]
+        return self._reduce(res)
+
+    def square(self, a: int) -> int:
+        self._check(a)
+        return self._reduce(GField._poly_square(a))
+
+    def pow(self, a: int, exp: int) -> int:
+        self._check(a)
+        if exp < 0:
+            a, exp = self.inverse(a), -exp
+        res = 1
+        while exp:
+            if exp & 1:
+                res = self.multiply(res, a)
+            a = self.square(a)
+            exp >>= 1
+        return res
+
+    def inverse(self, a: int) -> int:
+        """Обратный элемент расширенным алгоритмом Евклида над GF(2)[x]."""
+        if self._check(a) == 0:
+            raise ValueError("Обратного элемента для 0 не существует")
+        r0, r1 = self.modulus, a
+        s0, s1 = 0, 1
+        while r1 != 1:
+            shift = r0.bit_length() - r1.bit_length()
+            if shift < 0:
+                r0, r1, s0, s1 = r1, r0, s1, s0
+                shift = -shift
+            r0 ^= r1 << shift
+            s0 ^= s1 << shift
+            if r0.bit_length() < r1.bit_length():
+                r0, r1, s0, s1 = r1, r0, s1, s0
+        return self._reduce(s1)
+
+    def multiplier(self, h: int, window: int = 8) -> "FixedMultiplier":
+        """Таблицы Шоупа для быстрого умножения на фиксированный h."""
+        return FixedMultiplier(self, h, window)
+
+    def _reduce(self, a: int) -> int:
+        n = self.degree
+        if self.sparse:
+            # x^n = сумма младших членов модуля: сворачиваем старшую часть
+            mask = self.mask
+            exponents = self._tail_exponents
+            while a >> n:
+                high = a >> n
+                a &= mask
+                for k in exponents:
+                    a ^= high << k
+            return a
+
+        table = self._reduce_table
+        extra = a.bit_length() - n
+        while extra > 0:
+            low = max(extra - 8, 0)
+            top = a >> (n + low)
+            a = (a & ((1 << (n + low)) - 1)) ^ (table[top] << low)
+            extra = a.bit_length() - n
+        return a
+
+    def _reduce_bitwise(self, a: int) -> int:
+        n = self.degree
+        while a.bit_length() > n:
+            a ^= self.modulus << (a.bit_length() - 1 - n)
+        return a
+
+
+class FixedMultiplier:
+    """
+    Умножение на фиксированный элемент h (ключ GHASH-подобных хешей).
+    Для каждого окна i строится таблица T_i[v] = h * v * x^(window * i),
+    и h * a - это XOR по одной выборке из каждой таблицы, без редукции.
+    """
+
+    def __init__(self, field: BinaryField, h: int, window: int = 8):
+        if window not in (4, 8):
+            raise ValueError("window must be 4 or 8")
+        field._check(h)
+        self.field = field
+        self.h = h
+        self.window = window
+        self._num_windows = -(-field.degree // window)
+
+        # базис: h * x^j для всех j, каждое следующее - умножение на x
+        basis = []
+        value = h
+        for _ in range(self._num_windows * window):
+            basis.append(value)
+            value = field._reduce(value << 1)
+
+        size = 1 << window
+        self._tables = []
+        for i in range(self._num_windows):
+            table = [0] * size
+            for bit in range(window):
+                step = 1 << bit
+                b = basis[i * window + bit]
+                for v in range(step, 2 * step):
+                    table[v] = table[v - step] ^ b
+            self._tables.append(tuple(table))
+        self._tables = tuple(self._tables)
+
+    def multiply(self, a: int) -> int:
+        self.field._check(a)
+        res = 0
+        if self.window == 8:
+            for table, byte in zip(self._tables, a.to_bytes(self._num_windows, "little")):
+                res ^= table[byte]
+            return res
+        for table in self._tables:
+            res ^= table[a & 0xF]
+            a >>= 4
+        return res
@@ -1,8 +1,116 @@
+import random
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None
+
+
+# байт b1..b8 -> 16 бит 0b1 0b2 ... 0b8 (возведение в квадрат над GF(2)),
+# два байта little-endian
+_SPREAD_BYTES = tuple(
+    sum(((b >> i) & 1) << (2 * i) for i in range(8)).to_bytes(2, "little")
+    for b in range(256)
+)
+
+
+# до какой степени is_irreducible ищет малые множители перед тестом Рабина
+_SMALL_FACTOR_DEGREE = 8
+
+
 class ReducibleModulusError(ValueError):
     pass
 
 
+class GF256:
+    """
+    Поле GF(2^8) с фиксированным модулем. Модуль проверяется один раз,
+    умножение/обращение/степень - выборки из таблиц логарифмов.
+    Экземпляры берутся через GField.field(modulus).
+    """
+
+    def __init__(self, modulus: int):
+        GField._ensure_irreducible(modulus)
+        self.modulus = modulus
+        self.generator = self._find_generator()
+
+        exp = bytearray(510)
+        log = bytearray(256)
+        x = 1
+        for i in range(255):
+            exp[i] = exp[i + 255] = x
+            log[x] = i
+            x = self._slow_multiply(x, self.generator)
+        # exp удвоена, чтобы не брать остаток в multiply
+        self.exp = bytes(exp)
+        self.log = bytes(log)
+        self.inv = bytes([0] + [exp[255 - log[a]] for a in range(1, 256)])
+        self._rows = {}
+
+    def _slow_multiply(self, a: int, b: int) -> int:
+        res = 0
+        poly_tail = self.modulus & 0xFF
+        for _ in range(8):
+            if b & 1:
+                res ^= a
+            high_bit_set = a & 0x80
+            a = (a << 1) & 0xFF
+            if high_bit_set:
+                a ^= poly_tail
+            b >>= 1
+        return res
+
+    def _find_generator(self) -> int:
+        """Порождающий элемент мультипликативной группы (порядок 255)."""
+        for g in range(2, 256):
+            x, order = g, 1
+            while x != 1:
+                x = self._slow_multiply(x, g)
+                order += 1
+            if order == 255:
+                return g
+        raise ReducibleModulusError(f"Модуль 0x{self.modulus:X} не задает поле")
+
+    def multiply(self, a: int, b: int) -> int:
+        a &= 0xFF
+        b &= 0xFF
+        if a == 0 or b == 0:
+            return 0
+        return self.exp[self.log[a] + self.log[b]]
+
+    def inverse(self, a: int) -> int:
+        if a == 0:
+            raise ValueError("Обратного элемента для 0 не существует")
+        return self.inv[a & 0xFF]
+
+    def pow(self, a: int, exp: int) -> int:
+        a &= 0xFF
+        if exp == 0:
+            return 1
+        if a == 0:
+            return 0
+        return self.exp[self.log[a] * exp % 255]
+
+    def mul_row(self, c: int) -> bytes:
+        """Таблица x -> c*x (256 байт, годится для bytes.translate)."""
+        row = self._rows.get(c)
+        if row is None:
+            row = bytes(self.multiply(c, x) for x in range(256))
+            row = self._rows.setdefault(c, row)
+        return row
+
+
 class GField:
+    _fields: dict[int, GF256] = {}
+
+    @staticmethod
+    def field(modulus: int) -> GF256:
+        """Поле по модулю - один экземпляр с таблицами на модуль."""
+        field = GField._fields.get(modulus)
+        if field is None:
+            field = GField._fields.setdefault(modulus, GF256(modulus))
+        return field
 
     @staticmethod
     def add(a: int, b: int) -> int:
@@ -12,96 +120,374 @@ class GField:
     @staticmethod
     def multiply(a: int, b: int, modulus: int) -> int:
         """Умножение в GF(2^8) по модулю."""
-        GField._ensure_irreducible(modulus)
+        return GField.field(modulus).multiply(a, b)
 
-        res = 0
-        a &= 0xFF
-        b &= 0xFF
-        # Отбрасываем старший бит (x^8),
-        poly_tail = modulus & 0xFF
+    @staticmethod
+    def inverse(a: int, modulus: int) -> int:
+        if a == 0:
+            raise ValueError("Обратного элемента для 0 не существует")
 
-        for _ in range(8):
-            if (b & 1) != 0:
-                res ^= a
+        return GField.field(modulus).inverse(a)
 
-            high_bit_set = (a & 0x80) != 0
-            a = (a << 1) & 0xFF
-            if high_bit_set:
-                a ^= poly_tail
+    # Поэлементные операции над буферами: bytes/bytearray/memoryview
+    # (результат - bytes) или массивы NumPy uint8 (результат - массив).
 
-            b >>= 1
-        return res
+    @staticmethod
+    def add_bulk(a, b):
+        """Поэлементное сложение (XOR) буферов одной длины или буфера и числа."""
+        if isinstance(b, int):
+            return GField._apply_table(a, bytes(x ^ (b & 0xFF) for x in range(256)))
+        GField._check_same_length(a, b)
+        if GField._is_array(a) or GField._is_array(b):
+            return np.asarray(a, dtype=np.uint8) ^ np.asarray(b, dtype=np.uint8)
+        n = len(a)
+        return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(n, "big")
 
     @staticmethod
-    def inverse(a: int, modulus: int) -> int:
-        if a == 0:
+    def multiply_bulk(a, b, modulus: int):
+        """Поэлементное умножение буферов одной длины или буфера на константу."""
+        field = GField.field(modulus)
+        if isinstance(a, int):
+            a, b = b, a
+        if isinstance(b, int):
+            return GField._apply_table(a, field.mul_row(b & 0xFF))
+
+        GField._check_same_length(a, b)
+        if GField._is_array(a) or GField._is_array(b):
+            a = np.asarray(a, dtype=np.uint8)
+            b = np.asarray(b, dtype=np.uint8)
+            log = np.frombuffer(field.log, dtype=np.uint8).astype(np.uint16)
+            exp = np.frombuffer(field.exp, dtype=np.uint8)
+            res = exp[log[a] + log[b]]
+            res[(a == 0) | (b == 0)] = 0
+            return res
+
+        a, b = bytes(a), bytes(b)
+        exp = field.exp
+        return bytes(
+            exp[p + q] if x and y else 0
+            for x, y, p, q in zip(a, b, a.translate(field.log), b.translate(field.log))
+        )
+
+    @staticmethod
+    def inverse_bulk(a, modulus: int):
+        if GField._is_array(a):
+            has_zero = not np.all(a)
+        else:
+            has_zero = 0 in bytes(a)
+        if has_zero:
             raise ValueError("Обратного элемента для 0 не существует")
+        return GField._apply_table(a, GField.field(modulus).inv)
 
-        return GField._fast_pow(a, 254, modulus)
+    @staticmethod
+    def pow_bulk(a, exp: int, modulus: int):
+        field = GField.field(modulus)
+        return GField._apply_table(a, bytes(field.pow(x, exp) for x in range(256)))
+
+    @staticmethod
+    def matvec_bulk(matrix: list[list[int]], data, modulus: int):
+        """
+        Умножение матрицы (m x k) на каждый вектор из k подряд идущих байтов
+        data; результат - m байтов на вектор (как MixColumns по столбцам).
+        """
+        k = len(matrix[0])
+        m = len(matrix)
+        if any(len(row) != k for row in matrix):
+            raise ValueError("Matrix rows must have the same length")
+        if len(data) % k != 0:
+            raise ValueError(f"Data length must be a multiple of {k}")
+        field = GField.field(modulus)
+
+        if GField._is_array(data):
+            vectors = np.asarray(data, dtype=np.uint8).reshape(-1, k)
+            out = np.zeros((len(vectors), m), dtype=np.uint8)
+            for i, row in enumerate(matrix):
+                for j, c in enumerate(row):
+                    if c:
+                        table = np.frombuffer(field.mul_row(c & 0xFF), dtype=np.uint8)
+                        out[:, i] ^= table[vectors[:, j]]
+            return out.reshape(-1)
+
+        data = bytes(data)
+        n = len(data) // k
+        columns = [data[j::k] for j in range(k)]
+        out = bytearray(n * m)
+        for i, row in enumerate(matrix):
+            acc = 0
+            for j, c in enumerate(row):
+                if c:
+                    acc ^= int.from_bytes(
+                        columns[j].translate(field.mul_row(c & 0xFF)), "big"
+                    )
+            out[i::m] = acc.to_bytes(n, "big")
+        return bytes(out)
+
+    @staticmethod
+    def _is_array(a) -> bool:
+        return np is not None and isinstance(a, np.ndarray)
+
+    @staticmethod
+    def _apply_table(a, table: bytes):
+        if GField._is_array(a):
+            return np.frombuffer(table, dtype=np.uint8)[a]
+        return bytes(a).translate(table)
+
+    @staticmethod
+    def _check_same_length(a, b) -> None:
+        if len(a) != len(b):
+            raise ValueError("Buffers must have the same length")
 
     @staticmethod
     def is_irreducible_deg8(poly: int) -> bool:
         """Проверка полинома степени 8 на неприводимость."""
-        # Проверяем степень
-        if poly.bit_length() - 1 != 8:
-            return False
+        return poly.bit_length() - 1 == 8 and GField.is_irreducible(poly)
 
+    @staticmethod
+    def is_irreducible(poly: int) -> bool:
+        """
+        Тест Рабина для полинома над GF(2) любой степени n:
+        x^(2^n) = x (mod f) и gcd(x^(2^(n/q)) - x, f) = 1 для простых q | n.
+        """
+        n = GField._poly_degree(poly)
+        if n < 1:
+            return False
+        if n == 1:
+            return True
         if (poly & 1) == 0:
             return False
-        SMALL_IRREDUCIBLES = GField._find_all_irreducibles_up_to_deg4()
-        # Пробуем делить на все неприводимые полиномы степени <= 4
-        for divisor in SMALL_IRREDUCIBLES:
-            _, rem = GField._poly_divmod(poly, divisor)
-            if rem == 0:
+
+        # f неприводим тогда и только тогда, когда неприводим x^n f(1/x):
+        # берем тот, у которого младшие члены ниже (быстрее _poly_reduce)
+        reciprocal = int(f"{poly:b}"[::-1], 2)
+        if (reciprocal ^ (1 << n)) < (poly ^ (1 << n)):
+            poly = reciprocal
+
+        # отсев множителей малых степеней d: gcd(x^(2^d) - x, f) != 1.
+        # большинство приводимых f отбрасывается после нескольких квадратов
+        h = 0x2
+        for _ in range(min(_SMALL_FACTOR_DEGREE, n // 2)):
+            h = GField._poly_reduce(GField._poly_square(h), poly)
+            if GField._poly_gcd(h ^ 0x2, poly) != 1:
                 return False
 
-        return True
+        for q in GField._prime_divisors(n):
+            h = GField._poly_frobenius(0x2, n // q, poly)
+            if GField._poly_gcd(h ^ 0x2, poly) != 1:
+                return False
+        return GField._poly_frobenius(0x2, n, poly) == 0x2
 
     @staticmethod
     def get_all_irreducibles_deg8() -> list[int]:
-        result = []
-        for poly in range(0x101, 0x200, 2):
-            if GField.is_irreducible_deg8(poly):
-                result.append(poly)
+        return list(GField._all_irreducibles(8))
 
-        return result
+    @staticmethod
+    def irreducibles(degree: int):
+        """Все неприводимые полиномы степени degree по возрастанию (генератор)."""
+        if degree < 1:
+            raise ValueError("Degree must be positive")
+        if degree == 1:
+            yield from (0x2, 0x3)
+            return
+        for poly in range((1 << degree) | 1, 1 << (degree + 1), 2):
+            if GField.is_irreducible(poly):
+                yield poly
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def find_irreducible(degree: int) -> int:
+        """
+        Разреженный неприводимый полином степени degree: сначала трехчлены
+        x^n + x^k + 1, затем пятичлены - для быстрой редукции в GF(2^n).
+        """
+        top = (1 << degree) | 1
+        for k in range(1, degree):
+            if GField.is_irreducible(top | (1 << k)):
+                return top | (1 << k)
+        for k3 in range(3, degree):
+            for k2 in range(2, k3):
+                for k1 in range(1, k2):
+                    poly = top | (1 << k3) | (1 << k2) | (1 << k1)
+                    if GField.is_irreducible(poly):
+                        return poly
+        return next(GField.irreducibles(degree))
 
     @staticmethod
     def factorize(poly: int) -> list[int]:
-        """Разложение произвольного полинома на неприводимые множители."""
+        """
+        Разложение полинома над GF(2) на неприводимые множители (с кратностью,
+        по возрастанию): бесквадратное разложение, затем разложение по
+        степеням (DDF) и Кантор-Цассенхауз для равных степеней (EDF).
+        """
         if poly <= 1:
             return []
 
         factors = []
+        for square_free, multiplicity in GField._square_free_factors(poly):
+            for part, degree in GField._distinct_degree_factors(square_free):
+                for factor in GField._equal_degree_factors(part, degree):
+                    factors.extend([factor] * multiplicity)
+        return sorted(factors)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _all_irreducibles(degree: int) -> tuple[int, ...]:
+        return tuple(GField.irreducibles(degree))
+
+    @staticmethod
+    def _prime_divisors(n: int) -> list[int]:
+        primes = []
+        d = 2
+        while d * d <= n:
+            if n % d == 0:
+                primes.append(d)
+                while n % d == 0:
+                    n //= d
+            d += 1
+        if n > 1:
+            primes.append(n)
+        return primes
+
+    @staticmethod
+    def _poly_mod(a: int, m: int) -> int:
+        deg_m = m.bit_length() - 1
+        deg_a = a.bit_length() - 1
+        while deg_a >= deg_m:
+            a ^= m << (deg_a - deg_m)
+            deg_a = a.bit_length() - 1
+        return a
+
+    @staticmethod
+    def _poly_reduce(a: int, m: int) -> int:
+        """
+        a mod m для многократной редукции по одному модулю: если младшие
+        члены m не выше x^(n/2), старшая часть сворачивается по ним целиком
+        (x^n = tail), иначе - побитовый _poly_mod.
+        """
+        n = m.bit_length() - 1
+        tail = m ^ (1 << n)
+        if tail.bit_length() - 1 > n // 2:
+            return GField._poly_mod(a, m)
+        exponents = []
+        while tail:
+            low = tail & -tail
+            exponents.append(low.bit_length() - 1)
+            tail ^= low
+        mask = (1 << n) - 1
+        while a >> n:
+            high = a >> n
+            a &= mask
+            for k in exponents:
+                a ^= high << k
+        return a
 
-        # Выносим множитель x (если полином четный)
-        while (poly & 1) == 0:
-            factors.append(0x2)  # 0x2 - x
-            poly >>= 1
+    @staticmethod
+    def _poly_square(a: int) -> int:
+        # над GF(2) (sum a_i x^i)^2 = sum a_i x^(2i) - раздвигаем биты
+        data = a.to_bytes((a.bit_length() + 7) // 8, "little")
+        return int.from_bytes(b"".join(map(_SPREAD_BYTES.__getitem__, data)), "little")
 
-        if poly == 1:
-            return factors
+    @staticmethod
+    def _poly_mulmod(a: int, b: int, m: int) -> int:
+        if a == b:
+            return GField._poly_reduce(GField._poly_square(a), m)
+        return GField._poly_reduce(GField._poly_mul_no_mod(a, b), m)
 
-        divisor = 0x3
+    @staticmethod
+    def _poly_frobenius(a: int, k: int, m: int) -> int:
+        """a^(2^k) mod m - k возведений в квадрат."""
+        for _ in range(k):
+            a = GField._poly_reduce(GField._poly_square(a), m)
+        return a
 
-        while divisor * divisor <= poly:
-            quotient, remainder = GField._poly_divmod(poly, divisor)
+    @staticmethod
+    def _poly_gcd(a: int, b: int) -> int:
+        while b:
+            a, b = b, GField._poly_mod(a, b)
+        return a
 
-            while remainder == 0:
-                factors.append(divisor)
-                poly = quotient
+    @staticmethod
+    def _poly_sqrt(a: int) -> int:
+        """Корень из полного квадрата: над GF(2) f(x)^2 = f(x^2)."""
+        res = 0
+        i = 0
+        while a:
+            if a & 1:
+                res |= 1 << i
+            a >>= 2
+            i += 1
+        return res
 
-                if poly == 1:
-                    return factors
+    @staticmethod
+    def _poly_derivative(a: int) -> int:
+        # над GF(2) остаются только нечетные степени: (x^i)' = x^(i-1)
+        odd_bits = int("10" * (a.bit_length() // 2 + 1), 2)
+        return (a & odd_bits) >> 1
 
-                quotient, remainder = GField._poly_divmod(poly, divisor)
+    @staticmethod
+    def _square_free_factors(poly: int) -> list[tuple[int, int]]:
+        """f = prod g_i^(m_i) с бесквадратными попарно взаимно простыми g_i."""
+        derivative = GField._poly_derivative(poly)
+        if derivative == 0:
+            root = GField._poly_sqrt(poly)
+            return [(g, 2 * m) for g, m in GField._square_free_factors(root)]
 
-            divisor += 2
+        result = []
+        c = GField._poly_gcd(poly, derivative)
+        w = GField._poly_div(poly, c)
+        i = 1
+        while w != 1:
+            y = GField._poly_gcd(w, c)
+            z = GField._poly_div(w, y)
+            if z != 1:
+                result.append((z, i))
+            i += 1
+            w = y
+            c = GField._poly_div(c, y)
+        if c != 1:
+            root = GField._poly_sqrt(c)
+            result += [(g, 2 * m) for g, m in GField._square_free_factors(root)]
+        return result
 
-        if poly > 1:
-            factors.append(poly)
+    @staticmethod
+    def _distinct_degree_factors(poly: int) -> list[tuple[int, int]]:
+        """Бесквадратный f -> (произведение всех множителей степени d, d)."""
+        result = []
+        h = 0x2
+        d = 1
+        while GField._poly_degree(poly) >= 2 * d:
+            h = GField._poly_mulmod(h, h, poly)
+            g = GField._poly_gcd(poly, h ^ 0x2)
+            if g != 1:
+                result.append((g, d))
+                poly = GField._poly_div(poly, g)
+                h = GField._poly_mod(h, poly)
+            d += 1
+        if poly != 1:
+            result.append((poly, GField._poly_degree(poly)))
+        return result
 
-        return factors
+    @staticmethod
+    def _equal_degree_factors(poly: int, degree: int) -> list[int]:
+        """
+        Кантор-Цассенхауз для характеристики 2: след
+        T(a) = a + a^2 + ... + a^(2^(d-1)) mod f с вероятностью ~1/2
+        дает нетривиальный gcd(T(a), f).
+        """
+        n = GField._poly_degree(poly)
+        if n == degree:
+            return [poly]
+        rng = random.Random(poly)
+        while True:
+            a = rng.getrandbits(n) | 0x2
+            trace = a
+            for _ in range(degree - 1):
+                a = GField._poly_mulmod(a, a, poly)
+                trace ^= a
+            g = GField._poly_gcd(poly, trace)
+            if g != 1 and g != poly:
+                return GField._equal_degree_factors(
+                    g, degree
+                ) + GField._equal_degree_factors(GField._poly_div(poly, g), degree)
 
     @staticmethod
     def _ensure_irreducible(modulus: int) -> None:
@@ -153,36 +539,4 @@ class GField:
 
     @staticmethod
     def _fast_pow(a: int, exp: int, modulus: int) -> int:
-        res = 1
-        base = a
-        while exp > 0:
-            if exp & 1:
-                res = GField.multiply(res, base, modulus)
-            base = GField.multiply(base, base, modulus)
-            exp >>= 1
-        return res
-
-    @staticmethod
-    def _find_all_irreducibles_up_to_deg4():
-        irreducibles = [0x2]
-
-        for deg in range(1, 5):
-            start = 1 << deg | 1  # 2^deg
-            end = 1 << (deg + 1)  # 2^(deg+1)
-
-            for poly in range(start, end, 2):
-
-                is_irreducible = True
-                for divisor in irreducibles:
-                    if (divisor.bit_length() - 1) > deg // 2:
-                        break
-
-                    _, remainder = GField._poly_divmod(poly, divisor)
-                    if remainder == 0:
-                        is_irreducible = False
-                        break
-
-                if is_irreducible:
-                    irreducibles.append(poly)
-
-        return irreducibles
+        return GField.field(modulus).pow(a, exp)
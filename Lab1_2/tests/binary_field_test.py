@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from Lab1_2.services.binary_field import BinaryField
+from Lab1_2.services.galois_service import GField, ReducibleModulusError
+
+
+def _slow_multiply(a: int, b: int, modulus: int) -> int:
+    n = modulus.bit_length() - 1
+    res = 0
+    while b:
+        if b & 1:
+            res ^= a
+        b >>= 1
+        a <<= 1
+        if (a >> n) & 1:
+            a ^= modulus
+    return res
+
+
+def _dense_modulus(degree: int) -> int:
+    return next(p for p in GField.irreducibles(degree) if bin(p).count("1") > 5)
+
+
+MODULI = [
+    0x11B,
+    GField.find_irreducible(32),
+    _dense_modulus(32),
+    GField.find_irreducible(64),
+    GField.find_irreducible(128),
+]
+
+
+@pytest.mark.parametrize("modulus", MODULI, ids=hex)
+def test_binary_field_matches_bitwise(modulus):
+    field = BinaryField(modulus)
+    rnd = random.Random(modulus)
+    n = field.degree
+    for _ in range(200):
+        a, b = rnd.getrandbits(n), rnd.getrandbits(n)
+        assert field.multiply(a, b) == _slow_multiply(a, b, modulus)
+        assert field.square(a) == _slow_multiply(a, a, modulus)
+        assert field.add(a, b) == a ^ b
+        if a:
+            assert field.multiply(a, field.inverse(a)) == 1
+    a = rnd.getrandbits(n) | 1
+    assert field.pow(a, field.order - 1) == 1
+    assert field.pow(a, -1) == field.inverse(a)
+
+
+@pytest.mark.parametrize("modulus", MODULI, ids=hex)
+@pytest.mark.parametrize("window", [4, 8])
+def test_fixed_multiplier(modulus, window):
+    field = BinaryField(modulus)
+    rnd = random.Random(window)
+    h = rnd.getrandbits(field.degree)
+    mul = field.multiplier(h, window)
+    for _ in range(200):
+        a = rnd.getrandbits(field.degree)
+        assert mul.multiply(a) == field.multiply(a, h)
+
+
+def test_gf256_agrees_with_gfield():
+    field = BinaryField(0x11B)
+    for a in range(0, 256, 5):
+        for b in range(256):
+            assert field.multiply(a, b) == GField.multiply(a, b, 0x11B)
+
+
+def test_binary_field_errors():
+    with pytest.raises(ReducibleModulusError):
+        BinaryField((1 << 32) | 1)
+    field = BinaryField.of_degree(64)
+    assert field.modulus == (1 << 64) | 0x1B
+    with pytest.raises(ValueError):
+        field.multiply(1 << 64, 1)
+    with pytest.raises(ValueError):
+        field.inverse(0)
+    with pytest.raises(ValueError):
+        field.multiplier(3, window=16)
@@ -0,0 +1,95 @@
+import os
+import random
+import secrets
+import time
+
+import pytest
+
+from Lab1_2.cipher_primitives.DES.des_cipher import DES
+from Lab1_2.cipher_primitives.DES.DESKeySchedule import DESKeySchedule
+from Lab1_2.cipher_primitives.DES.DESRoundFunction import DESRoundFunction
+from Lab1_2.utility.bitperm import bitperm, compile_bitperm
+
+# бенчмарки запускаются только по запросу: BITPERM_BENCHMARK=1 pytest ...
+RUN_BENCHMARKS = os.environ.get("BITPERM_BENCHMARK") == "1"
+
+
+DES_TABLES = [
+    ("IP", DES.IP, 8),
+    ("FP", DES.FP, 8),
+    ("E", DESRoundFunction.E, 4),
+    ("P", DESRoundFunction.P, 4),
+    ("PC1", DESKeySchedule.PC1, 8),
+    ("PC2", DESKeySchedule.PC2, 7),
+]
+
+
+@pytest.mark.parametrize("name,p_block,input_size", DES_TABLES)
+def test_compiled_matches_bitperm_des_tables(name, p_block, input_size):
+    perm = compile_bitperm(p_block, input_size)
+    for _ in range(200):
+        data = secrets.token_bytes(input_size)
+        expected = bitperm(data, p_block)
+        assert perm.apply(data) == expected
+        assert perm.apply_int(int.from_bytes(data, "big")) == int.from_bytes(
+            expected, "big"
+        )
+
+
+@pytest.mark.parametrize("msb_first", [True, False])
+@pytest.mark.parametrize("one_based_indexing", [True, False])
+def test_compiled_matches_bitperm_random(msb_first, one_based_indexing):
+    rnd = random.Random(1234)
+    for input_size in (1, 3, 8):
+        total_bits = input_size * 8
+        base = 1 if one_based_indexing else 0
+        # неполный выходной байт и повторяющиеся индексы
+        p_block = [rnd.randrange(total_bits) + base for _ in range(13)]
+        perm = compile_bitperm(p_block, input_size, msb_first, one_based_indexing)
+        for _ in range(50):
+            data = secrets.token_bytes(input_size)
+            assert perm.apply(data) == bitperm(
+                data, p_block, msb_first, one_based_indexing
+            )
+
+
+def test_compiled_bad_index():
+    with pytest.raises(IndexError):
+        compile_bitperm([1, 2, 17], 2)
+
+
+def test_compiled_bad_length():
+    perm = compile_bitperm(DES.IP, 8)
+    with pytest.raises(ValueError):
+        perm.apply(b"1234567")
+
+
+def test_compiled_matches_bitperm_many_blocks():
+    """Скомпилированная перестановка совпадает с bitperm на большом наборе."""
+    blocks = [secrets.token_bytes(8) for _ in range(2000)]
+    perm = compile_bitperm(DES.IP, 8)
+    assert [perm.apply(b) for b in blocks] == [bitperm(b, DES.IP) for b in blocks]
+
+
+@pytest.mark.skipif(not RUN_BENCHMARKS, reason="set BITPERM_BENCHMARK=1 to run")
+@pytest.mark.parametrize("name,p_block,input_size", DES_TABLES)
+def test_bitperm_benchmark(name, p_block, input_size, record_property):
+    """
+    Скорость побитового bitperm и скомпилированных таблиц. Время не
+    проверяется, а пишется в свойства отчета (--junitxml).
+    """
+    n = 20000
+    blocks = [secrets.token_bytes(input_size) for _ in range(n)]
+    perm = compile_bitperm(p_block, input_size)
+
+    t0 = time.perf_counter()
+    expected = [bitperm(b, p_block) for b in blocks]
+    t_bitperm = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    compiled = [perm.apply(b) for b in blocks]
+    t_compiled = time.perf_counter() - t0
+
+    record_property(f"{name}_bitperm_s", round(t_bitperm, 4))
+    record_property(f"{name}_compiled_s", round(t_compiled, 4))
+    assert compiled == expected
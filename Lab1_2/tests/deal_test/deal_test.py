@@ -4,9 +4,13 @@ import secrets
 import shutil
 import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
 
 from Lab1_2.cipher_primitives.DEAL.deal_cipher import DEAL
+from Lab1_2.cipher_primitives.DES.DESKeySchedule import DES_KEY_CACHE
+from Lab1_2.feistel_cipher import FeistelCipher
+from Lab1_2.utility.interfaces import IKeySchedule, IRoundFunction
 from Lab1_2.utility.modes import CipherMode, PaddingMode
 from Lab1_2.utility.symmetric_context import SymmetricCipherContext
 
@@ -112,6 +116,93 @@ def test_deal_raw_primitive(key_len, expected_name):
     assert plaintext != ciphertext
 
 
+@pytest.mark.parametrize("key_len", [128, 256])
+def test_deal_round_des_keyed_once(key_len):
+    """Раундовые DES строятся в setup_keys и делятся между потоками без перекейинга."""
+    deal = DEAL(key_size=key_len)
+    deal.setup_keys(secrets.token_bytes(key_len // 8))
+    blocks = [secrets.token_bytes(16) for _ in range(64)]
+    expected = [deal.encrypt_block(b) for b in blocks]
+
+    before = DES_KEY_CACHE.stats()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(deal.encrypt_block, blocks))
+    after = DES_KEY_CACHE.stats()
+
+    assert results == expected
+    assert (after["hits"], after["misses"]) == (before["hits"], before["misses"])
+    assert [deal.decrypt_block(c) for c in results] == blocks
+
+
+@pytest.mark.parametrize("key_len", [128, 192, 256])
+@pytest.mark.parametrize("num_blocks", [0, 1, 7, 300])
+def test_deal_encrypt_blocks_matches_single(key_len, num_blocks):
+    """Пакетные раунды (DES над всеми половинами сразу) == поблочное шифрование."""
+    deal = DEAL(key_size=key_len)
+    deal.setup_keys(secrets.token_bytes(key_len // 8))
+    data = secrets.token_bytes(16 * num_blocks)
+    expected = b"".join(
+        deal.encrypt_block(data[i : i + 16]) for i in range(0, len(data), 16)
+    )
+
+    encrypted = deal.encrypt_blocks(data)
+    assert encrypted == expected
+    assert deal.decrypt_blocks(encrypted) == data
+
+    with pytest.raises(ValueError):
+        deal.encrypt_blocks(data + b"x")
+
+
+class _BytesKeySchedule(IKeySchedule):
+    def expand_key(self, master_key: bytes) -> list[bytes]:
+        return [bytes((b + i) & 0xFF for b in master_key) for i in range(8)]
+
+
+class _BytesRoundFunction(IRoundFunction):
+    """F только на bytes: apply_int/apply_many берутся из интерфейса."""
+
+    half_size = 4
+
+    def apply(self, half_block: bytes, round_key: bytes) -> bytes:
+        return bytes((x * 7 + k) & 0xFF for x, k in zip(half_block, round_key))
+
+
+@pytest.mark.parametrize("int_native,batch_native", list(product([False, True], repeat=2)))
+def test_feistel_round_function_fallbacks(int_native, batch_native):
+    """Флаги без своих apply_int/apply_many не ломают шифр: работают запасные."""
+    reference = FeistelCipher(_BytesKeySchedule(), _BytesRoundFunction(), 8, 8)
+    round_function = _BytesRoundFunction()
+    round_function.int_native = int_native
+    round_function.batch_native = batch_native
+    cipher = FeistelCipher(_BytesKeySchedule(), round_function, 8, 8)
+    assert cipher.half_size == 4
+
+    key = secrets.token_bytes(4)
+    reference.setup_keys(key)
+    cipher.setup_keys(key)
+    data = secrets.token_bytes(8 * 20)
+    expected = reference.encrypt_blocks(data)
+    assert cipher.encrypt_blocks(data) == expected
+    assert cipher.encrypt_block(data[:8]) == expected[:8]
+    assert cipher.decrypt_blocks(expected) == data
+
+    with pytest.raises(ValueError):
+        FeistelCipher(_BytesKeySchedule(), round_function, 16, 8)
+
+
+def test_feistel_does_not_modify_round_function():
+    """Шифр без half_size у функции берет ширину половины из своего блока."""
+    round_function = _BytesRoundFunction()
+    round_function.half_size = None
+    cipher = FeistelCipher(_BytesKeySchedule(), round_function, 16, 8)
+    assert round_function.half_size is None
+    assert cipher.half_size == 8
+
+    cipher.setup_keys(secrets.token_bytes(8))
+    block = secrets.token_bytes(16)
+    assert cipher.decrypt_block(cipher.encrypt_block(block)) == block
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("key_len", [128, 192, 256])
 @pytest.mark.parametrize(
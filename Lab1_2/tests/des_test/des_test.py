@@ -1,12 +1,22 @@
 import asyncio
+import io
 import os
 import secrets
 import shutil
 import time
 import pytest
 
+from Lab1_2.cipher_modes.ofb_mode import KeystreamPrefetcher
+from Lab1_2.cipher_primitives.DES import des_bitslice_sboxes
+from Lab1_2.cipher_primitives.DES.des_bitslice import generate_sbox_module
 from Lab1_2.cipher_primitives.DES.des_cipher import DES
-from Lab1_2.utility.modes import CipherMode, PaddingMode
+from Lab1_2.cipher_primitives.DES.DESKeySchedule import DES_KEY_CACHE, DESKeySchedule
+from Lab1_2.cipher_primitives.DES.des_numpy import NUMPY_AVAILABLE
+from Lab1_2.cipher_primitives.DES.DESRoundFunction import (
+    DESRoundFunction,
+    DESSPRoundFunction,
+)
+from Lab1_2.utility.modes import CipherMode, ExecutorType, PaddingMode
 from Lab1_2.utility.symmetric_context import SymmetricCipherContext
 
 
@@ -103,6 +113,231 @@ def test_des_raw_primitive():
     assert plaintext != ciphertext
 
 
+def test_des_known_answer():
+    """Классический пример FIPS 46: K=133457799BBCDFF1, P=0123456789ABCDEF."""
+    des = DES()
+    des.setup_keys(bytes.fromhex("133457799BBCDFF1"))
+    ciphertext = des.encrypt_block(bytes.fromhex("0123456789ABCDEF"))
+    print(f"\n[DES] KAT cipher: {hex_dump(ciphertext)}")
+    assert ciphertext == bytes.fromhex("85E813540F0AB405")
+    assert des.decrypt_block(ciphertext) == bytes.fromhex("0123456789ABCDEF")
+
+
+def test_des_sp_round_function_matches_reference():
+    reference = DESRoundFunction()
+    fused = DESSPRoundFunction()
+    for _ in range(1000):
+        half_block = secrets.token_bytes(4)
+        round_key = secrets.token_bytes(6)
+        assert fused.apply(half_block, round_key) == reference.apply(
+            half_block, round_key
+        )
+
+
+def test_des_key_cache():
+    """Повторная установка того же ключа берет раундовые ключи из кэша."""
+    maxsize = DES_KEY_CACHE.maxsize
+    DES_KEY_CACHE.clear()
+    try:
+        key = secrets.token_bytes(8)
+        expected = DESKeySchedule()._expand_key(key)
+
+        assert DESKeySchedule().expand_key(key) == expected
+        assert DESKeySchedule().expand_key(key) == expected
+        stats = DES_KEY_CACHE.stats()
+        print(f"\n[DES] key cache: {stats}")
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+        DES_KEY_CACHE.set_maxsize(2)
+        for _ in range(3):
+            DESKeySchedule().expand_key(secrets.token_bytes(8))
+        assert len(DES_KEY_CACHE) == 2
+
+        with pytest.raises(ValueError):
+            DESKeySchedule().expand_key(b"short")
+    finally:
+        DES_KEY_CACHE.set_maxsize(maxsize)
+        DES_KEY_CACHE.clear()
+
+
+def test_des_bitslice_sboxes_up_to_date():
+    """Сгенерированный модуль схем S-блоков совпадает с генератором."""
+    with open(des_bitslice_sboxes.__file__, encoding="utf-8") as f:
+        assert f.read() == generate_sbox_module()
+
+
+@pytest.mark.parametrize("backend", ["bitslice", "numpy"])
+@pytest.mark.parametrize("num_blocks", [1, 63, 64, 65, 300, 2049])
+def test_des_encrypt_blocks_matches_single(backend, num_blocks):
+    """Пакетные движки дают те же блоки, что и encrypt_block."""
+    if backend == "numpy" and not NUMPY_AVAILABLE:
+        pytest.skip("NumPy is not installed")
+    des = DES(batch_backend=backend)
+    des.setup_keys(secrets.token_bytes(8))
+    data = secrets.token_bytes(8 * num_blocks)
+
+    expected = b"".join(
+        des.encrypt_block(data[i : i + 8]) for i in range(0, len(data), 8)
+    )
+    encrypted = des.encrypt_blocks(data)
+    assert encrypted == expected
+    assert des.decrypt_blocks(encrypted) == data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_type", [ExecutorType.THREAD, ExecutorType.PROCESS])
+@pytest.mark.parametrize("mode", [CipherMode.ECB, CipherMode.CBC, CipherMode.CTR])
+async def test_des_executor_types_match(executor_type, mode):
+    """Крупные куски блоков в пуле потоков/процессов дают тот же результат."""
+    key = secrets.token_bytes(8)
+    iv = secrets.token_bytes(4 if mode == CipherMode.CTR else 8)
+    data = secrets.token_bytes(8 * 5000 + 3)
+
+    reference = SymmetricCipherContext(DES(), key, mode, PaddingMode.PKCS7, iv, 1)
+    ctx = SymmetricCipherContext(
+        DES(), key, mode, PaddingMode.PKCS7, iv, 2, executor_type=executor_type
+    )
+    try:
+        encrypted = await ctx.encrypt_bytes(data)
+        assert encrypted == await reference.encrypt_bytes(data)
+        assert await ctx.decrypt_bytes(encrypted) == data
+    finally:
+        ctx._executor.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", list(CipherMode))
+async def test_des_encrypt_many_matches_single(mode):
+    """encrypt_many/decrypt_many дают то же, что поштучные encrypt/decrypt_bytes."""
+    key = secrets.token_bytes(8)
+    iv = None
+    if mode == CipherMode.CTR:
+        iv = secrets.token_bytes(4)
+    elif mode != CipherMode.ECB:
+        iv = secrets.token_bytes(8)
+    ctx = SymmetricCipherContext(DES(), key, mode, PaddingMode.PKCS7, iv, 1)
+    messages = [secrets.token_bytes(n) for n in (0, 1, 7, 8, 9, 40, 123, 3)]
+
+    encrypted = await ctx.encrypt_many(messages)
+    if mode != CipherMode.RANDOM_DELTA:
+        # при фиксированном IV результат детерминирован
+        assert encrypted == [await ctx.encrypt_bytes(m) for m in messages]
+    assert await ctx.decrypt_many(encrypted) == messages
+    assert [await ctx.decrypt_bytes(c) for c in encrypted] == messages
+    assert await ctx.encrypt_many([]) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_type", [ExecutorType.THREAD, ExecutorType.PROCESS])
+@pytest.mark.parametrize("lanes", [1, 3, 8])
+async def test_des_striped_cbc(executor_type, lanes):
+    """Полосы, зашифрованные в пуле, совпадают с L независимыми цепочками CBC."""
+    key = secrets.token_bytes(8)
+    iv = secrets.token_bytes(8)
+    data = secrets.token_bytes(8 * 5000 + 3)
+    ctx = SymmetricCipherContext(
+        DES(), key, CipherMode.STRIPED_CBC, PaddingMode.PKCS7, iv, 2, lanes,
+        executor_type=executor_type,
+    )
+    try:
+        encrypted = await ctx.encrypt_bytes(data)
+    finally:
+        ctx._executor.shutdown()
+
+    des = DES()
+    des.setup_keys(key)
+    master = int.from_bytes(iv, "big")
+    prev = [des.encrypt_block((master ^ l).to_bytes(8, "big")) for l in range(lanes)]
+    assert encrypted[:9] == bytes([lanes]) + iv
+    for i in (0, 1, lanes, 2500, 5000):
+        c = encrypted[9 + 8 * i : 17 + 8 * i]
+        chained = encrypted[9 + 8 * (i - lanes) : 17 + 8 * (i - lanes)] if i >= lanes else prev[i]
+        plain = bytes(a ^ b for a, b in zip(des.decrypt_block(c), chained))
+        assert plain == (data + bytes([5]) * 5)[8 * i : 8 * i + 8]
+
+    # расшифрование берет число полос из заголовка
+    reader = SymmetricCipherContext(DES(), key, CipherMode.STRIPED_CBC, max_workers=1)
+    assert await reader.decrypt_bytes(encrypted) == data
+
+
+def test_des_ofb_prefetched_file_matches_bytes():
+    """Файловый OFB с фоновым генератором потока совпадает с encrypt_bytes."""
+    key = secrets.token_bytes(8)
+    iv = secrets.token_bytes(8)
+    data = secrets.token_bytes(8 * 100 + 3)
+    ctx = SymmetricCipherContext(DES(), key, CipherMode.OFB, iv=iv)
+    mode = ctx._mode_instance
+    expected = mode.encrypt_bytes(data)
+
+    for chunk_size in (1, 13, 64, 4096):
+        out = io.BytesIO()
+        mode.encrypt_file(io.BytesIO(data), out, chunk_size)
+        assert out.getvalue() == expected
+        out = io.BytesIO()
+        mode.decrypt_file(io.BytesIO(expected), out, chunk_size)
+        assert out.getvalue() == data
+
+    def failing(state, count):
+        raise RuntimeError("cipher failure")
+
+    with KeystreamPrefetcher(failing, iv, chunk_blocks=4) as keystream:
+        with pytest.raises(RuntimeError):
+            keystream.take(8)
+
+
+@pytest.mark.asyncio
+async def test_des_random_delta_iv_sequence():
+    """Пакетный RANDOM_DELTA: C_i = E_K(P_i XOR (IV_0 + i * Delta mod 2^64))."""
+    key = secrets.token_bytes(8)
+    data = secrets.token_bytes(8 * 300)
+    ctx = SymmetricCipherContext(DES(), key, CipherMode.RANDOM_DELTA, max_workers=2)
+    encrypted = await ctx.encrypt_bytes(data)
+
+    des = DES()
+    des.setup_keys(key)
+    iv = int.from_bytes(encrypted[:8], "big")
+    delta = int.from_bytes(encrypted[8:16], "big")
+    for i in (0, 1, 150, 299):
+        block = des.decrypt_block(encrypted[16 + 8 * i : 24 + 8 * i])
+        iv_i = ((iv + i * delta) % (1 << 64)).to_bytes(8, "big")
+        assert bytes(a ^ b for a, b in zip(block, iv_i)) == data[8 * i : 8 * i + 8]
+    assert await ctx.decrypt_bytes(encrypted) == data
+
+
+@pytest.mark.asyncio
+async def test_des_ctr_reader_random_access():
+    """Произвольные диапазоны CTR-шифртекста расшифровываются без префикса."""
+    key = secrets.token_bytes(8)
+    data = secrets.token_bytes(8 * 700 + 5)
+    ctx = SymmetricCipherContext(DES(), key, CipherMode.CTR, iv=secrets.token_bytes(4))
+    encrypted = await ctx.encrypt_bytes(data)
+
+    reader = ctx._mode_instance.open_reader(io.BytesIO(encrypted), cache_blocks=64)
+    assert reader.size == len(data)
+    for offset, length in [(0, 1), (13, 100), (5597, 50), (8 * 300, 8), (77, 4096)]:
+        reader.seek(offset)
+        assert reader.read(length) == data[offset : offset + length]
+        assert reader.tell() == min(offset + length, len(data))
+
+    # повторное чтение - из кэша, ключевой поток не пересчитывается
+    reader.seek(13)
+    reader.read(100)
+    misses = reader.cache.misses
+    reader.seek(20)
+    assert reader.read(90) == data[20:110]
+    assert reader.cache.misses == misses
+
+    reader.seek(-5, io.SEEK_END)
+    buf = bytearray(16)
+    assert reader.readinto(buf) == 5 and bytes(buf[:5]) == data[-5:]
+    assert reader.read() == b""
+    reader.seek(100)
+    assert io.BufferedReader(reader).read() == data[100:]
+
+    with pytest.raises(ValueError):
+        reader.seek(-1)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "mode",
@@ -114,6 +349,7 @@ def test_des_raw_primitive():
         CipherMode.OFB,
         CipherMode.CTR,
         CipherMode.RANDOM_DELTA,
+        CipherMode.STRIPED_CBC,
     ],
 )
 @pytest.mark.parametrize(
@@ -164,7 +400,7 @@ async def test_des_memory_full_matrix(mode, padding):
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("mode", [CipherMode.CBC, CipherMode.CTR, CipherMode.RANDOM_DELTA, CipherMode.OFB])
+@pytest.mark.parametrize("mode", [CipherMode.CBC, CipherMode.CTR, CipherMode.RANDOM_DELTA, CipherMode.OFB, CipherMode.STRIPED_CBC])
 async def test_des_file_encryption_parametrized(clean_test_dirs, mode, user_files):
     """
     Параметризованный тест файлов для DES.
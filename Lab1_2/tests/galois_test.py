@@ -1,5 +1,8 @@
+import random
+import time
+
 import pytest
-from Lab1_2.services.galois_service import GField, ReducibleModulusError
+from Lab1_2.services.galois_service import GF256, GField, ReducibleModulusError
 
 
 
@@ -80,6 +83,38 @@ def test_multiply_bad_modulus():
     print("   ОК (Ошибка поймана)")
 
 
+def _shift_and_add_multiply(a: int, b: int, modulus: int) -> int:
+    res = 0
+    while b:
+        if b & 1:
+            res ^= a
+        a <<= 1
+        if a & 0x100:
+            a ^= modulus
+        b >>= 1
+    return res
+
+
+def test_field_tables_match_shift_and_add():
+    print("[FIELD] Таблицы log/exp против побитового умножения для всех модулей")
+    for mod in GField.get_all_irreducibles_deg8():
+        field = GField.field(mod)
+        assert field is GField.field(mod)
+        for a in range(0, 256, 7):
+            for b in range(256):
+                assert field.multiply(a, b) == _shift_and_add_multiply(a, b, mod)
+        for a in range(1, 256):
+            assert field.multiply(a, field.inverse(a)) == 1
+            assert field.pow(a, 254) == field.inverse(a)
+
+
+def test_field_bad_modulus():
+    with pytest.raises(ReducibleModulusError):
+        GField.field(0x11A)
+    with pytest.raises(ReducibleModulusError):
+        GF256(0x1B)
+
+
 def test_inverse_basic():
     mod = 0x11B
     print(f"[INV] Проверка обратных элементов (mod {mod:X})")
@@ -107,3 +142,108 @@ def test_factorize_composite():
 
     assert sorted(factors) == sorted([p1, p2])
 
+
+
+BULK_TYPES = [bytes, bytearray, memoryview, "numpy"]
+
+
+def _as_type(data: bytes, kind):
+    if kind == "numpy":
+        np = pytest.importorskip("numpy")
+        return np.frombuffer(data, dtype=np.uint8).copy()
+    return kind(data)
+
+
+@pytest.mark.parametrize("kind", BULK_TYPES)
+def test_bulk_ops_match_scalar(kind):
+    mod = 0x11D
+    a = bytes(range(256)) * 2
+    b = bytes(reversed(a))
+    nonzero = bytes(range(1, 256))
+
+    assert bytes(GField.add_bulk(_as_type(a, kind), _as_type(b, kind))) == bytes(
+        GField.add(x, y) for x, y in zip(a, b)
+    )
+    assert bytes(GField.add_bulk(_as_type(a, kind), 0x5A)) == bytes(
+        x ^ 0x5A for x in a
+    )
+    assert bytes(GField.multiply_bulk(_as_type(a, kind), _as_type(b, kind), mod)) == bytes(
+        GField.multiply(x, y, mod) for x, y in zip(a, b)
+    )
+    assert bytes(GField.multiply_bulk(0x8E, _as_type(a, kind), mod)) == bytes(
+        GField.multiply(0x8E, x, mod) for x in a
+    )
+    assert bytes(GField.inverse_bulk(_as_type(nonzero, kind), mod)) == bytes(
+        GField.inverse(x, mod) for x in nonzero
+    )
+    assert bytes(GField.pow_bulk(_as_type(a, kind), 7, mod)) == bytes(
+        GField._fast_pow(x, 7, mod) for x in a
+    )
+
+    with pytest.raises(ValueError):
+        GField.inverse_bulk(_as_type(a, kind), mod)
+    with pytest.raises(ValueError):
+        GField.add_bulk(_as_type(a, kind), _as_type(b[:-1], kind))
+
+
+@pytest.mark.parametrize("kind", BULK_TYPES)
+def test_matvec_bulk_matches_scalar(kind):
+    mod = 0x11B
+    matrix = [[0x02, 0x03, 0x01, 0x01], [0x01, 0x02, 0x03, 0x01]]
+    data = bytes(range(0, 256, 3))[:84]
+
+    expected = bytearray()
+    for v in range(0, len(data), 4):
+        for row in matrix:
+            acc = 0
+            for c, x in zip(row, data[v : v + 4]):
+                acc ^= GField.multiply(c, x, mod)
+            expected.append(acc)
+
+    assert bytes(GField.matvec_bulk(matrix, _as_type(data, kind), mod)) == expected
+    with pytest.raises(ValueError):
+        GField.matvec_bulk(matrix, _as_type(data[:-1], kind), mod)
+
+
+@pytest.mark.parametrize("degree,count", [(1, 2), (2, 1), (4, 3), (8, 30), (10, 99)])
+def test_irreducibles_count(degree, count):
+    # число неприводимых степени n над GF(2) известно (формула Гаусса)
+    assert len(list(GField.irreducibles(degree))) == count
+
+
+def test_find_irreducible_sparse():
+    assert GField.find_irreducible(8) == 0x11B
+    assert GField.find_irreducible(64) == (1 << 64) | 0x1B
+    assert GField.find_irreducible(128) == (1 << 128) | 0x87
+    assert GField.is_irreducible(GField.find_irreducible(127))
+
+
+def test_find_irreducible_large_degree_is_fast():
+    """Степени 128 и 256 находятся за доли секунды (раньше - секунды)."""
+    GField.find_irreducible.cache_clear()
+    t0 = time.perf_counter()
+    assert GField.find_irreducible(256) == (1 << 256) | 0x425
+    assert GField.find_irreducible(128) == (1 << 128) | 0x87
+    # запас на медленную машину: без быстрого возведения в квадрат - ~8 с
+    assert time.perf_counter() - t0 < 3.0
+    # x^256 + x^251 + ... - обратный к найденному, тоже неприводим
+    assert GField.is_irreducible(int(f"{(1 << 256) | 0x425:b}"[::-1], 2))
+    assert not GField.is_irreducible(GField._poly_mul_no_mod((1 << 128) | 0x87, 0b111))
+
+
+def test_factorize_random_products():
+    rnd = random.Random(2024)
+    for _ in range(100):
+        poly = rnd.getrandbits(rnd.randint(2, 90)) | 1
+        factors = GField.factorize(poly)
+        product = 1
+        for f in factors:
+            assert GField.is_irreducible(f)
+            product = GField._poly_mul_no_mod(product, f)
+        assert product == poly
+        assert factors == sorted(factors)
+
+    # кратные множители и множитель x
+    p = GField._poly_mul_no_mod(0b111, 0b111)
+    p = GField._poly_mul_no_mod(p, 0b1011) << 2
+    assert GField.factorize(p) == [0b10, 0b10, 0b111, 0b111, 0b1011]
@@ -1,5 +1,6 @@
 import asyncio
 import os
+import pickle
 import secrets
 import shutil
 import time
@@ -8,7 +9,20 @@ import pytest
 from itertools import product
 
 from Lab1_2.cipher_primitives.rijndael.rijndael_cipher import RijndaelCipher
-from Lab1_2.utility.modes import CipherMode, PaddingMode
+from Lab1_2.cipher_primitives.rijndael.rijndael_round_func import (
+    add_round_key,
+    mix_columns,
+    shift_rows,
+    sub_bytes,
+)
+from Lab1_2.cipher_primitives.rijndael import sbox as sbox_module
+from Lab1_2.cipher_primitives.rijndael.rijndael_numpy import NUMPY_AVAILABLE
+from Lab1_2.cipher_primitives.rijndael.rijndael_key_schedule import (
+    RIJNDAEL_KEY_CACHE,
+    RijndaelKeyScheduler,
+)
+from Lab1_2.cipher_primitives.rijndael.sbox import SBox
+from Lab1_2.utility.modes import CipherMode, ExecutorType, PaddingMode
 from Lab1_2.utility.symmetric_context import SymmetricCipherContext
 
 
@@ -103,6 +117,143 @@ def test_aes_raw_primitive(key_len, expected_name):
     assert plaintext != ciphertext
 
 
+def _reference_crypt(cipher: RijndaelCipher, block: bytes, inverse: bool) -> bytes:
+    """Пошаговый Rijndael на функциях раунда - эталон для табличного движка."""
+    rks = cipher.round_keys[::-1] if inverse else cipher.round_keys
+    state = bytearray(block)
+    add_round_key(state, rks[0])
+    for r in range(1, cipher.num_rounds + 1):
+        if inverse:
+            shift_rows(state, True)
+            sub_bytes(state, cipher.sbox, True)
+            add_round_key(state, rks[r])
+            if r != cipher.num_rounds:
+                mix_columns(state, cipher.mod_poly, True)
+        else:
+            sub_bytes(state, cipher.sbox, False)
+            shift_rows(state, False)
+            if r != cipher.num_rounds:
+                mix_columns(state, cipher.mod_poly, False)
+            add_round_key(state, rks[r])
+    return bytes(state)
+
+
+@pytest.mark.parametrize("mod_poly", [0x11B, 0x11D, 0x18D])
+@pytest.mark.parametrize("block_size", [16, 24, 32])
+@pytest.mark.parametrize("key_len", [16, 24, 32])
+def test_rijndael_tables_match_reference(mod_poly, block_size, key_len):
+    cipher = RijndaelCipher(block_size, key_len, mod_poly)
+    cipher.setup_keys(secrets.token_bytes(key_len))
+    blocks = [secrets.token_bytes(block_size) for _ in range(3)]
+
+    for block in blocks:
+        assert cipher.encrypt_block(block) == _reference_crypt(cipher, block, False)
+        assert cipher.decrypt_block(block) == _reference_crypt(cipher, block, True)
+
+    data = b"".join(blocks)
+    encrypted = cipher.encrypt_blocks(data)
+    assert encrypted == b"".join(cipher.encrypt_block(b) for b in blocks)
+    assert cipher.decrypt_blocks(encrypted) == data
+
+
+@pytest.mark.parametrize("backend", ["table", "numpy"])
+@pytest.mark.parametrize("mod_poly", [0x11B, 0x18D])
+@pytest.mark.parametrize("block_size", [16, 24, 32])
+@pytest.mark.parametrize("num_blocks", [0, 1, 16, 300])
+def test_rijndael_encrypt_blocks_backends(backend, mod_poly, block_size, num_blocks):
+    """Пакетные движки дают те же блоки, что и encrypt_block."""
+    if backend == "numpy" and not NUMPY_AVAILABLE:
+        pytest.skip("NumPy is not installed")
+    cipher = RijndaelCipher(block_size, 24, mod_poly, batch_backend=backend)
+    cipher.setup_keys(secrets.token_bytes(24))
+    data = secrets.token_bytes(block_size * num_blocks)
+
+    expected = b"".join(
+        cipher.encrypt_block(data[i : i + block_size])
+        for i in range(0, len(data), block_size)
+    )
+    encrypted = cipher.encrypt_blocks(data)
+    assert encrypted == expected
+    assert cipher.decrypt_blocks(encrypted) == data
+
+
+@pytest.mark.parametrize("block_size, key_len", [(16, 16), (24, 32), (32, 16)])
+def test_rijndael_key_schedule_cache_and_inverse_keys(block_size, key_len):
+    key = secrets.token_bytes(key_len)
+    keygen = RijndaelKeyScheduler(block_size, key_len, SBox.get(0x11D), 0x11D)
+    round_keys = keygen.expand_key(key)
+
+    before = RIJNDAEL_KEY_CACHE.stats()
+    assert keygen.expand_key(key) == round_keys
+    assert RIJNDAEL_KEY_CACHE.stats()["hits"] == before["hits"] + 1
+
+    inverse_keys = keygen.expand_inverse_key(key)
+    assert inverse_keys[0] == round_keys[0] and inverse_keys[-1] == round_keys[-1]
+    for rk, ik in zip(round_keys[1:-1], inverse_keys[1:-1]):
+        state = bytearray(rk)
+        mix_columns(state, 0x11D, True)
+        assert ik == state
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_type", [ExecutorType.THREAD, ExecutorType.PROCESS])
+@pytest.mark.parametrize("mode", [CipherMode.ECB, CipherMode.CBC, CipherMode.CTR])
+async def test_rijndael_executor_types_match(executor_type, mode):
+    """Примитив с ключами сериализуется в воркеры пула процессов."""
+    key = secrets.token_bytes(16)
+    iv = secrets.token_bytes(8 if mode == CipherMode.CTR else 16)
+    data = secrets.token_bytes(16 * 3000 + 5)
+
+    cipher = RijndaelCipher(16, 16)
+    cipher.setup_keys(key)
+    restored = pickle.loads(pickle.dumps(cipher))
+    assert restored.encrypt_block(data[:16]) == cipher.encrypt_block(data[:16])
+
+    reference = SymmetricCipherContext(
+        RijndaelCipher(16, 16), key, mode, PaddingMode.PKCS7, iv, 1
+    )
+    ctx = SymmetricCipherContext(
+        RijndaelCipher(16, 16), key, mode, PaddingMode.PKCS7, iv, 2,
+        executor_type=executor_type,
+    )
+    try:
+        encrypted = await ctx.encrypt_bytes(data)
+        assert encrypted == await reference.encrypt_bytes(data)
+        assert await ctx.decrypt_bytes(encrypted) == data
+    finally:
+        ctx._executor.shutdown()
+
+
+def test_sbox_registry_and_disk_cache(tmp_path):
+    assert SBox.get(0x11B) is SBox.get(0x11B)
+    assert SBox.get(0x11B).forward[0x53] == 0xED
+    assert bytes(range(256)).translate(SBox.get(0x11B).forward).translate(
+        SBox.get(0x11B).inverse
+    ) == bytes(range(256))
+
+    sbox_module.set_cache_dir(str(tmp_path))
+    try:
+        generated = SBox(0x11D)
+        cache_file = tmp_path / "sbox_11d.bin"
+        assert cache_file.read_bytes() == generated.forward + generated.inverse
+
+        loaded = SBox(0x11D)
+        assert (loaded.forward, loaded.inverse) == (generated.forward, generated.inverse)
+
+        # испорченный файл игнорируется и перезаписывается
+        cache_file.write_bytes(b"\0" * 512)
+        assert SBox(0x11D).forward == generated.forward
+        assert cache_file.read_bytes() == generated.forward + generated.inverse
+
+        # согласованная пара перестановок от другого модуля тоже отбрасывается
+        other = SBox.get(0x11B)
+        cache_file.write_bytes(other.forward + other.inverse)
+        assert SBox(0x11D).forward == generated.forward
+        assert cache_file.read_bytes() == generated.forward + generated.inverse
+    finally:
+        sbox_module.set_cache_dir(None)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("key_len", [16, 24, 32])
 @pytest.mark.parametrize(
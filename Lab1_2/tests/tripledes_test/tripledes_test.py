@@ -5,6 +5,8 @@ import shutil
 import time
 import pytest
 
+from Lab1_2.cipher_primitives.DES.des_cipher import DES
+from Lab1_2.cipher_primitives.DES.des_numpy import NUMPY_AVAILABLE
 from Lab1_2.cipher_primitives.DES.triple_des import TripleDES
 from Lab1_2.utility.modes import CipherMode, PaddingMode
 from Lab1_2.utility.symmetric_context import SymmetricCipherContext
@@ -107,6 +109,37 @@ def test_3des_raw_primitive(tdes_mode, key_bytes):
     assert plaintext != ciphertext
 
 
+@pytest.mark.parametrize("backend", ["bitslice", "numpy"])
+@pytest.mark.parametrize("tdes_mode", ["EDE", "EEE"])
+@pytest.mark.parametrize("key_len", [16, 24])
+def test_3des_fused_matches_des_cascade(backend, tdes_mode, key_len):
+    """Слитое ядро совпадает с каскадом из трех DES, пакетный путь - с поблочным."""
+    key = secrets.token_bytes(key_len)
+    k1, k2 = key[0:8], key[8:16]
+    k3 = key[16:24] if key_len == 24 else k1
+    des1, des2, des3 = DES(), DES(), DES()
+    des1.setup_keys(k1)
+    des2.setup_keys(k2)
+    des3.setup_keys(k3)
+
+    if backend == "numpy" and not NUMPY_AVAILABLE:
+        pytest.skip("NumPy is not installed")
+    tdes = TripleDES(mode=tdes_mode, batch_backend=backend)
+    tdes.setup_keys(key)
+
+    block = secrets.token_bytes(8)
+    middle = des2.decrypt_block if tdes_mode == "EDE" else des2.encrypt_block
+    expected = des3.encrypt_block(middle(des1.encrypt_block(block)))
+    assert tdes.encrypt_block(block) == expected
+
+    data = secrets.token_bytes(8 * 100)
+    encrypted = tdes.encrypt_blocks(data)
+    assert encrypted == b"".join(
+        tdes.encrypt_block(data[i : i + 8]) for i in range(0, len(data), 8)
+    )
+    assert tdes.decrypt_blocks(encrypted) == data
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("tdes_mode,key_len", [
     ("EDE", 16),
@@ -31,6 +31,87 @@ def bitperm(
     return result_integer.to_bytes(num_output_bytes, byteorder="big")
 
 
+class CompiledBitPerm:
+    """
+    Перестановка p_block, скомпилированная в таблицы: по одной 256-элементной
+    таблице на каждый входной байт, результат - OR найденных значений.
+    Дает тот же результат, что и bitperm(), но за input_size обращений к таблицам.
+    """
+
+    def __init__(
+        self,
+        p_block: list[int],
+        input_size: int,
+        msb_first: bool = True,
+        one_based_indexing: bool = True,
+    ):
+        total_bits = input_size * 8
+        num_output_bits = len(p_block)
+        self.input_size = input_size
+        self.output_size = (num_output_bits + 7) // 8
+        padding = self.output_size * 8 - num_output_bits
+
+        # bit_masks[src_idx] - биты результата, в которые попадает входной бит
+        bit_masks = [0] * total_bits
+        for out_pos, i in enumerate(p_block):
+            src_idx = i - 1 if one_based_indexing else i
+            if not (0 <= src_idx < total_bits):
+                raise IndexError(f"Index {src_idx} is out of range")
+            bit_masks[src_idx] |= 1 << (num_output_bits - 1 - out_pos + padding)
+
+        self._tables = []
+        for byte_idx in range(input_size):
+            masks = []
+            for bit_idx_in_byte in range(8):
+                shift = 7 - bit_idx_in_byte if msb_first else bit_idx_in_byte
+                masks.append((shift, bit_masks[byte_idx * 8 + bit_idx_in_byte]))
+
+            table = [0] * 256
+            for value in range(256):
+                out = 0
+                for shift, mask in masks:
+                    if (value >> shift) & 1:
+                        out |= mask
+                table[value] = out
+            self._tables.append(table)
+
+        # для apply_int: пропускаем байты, ни один бит которых не используется
+        self._int_tables = tuple(
+            ((input_size - 1 - byte_idx) * 8, table)
+            for byte_idx, table in enumerate(self._tables)
+            if any(table)
+        )
+
+    @property
+    def tables(self) -> list[list[int]]:
+        """Таблицы по входным байтам (старший байт первым)."""
+        return self._tables
+
+    def apply(self, data: bytes) -> bytes:
+        if len(data) != self.input_size:
+            raise ValueError(f"Data must be {self.input_size} bytes")
+        result = 0
+        for table, byte in zip(self._tables, data):
+            result |= table[byte]
+        return result.to_bytes(self.output_size, byteorder="big")
+
+    def apply_int(self, value: int) -> int:
+        """То же, что apply(), но вход и выход - big-endian целые."""
+        result = 0
+        for shift, table in self._int_tables:
+            result |= table[(value >> shift) & 0xFF]
+        return result
+
+
+def compile_bitperm(
+    p_block: list[int],
+    input_size: int,
+    msb_first: bool = True,
+    one_based_indexing: bool = True,
+) -> CompiledBitPerm:
+    return CompiledBitPerm(p_block, input_size, msb_first, one_based_indexing)
+
+
 data = b"\x07"  # 00000111
 p_block = [1, 7, 6, 5, 4, 3, 2, 1]
 
@@ -0,0 +1,107 @@
+"""
+Параллельная обработка независимых блоков (ECB, CTR, расшифрование CBC и т.п.).
+
+Буфер режется на крупные непрерывные куски, один кусок - одна задача
+encrypt_blocks/decrypt_blocks. Для пула процессов примитив с ключами
+передается воркеру один раз в initializer, задачи несут только данные.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from Lab1_2.utility.modes import ExecutorType
+
+# меньше этого число блоков в задаче не делаем: иначе накладные расходы
+# на передачу данных съедают выигрыш
+MIN_SPAN_BLOCKS = 1024
+
+# примитив, переданный воркеру процесса при старте
+_worker_primitive = None
+
+
+def _init_worker(primitive) -> None:
+    global _worker_primitive
+    _worker_primitive = primitive
+
+
+def _encrypt_span(data: bytes) -> bytes:
+    return _worker_primitive.encrypt_blocks(data)
+
+
+def _decrypt_span(data: bytes) -> bytes:
+    return _worker_primitive.decrypt_blocks(data)
+
+
+def _call_with_primitive(job):
+    func, task = job
+    return func(_worker_primitive, task)
+
+
+class BlockExecutor:
+    def __init__(
+        self,
+        primitive,
+        executor_type: ExecutorType = ExecutorType.THREAD,
+        max_workers: Optional[int] = None,
+        min_span_blocks: int = MIN_SPAN_BLOCKS,
+    ):
+        if min_span_blocks < 1:
+            raise ValueError("min_span_blocks must be positive")
+        self.primitive = primitive
+        self.executor_type = executor_type
+        self.min_span_bytes = min_span_blocks * primitive.block_size
+
+        if executor_type == ExecutorType.PROCESS:
+            self.max_workers = max_workers or os.cpu_count()
+            # spawn: fork из процесса с потоками (asyncio) может зависнуть
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(primitive,),
+            )
+            self._encrypt_span, self._decrypt_span = _encrypt_span, _decrypt_span
+        elif executor_type == ExecutorType.THREAD:
+            self.max_workers = max_workers or (os.cpu_count() * 2)
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._encrypt_span = primitive.encrypt_blocks
+            self._decrypt_span = primitive.decrypt_blocks
+        else:
+            raise ValueError(f"Unknown executor type: {executor_type}")
+
+    def encrypt_blocks(self, data: bytes) -> bytes:
+        return self._map(self._encrypt_span, self.primitive.encrypt_blocks, data)
+
+    def decrypt_blocks(self, data: bytes) -> bytes:
+        return self._map(self._decrypt_span, self.primitive.decrypt_blocks, data)
+
+    def map_tasks(self, func, tasks: list) -> list:
+        """
+        func(primitive, task) для каждой задачи в пуле (результаты по порядку).
+        Для пула процессов func должна быть функцией уровня модуля.
+        """
+        if self.max_workers == 1 or len(tasks) < 2:
+            return [func(self.primitive, task) for task in tasks]
+        if self.executor_type == ExecutorType.PROCESS:
+            return list(self._pool.map(_call_with_primitive, [(func, t) for t in tasks]))
+        return list(self._pool.map(lambda task: func(self.primitive, task), tasks))
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    def _map(self, span_func, local_func, data: bytes) -> bytes:
+        if len(data) % self.primitive.block_size != 0:
+            raise ValueError(
+                f"Data length must be a multiple of {self.primitive.block_size} bytes"
+            )
+        if self.max_workers == 1 or len(data) < 2 * self.min_span_bytes:
+            return local_func(data)
+
+        # по куску на воркера, но не мельче min_span_bytes
+        bs = self.primitive.block_size
+        span = -(-len(data) // self.max_workers)
+        span = max(self.min_span_bytes, -(-span // bs) * bs)
+        spans = [data[i : i + span] for i in range(0, len(data), span)]
+        return b"".join(self._pool.map(span_func, spans))
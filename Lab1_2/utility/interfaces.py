@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class IKeySchedule(ABC):
@@ -8,12 +9,55 @@ class IKeySchedule(ABC):
 
 
 class IRoundFunction(ABC):
+    # True - функция умеет работать с половинами блока как с целыми (apply_int)
+    int_native: bool = False
+    # True - функция умеет обрабатывать сразу много половин (apply_many)
+    batch_native: bool = False
+    # длина половины блока в байтах (нужна запасным apply_int/apply_many);
+    # если задана, FeistelCipher проверяет, что она совпадает с его блоком
+    half_size: Optional[int] = None
+
     @abstractmethod
     def apply(self, half_block: bytes, round_key: bytes) -> bytes:
         pass
 
+    def prepare_key(self, round_key: bytes):
+        """
+        Раундовый ключ в том виде, в котором его принимают apply_int/apply_many.
+        По умолчанию - как есть (годится для запасных реализаций через apply).
+        """
+        return round_key
+
+    def apply_int(self, half_block: int, round_key) -> int:
+        """F над половиной-целым; по умолчанию - через apply."""
+        size = self._require_half_size()
+        return int.from_bytes(
+            self.apply(half_block.to_bytes(size, "big"), round_key), "big"
+        )
+
+    def apply_many(self, half_blocks: bytes, round_key) -> bytes:
+        """
+        F над подряд идущими половинами блоков с одним ключом из prepare_key.
+        По умолчанию - apply по очереди для каждой половины.
+        """
+        size = self._require_half_size()
+        if len(half_blocks) % size != 0:
+            raise ValueError(f"Data length must be a multiple of {size} bytes")
+        view = memoryview(half_blocks)
+        return b"".join(
+            self.apply(bytes(view[i : i + size]), round_key)
+            for i in range(0, len(half_blocks), size)
+        )
+
+    def _require_half_size(self) -> int:
+        if self.half_size is None:
+            raise ValueError("half_size is not set for this round function")
+        return self.half_size
+
 
 class ISymmetricCipher(ABC):
+    block_size: int
+
     @abstractmethod
     def encrypt_block(self, block: bytes) -> bytes:
         pass
@@ -24,4 +68,21 @@ class ISymmetricCipher(ABC):
 
     @abstractmethod
     def setup_keys(self, key: bytes) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    def encrypt_blocks(self, data: bytes) -> bytes:
+        """
+        Шифрование подряд идущих независимых блоков (ECB без паддинга).
+        По умолчанию - поблочно; быстрые примитивы переопределяют.
+        """
+        return b"".join(map(self.encrypt_block, self._iter_blocks(data)))
+
+    def decrypt_blocks(self, data: bytes) -> bytes:
+        return b"".join(map(self.decrypt_block, self._iter_blocks(data)))
+
+    def _iter_blocks(self, data: bytes):
+        bs = self.block_size
+        if len(data) % bs != 0:
+            raise ValueError(f"Data length must be a multiple of {bs} bytes")
+        view = memoryview(data)
+        return (bytes(view[i : i + bs]) for i in range(0, len(data), bs))
@@ -9,10 +9,16 @@ class CipherMode(Enum):
     OFB = auto()
     CTR = auto()
     RANDOM_DELTA = auto()
+    STRIPED_CBC = auto()
 
 
 class PaddingMode(Enum):
     ZEROS = auto()
     ANSI_X923 = auto()
     PKCS7 = auto()
-    ISO_10126 = auto()
\ No newline at end of file
+    ISO_10126 = auto()
+
+
+class ExecutorType(Enum):
+    THREAD = auto()
+    PROCESS = auto()
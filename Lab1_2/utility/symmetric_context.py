@@ -1,16 +1,16 @@
 import asyncio
-import os
 import threading
-from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from Lab1_2.utility.modes import PaddingMode, CipherMode
+from Lab1_2.utility.block_executor import BlockExecutor
+from Lab1_2.utility.modes import PaddingMode, CipherMode, ExecutorType
 from Lab1_2.cipher_modes.ecb_mode import ECBMode
 from Lab1_2.cipher_modes.cbc_mode import CBCMode
 from Lab1_2.cipher_modes.pcbc_mode import PCBCMode
 from Lab1_2.cipher_modes.cfb_mode import CFBMode
 from Lab1_2.cipher_modes.ofb_mode import OFBMode
-from Lab1_2.cipher_modes.ctr_mode import CTRMode
+from Lab1_2.cipher_modes.ctr_mode import CTRMode, CTRReader, DEFAULT_READER_CACHE_BLOCKS
 from Lab1_2.cipher_modes.random_delta_mode import RandomDeltaMode
+from Lab1_2.cipher_modes.striped_cbc_mode import StripedCBCMode
 
 
 class SymmetricCipherContext:
@@ -22,6 +22,7 @@ class SymmetricCipherContext:
         CipherMode.OFB: OFBMode,
         CipherMode.CTR: CTRMode,
         CipherMode.RANDOM_DELTA: RandomDeltaMode,
+        CipherMode.STRIPED_CBC: StripedCBCMode,
     }
 
     def __init__(
@@ -33,6 +34,7 @@ class SymmetricCipherContext:
         iv: Optional[bytes] = None,
         max_workers: Optional[int] = None,
         *mode_args,
+        executor_type: ExecutorType = ExecutorType.THREAD,
     ):
 
         self.primitive = primitive
@@ -50,8 +52,9 @@ class SymmetricCipherContext:
         if hasattr(self.primitive, "setup_keys"):
             self.primitive.setup_keys(key)
 
-        self._executor = ThreadPoolExecutor(
-            max_workers=max_workers or (os.cpu_count() * 2)
+        # PROCESS - пул процессов в обход GIL; примитив уже с ключами
+        self._executor = BlockExecutor(
+            self.primitive, executor_type=executor_type, max_workers=max_workers
         )
 
         self._validate_iv()
@@ -68,6 +71,7 @@ class SymmetricCipherContext:
             padding=self.padding,
             iv=self.iv,
             executor=self._executor,
+            mode_args=self.mode_args,
         )
 
     def _validate_iv(self):
@@ -78,6 +82,7 @@ class SymmetricCipherContext:
             CipherMode.PCBC,
             CipherMode.CFB,
             CipherMode.OFB,
+            CipherMode.STRIPED_CBC,
         ):
             if len(self.iv) != self.block_size:
                 raise ValueError(
@@ -107,6 +112,19 @@ class SymmetricCipherContext:
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self._mode_instance.decrypt_bytes, data)
 
+    async def encrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        """Много независимых сообщений за один переход в executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._mode_instance.encrypt_many, list(messages)
+        )
+
+    async def decrypt_many(self, messages: list[bytes]) -> list[bytes]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._mode_instance.decrypt_many, list(messages)
+        )
+
     async def encrypt_file(
         self, input_path: str, output_path: str, chunk_size: int = 1024 * 1024
     ) -> None:
@@ -125,6 +143,19 @@ class SymmetricCipherContext:
         )
         print(f"File decrypted successfully: {input_path} -> {output_path}")
 
+    def open_reader(
+        self, input_path: str, cache_blocks: int = DEFAULT_READER_CACHE_BLOCKS
+    ) -> CTRReader:
+        """Файл, зашифрованный в CTR, как поток с seek (только для CTR)."""
+        if self.mode != CipherMode.CTR:
+            raise ValueError("Random-access reading is supported only in CTR mode")
+        fin = open(input_path, "rb")
+        try:
+            return self._mode_instance.open_reader(fin, cache_blocks, closefd=True)
+        except Exception:
+            fin.close()
+            raise
+
     def _encrypt_file_sync(
         self, input_path: str, output_path: str, chunk_size: int
     ) -> None:
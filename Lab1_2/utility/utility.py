@@ -41,7 +41,11 @@ def unpad(data: bytes, block_size: int, padding: PaddingMode) -> bytes:
 
 
 def xor_bytes(a: bytes, b: bytes) -> bytes:
-    return bytes(x ^ y for x, y in zip(a, b))
+    # XOR целых вместо побайтового генератора: одна операция на весь буфер
+    n = min(len(a), len(b))
+    return (int.from_bytes(a[:n], "big") ^ int.from_bytes(b[:n], "big")).to_bytes(
+        n, "big"
+    )
 
 
 def split_blocks(data: bytes, block_size: int) -> list: